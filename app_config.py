@@ -1,12 +1,12 @@
 # FILE: app_config.py
 # PURPOSE: Centraliza o gerenciamento de configurações, caminhos e variáveis.
 
-import gc
 import os
 import json
 import platform
 import threading
 from utils.constants import *
+from utils import memory_manager, translations
 
 class AppConfig:
     _DEFAULT_VALUES = {
@@ -56,6 +56,8 @@ class AppConfig:
         CONF_START_WEB_SERVER_ON_LAUNCH: False,
         CONF_UPDATE_APPS_ON_STARTUP: True,
         CONF_FORCE_ADB_FORWARD: False,
+        CONF_WARM_STANDBY: False,
+        CONF_AUTO_RESTART: False,
         CONF_WEB_HOVER_EFFECT: True,
         CONF_QUICK_ACCESS_FACTOR: 1.0,
         CONF_QUICK_ACCESS_VISIBLE: False,
@@ -71,32 +73,8 @@ class AppConfig:
         return list(cls._DEFAULT_VALUES.keys())
 
     def tr(self, section, item, **kwargs):
-        """Returns the translated string for the given section and item."""
-        lang = self.get(CONF_LANGUAGE, 'en')
-        try:
-            # Handle nested translations if 'key' is provided in kwargs
-            sub_key = kwargs.pop('key', None)
-            if sub_key:
-                text = TRANSLATIONS[lang][section][item][sub_key]
-            else:
-                text = TRANSLATIONS[lang][section][item]
-
-            if kwargs:
-                return text.format(**kwargs)
-            return text
-        except (KeyError, AttributeError):
-            # Fallback to English if key is missing in the current language or language is invalid
-            try:
-                if sub_key:
-                    text = TRANSLATIONS['en'][section][item][sub_key]
-                else:
-                    text = TRANSLATIONS['en'][section][item]
-
-                if kwargs:
-                    return text.format(**kwargs)
-                return text
-            except KeyError:
-                return f"[{section}.{item}{'.' + sub_key if sub_key else ''}]"
+        """Returns the translated string for the given section and item (English when missing)."""
+        return translations.translate(self.get(CONF_LANGUAGE, 'en'), section, item, **kwargs)
 
     def __init__(self, device_id):
         self.config_data = {}
@@ -321,6 +299,13 @@ class AppConfig:
             self.config_data[CONF_APP_LIST_CACHE] = apps
             self._save_json(self.config_data, self.CONFIG_FILE)
 
+    def get_winlator_shortcut_record(self, shortcut_path):
+        """Returns the cached scan record (pkg, mtime, parsed .desktop fields) for a shortcut, or None."""
+        for record in self.get_app_list_cache().get('winlator_games', []):
+            if record.get('path') == shortcut_path:
+                return record
+        return None
+
     def get_winlator_game_config(self, game_path):
         return self.config_data.get(CONF_WINLATOR_GAME_CONFIGS, {}).get(game_path, {})
 
@@ -445,6 +430,6 @@ class AppConfig:
         cached_winlator = self.config_data.get(CONF_WINLATOR_GAME_CONFIGS, {})
         self.device_app_cache['winlator_shortcuts'] = set(cached_winlator.keys())
 
-        gc.collect()
+        memory_manager.request_cleanup('device_config')
         # Load the global profile for the device by default
         self.load_profile('global')
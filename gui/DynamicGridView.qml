@@ -67,112 +67,198 @@ Rectangle {
     signal quickAccessVisibilityChanged(bool visible)
     signal qaLaunchRequested(var itemKey, var itemName, var itemType)
 
-    // --- Internal Models ---
-    property alias qmlInternalModel: internalModel
-    ListModel { id: internalModel }
-    ListModel { id: internalQuickAccessModel }
-
     // Quick access sizing
     readonly property int qaIconSize: Math.max(32, itemIconSize - 4)
     readonly property int qaItemSize: qaIconSize + 16
 
-    property var itemsModel: []
-    property var quickAccessModel: []
+    // --- Models (GridItemModel instances from Python, which diffs every update) ---
+    // The Quick Access bar uses the app-wide `quickAccessItems` context property instead.
+    property var gridModel: null
     property var folderList: []
 
-    onItemsModelChanged: syncModel(itemsModel, internalModel, "app_")
-    onQuickAccessModelChanged: syncModel(quickAccessModel, internalQuickAccessModel, "qa_")
+    // --- Grid Rows (virtualization) ---
+    // The ListView below instantiates rows, not items: a row is either a section header or up to
+    // `columns` visible items, so only the rows in the viewport (plus cacheBuffer) exist at a time.
+    readonly property int columns: Math.max(1, Math.floor(gridList.width / totalItemWidth))
+    readonly property int separatorHeight: 60
+    property var visibleIndices: []   // gridModel rows of the shown (non-hidden) items, in order
+    property int modelRevision: 0     // bumped after a structural rebuild so every live cell re-reads its entry
+    property var layoutRoles: []      // roles whose changes move items between rows (isSeparator, isHidden)
+    ListModel { id: rowModel }
+
+    // Emitted for rows whose data changed in place; only the live cells showing them re-read their entry
+    signal itemsChanged(int first, int last)
+
+    onColumnsChanged: scheduleRowRebuild(false)
+
+    onGridModelChanged: {
+        layoutRoles = gridModel ? gridModel.layoutRoles() : [];
+        scheduleRowRebuild(true);
+    }
+
+    // A model update arrives as a burst of row operations: coalesce them into one row rebuild per
+    // event-loop turn. Inserts, removals, moves and resets shift what each index holds, so the cells
+    // re-read everything; a dataChanged only re-reads its own rows, and rebuilds the rows only when
+    // it shows or hides items.
+    Connections {
+        target: gridRoot.gridModel
+        function onDataChanged(topLeft, bottomRight, roles) {
+            if (gridRoot.changesLayout(roles)) gridRoot.scheduleRowRebuild(false);
+            gridRoot.itemsChanged(topLeft.row, bottomRight.row);
+        }
+        function onRowsInserted() { gridRoot.scheduleRowRebuild(true) }
+        function onRowsRemoved() { gridRoot.scheduleRowRebuild(true) }
+        function onRowsMoved() { gridRoot.scheduleRowRebuild(true) }
+        function onModelReset() { gridRoot.scheduleRowRebuild(true) }
+    }
 
-    function syncModel(sourceData, targetModel, prefix) {
-        if (!sourceData || sourceData.length === 0) {
-            targetModel.clear();
-            return;
+    function changesLayout(roles) {
+        if (!roles || roles.length === 0) return true;  // no roles means every role changed
+        for (var i = 0; i < roles.length; i++) {
+            if (layoutRoles.indexOf(roles[i]) !== -1) return true;
         }
+        return false;
+    }
 
-        var allRoles = {
-            "key": "", "name": "", "icon_path": "", "item_type": "",
-            "pinned": "", "isSeparator": false, "isHidden": false,
-            "isCollapsed": false, "sectionId": "", "text": "",
-            "ownerModel": null, "is_launcher_shortcut": false
+    property bool rowRebuildPending: false
+    property bool rereadPending: false
+    function scheduleRowRebuild(reread) {
+        if (reread) rereadPending = true;
+        if (rowRebuildPending) return;
+        rowRebuildPending = true;
+        Qt.callLater(rebuildRows);
+    }
+
+    function itemAt(modelIndex) {
+        var entry = gridModel ? gridModel.get(modelIndex) : null;
+        return {
+            "key": entry && entry.key ? entry.key : "",
+            "name": entry && entry.name ? entry.name : "",
+            "icon_path": entry && entry.icon_path ? entry.icon_path : "",
+            "item_type": entry && entry.item_type ? entry.item_type : "",
+            "pinned": entry && entry.pinned ? entry.pinned : "",
+            "isSeparator": !!(entry && entry.isSeparator),
+            "isHidden": !!(entry && entry.isHidden),
+            "isCollapsed": !!(entry && entry.isCollapsed),
+            "sectionId": entry && entry.sectionId ? entry.sectionId : "",
+            "text": entry && entry.text ? entry.text : "",
+            "is_launcher_shortcut": !!(entry && entry.is_launcher_shortcut)
         };
+    }
 
-        var oldItemsMap = {};
-        for (var i = 0; i < targetModel.count; i++) {
-            var item = targetModel.get(i);
-            var id = item.isSeparator ? ("sep_" + item.sectionId) : (prefix + item.key);
-            oldItemsMap[id] = i;
+    // Takes the row layout from the model and updates rowModel in place so existing row delegates are kept
+    function rebuildRows() {
+        rowRebuildPending = false;
+        var layout = gridModel ? gridModel.rowLayout(columns) : { "rows": [], "indices": [] };
+        var rows = layout.rows;
+        visibleIndices = layout.indices;
+        if (rereadPending) {
+            rereadPending = false;
+            modelRevision++;
         }
 
-        for (var j = 0; j < sourceData.length; j++) {
-            var newItem = sourceData[j];
-            var newId = newItem.isSeparator ? ("sep_" + newItem.sectionId) : (prefix + newItem.key);
-            var fullItem = Object.assign({}, allRoles, newItem);
-            fullItem.ownerModel = targetModel;
-
-            if (oldItemsMap.hasOwnProperty(newId)) {
-                var oldIdx = oldItemsMap[newId];
-                if (oldIdx !== j) {
-                    targetModel.move(oldIdx, j, 1);
-                    for (var key in oldItemsMap) {
-                        var idx = oldItemsMap[key];
-                        if (oldIdx < j) { if (idx > oldIdx && idx <= j) oldItemsMap[key]--; }
-                        else { if (idx >= j && idx < oldIdx) oldItemsMap[key]++; }
-                    }
-                    oldItemsMap[newId] = j;
+        var shared = Math.min(rows.length, rowModel.count);
+        for (var r = 0; r < shared; r++) {
+            var old = rowModel.get(r);
+            for (var prop in rows[r]) {
+                if (old[prop] !== rows[r][prop]) rowModel.setProperty(r, prop, rows[r][prop]);
+            }
+        }
+        if (rowModel.count > rows.length) rowModel.remove(rows.length, rowModel.count - rows.length);
+        for (var n = shared; n < rows.length; n++) rowModel.append(rows[n]);
+    }
+
+    function toggleSection(separatorIndex) {
+        var separator = itemAt(separatorIndex);
+        var collapsed = gridModel.toggleSection(separatorIndex);
+        gridRoot.sectionToggled(separator.sectionId || separator.text, collapsed);
+    }
+
+    // --- Section Header Delegate ---
+    Component {
+        id: sectionHeaderDelegate
+        Rectangle {
+            id: headerItem
+            property int modelIndex: -1
+            property int revision: 0
+            readonly property var itemData: { gridRoot.modelRevision; revision; return gridRoot.itemAt(modelIndex) }
+
+            Connections {
+                target: gridRoot
+                function onItemsChanged(first, last) {
+                    if (headerItem.modelIndex >= first && headerItem.modelIndex <= last) headerItem.revision++;
                 }
-                var currentItem = targetModel.get(j);
-                for (var prop in fullItem) {
-                    if (fullItem[prop] !== currentItem[prop]) {
-                        targetModel.setProperty(j, prop, fullItem[prop]);
-                    }
+            }
+            color: gridRoot.backgroundColor
+
+            RowLayout {
+                anchors.fill: parent
+                anchors.leftMargin: 10
+                anchors.rightMargin: 20
+                spacing: 10
+
+                Text {
+                    text: headerItem.itemData.text || ""
+                    Layout.fillWidth: true
+                    font.pointSize: 11
+                    color: gridRoot.textColor
+                    verticalAlignment: Text.AlignVCenter
                 }
-                delete oldItemsMap[newId];
-            } else {
-                targetModel.insert(j, fullItem);
-                for (var keyAdd in oldItemsMap) {
-                    if (oldItemsMap[keyAdd] >= j) oldItemsMap[keyAdd]++;
+
+                Button {
+                    Layout.preferredWidth: 26
+                    Layout.preferredHeight: 26
+                    text: headerItem.itemData.isCollapsed ? "+" : "-"
+                    font.pixelSize: 18
+                    flat: true
+                    contentItem: Text {
+                        text: parent.text
+                        font: parent.font
+                        color: gridRoot.textColor
+                        horizontalAlignment: Text.AlignHCenter
+                        verticalAlignment: Text.AlignVCenter
+                    }
+                    background: Rectangle {
+                        color: parent.down ? gridRoot.buttonPressedColor : "transparent"
+                        radius: 13
+                        border.color: parent.hovered ? gridRoot.buttonBorderColor : "transparent"
+                        border.width: 1
+                    }
+                    onClicked: gridRoot.toggleSection(headerItem.modelIndex)
                 }
             }
-        }
 
-        var toRemove = [];
-        for (var keyRem in oldItemsMap) toRemove.push(oldItemsMap[keyRem]);
-        toRemove.sort(function(a, b) { return b - a; });
-        for (var k = 0; k < toRemove.length; k++) targetModel.remove(toRemove[k]);
+            Rectangle {
+                anchors.bottom: parent.bottom
+                anchors.left: parent.left
+                width: parent.width * 0.4
+                height: 1
+                color: gridRoot.buttonBorderColor
+                anchors.bottomMargin: 15
+            }
+        }
     }
 
-    // --- Delegate ---
+    // --- Item Delegate ---
     Component {
         id: gridItemDelegate
         Item {
             id: delegateItem
-            readonly property real effectiveFactor: (typeof model.ownerModel !== "undefined" && model.ownerModel === internalQuickAccessModel) ? gridRoot.quickAccessFactor : 1.0
-            
-            readonly property var itemData: ({
-                "key": (typeof model.key !== "undefined") ? model.key : "",
-                "name": (typeof model.name !== "undefined") ? model.name : "",
-                "icon_path": (typeof model.icon_path !== "undefined") ? model.icon_path : "",
-                "item_type": (typeof model.item_type !== "undefined") ? model.item_type : "",
-                "pinned": (typeof model.pinned !== "undefined") ? model.pinned : "",
-                "isSeparator": (typeof model.isSeparator !== "undefined") ? model.isSeparator : false,
-                "isHidden": (typeof model.isHidden !== "undefined") ? model.isHidden : false,
-                "isCollapsed": (typeof model.isCollapsed !== "undefined") ? model.isCollapsed : false,
-                "sectionId": (typeof model.sectionId !== "undefined") ? model.sectionId : "",
-                "text": (typeof model.text !== "undefined") ? model.text : "",
-                "ownerModel": (typeof model.ownerModel !== "undefined") ? model.ownerModel : null,
-                "is_launcher_shortcut": (typeof model.is_launcher_shortcut !== "undefined") ? model.is_launcher_shortcut : false
-            })
-            property bool isActuallyHidden: !!(itemData && itemData.isHidden)
+            property int modelIndex: -1
+            property int revision: 0
+            readonly property var itemData: { gridRoot.modelRevision; revision; return gridRoot.itemAt(modelIndex) }
+
+            Connections {
+                target: gridRoot
+                function onItemsChanged(first, last) {
+                    if (delegateItem.modelIndex >= first && delegateItem.modelIndex <= last) delegateItem.revision++;
+                }
+            }
 
-            visible: !!(itemData) && (!isActuallyHidden || opacity > 0)
-            width: (itemData && itemData.isSeparator) ? parent.width : (gridRoot.totalItemWidth * (0.7 + 0.3 * effectiveFactor))
-            height: isActuallyHidden ? 0 : ((itemData && itemData.isSeparator) ? 60 : (gridRoot.minQuickAccessHeight + (gridRoot.totalItemHeight - gridRoot.minQuickAccessHeight) * effectiveFactor))
-            opacity: isActuallyHidden ? 0.0 : 1.0
+            width: gridRoot.totalItemWidth
+            height: gridRoot.totalItemHeight
             clip: false
 
-            Behavior on height { NumberAnimation { duration: 250; easing.type: Easing.InOutQuad } }
-            Behavior on opacity { NumberAnimation { duration: 250; easing.type: Easing.InOutQuad } }
-
             // Hover/Click Feedback
             Rectangle {
                 id: highlightRect
@@ -180,97 +266,215 @@ Rectangle {
                 width: parent.width - 4
                 height: parent.height - 4
                 color: mouseArea.pressed ? Qt.lighter(gridRoot.highlightColor, 1.4) : gridRoot.highlightColor
-                opacity: (mouseArea.pressed && !itemData.isSeparator) ? 0.4 : (mouseArea.containsMouse && !itemData.isSeparator ? 0.15 : 0)
-                radius: 12 * (0.7 + 0.3 * effectiveFactor)
-                visible: !!(itemData && !itemData.isSeparator) && gridRoot.hoverEffectEnabled
+                opacity: mouseArea.pressed ? 0.4 : (mouseArea.containsMouse ? 0.15 : 0)
+                radius: 12
+                visible: gridRoot.hoverEffectEnabled
                 Behavior on opacity { NumberAnimation { duration: 150 } }
                 Behavior on color { ColorAnimation { duration: 100 } }
             }
 
-            // --- Separator Content ---
-            Rectangle {
-                visible: !!(itemData && itemData.isSeparator)
-                anchors.fill: parent
-                color: gridRoot.backgroundColor
+            // --- App/Game Item Content ---
+            Column {
+                id: contentColumn
+                anchors.centerIn: parent
+                width: parent.width - 10
+                spacing: 8
 
-                RowLayout {
-                    anchors.fill: parent
-                    anchors.leftMargin: 10
-                    anchors.rightMargin: 20
-                    spacing: 10
+                Item {
+                    id: iconRoot
+                    anchors.horizontalCenter: parent.horizontalCenter
+                    width: gridRoot.itemIconSize
+                    height: width
 
-                    Text {
-                        text: (itemData && itemData.text) ? itemData.text : ""
-                        Layout.fillWidth: true
-                        font.pointSize: 11
-                        color: gridRoot.textColor
-                        verticalAlignment: Text.AlignVCenter
-                    }
+                    Rectangle {
+                        anchors.fill: parent
+                        radius: 8
+                        color: "transparent"
+                        clip: true
 
-                    Button {
-                        Layout.preferredWidth: 26
-                        Layout.preferredHeight: 26
-                        text: (itemData && itemData.isCollapsed) ? "+" : "-"
-                        font.pixelSize: 18
-                        flat: true
-                        contentItem: Text {
-                            text: parent.text
-                            font: parent.font
-                            color: gridRoot.textColor
-                            horizontalAlignment: Text.AlignHCenter
-                            verticalAlignment: Text.AlignVCenter
-                        }
-                        background: Rectangle {
-                            color: parent.down ? gridRoot.buttonPressedColor : "transparent"
-                            radius: 13
-                            border.color: parent.hovered ? gridRoot.buttonBorderColor : "transparent"
-                            border.width: 1
+                        Image {
+                            id: iconImage
+                            anchors.fill: parent
+                            sourceSize: Qt.size(gridRoot.itemIconSize * 2, gridRoot.itemIconSize * 2)
+                            source: (itemData && itemData.icon_path)
+                                    ? itemData.icon_path + "?" + (gridRoot.iconMipmaps ? "hq" : "sd")
+                                    : "placeholder.png"
+                            fillMode: Image.PreserveAspectFit
+                            antialiasing: gridRoot.iconAntiAliasing
+                            smooth: gridRoot.iconSmoothing
+                            mipmap: gridRoot.iconMipmaps
+                            asynchronous: true
+                            cache: true
+                            opacity: status === Image.Ready ? 1 : 0
+                            Behavior on opacity { NumberAnimation { duration: 300 } }
                         }
-                        onClicked: {
-                            var collapsed = !itemData.isCollapsed
-                            var sectionId = itemData.sectionId || itemData.text
-                            var targetModel = (typeof model.ownerModel !== "undefined" && model.ownerModel) ? model.ownerModel : internalModel
-                            targetModel.setProperty(index, "isCollapsed", collapsed)
-                            for (var i = index + 1; i < targetModel.count; i++) {
-                                if (targetModel.get(i).isSeparator === true) break;
-                                targetModel.setProperty(i, "isHidden", collapsed)
-                            }
-                            gridRoot.sectionToggled(sectionId, collapsed)
+                    }
+                }
+
+                Text {
+                    id: nameLabel
+                    text: (itemData ? itemData.name : "") || ""
+                    font.pointSize: gridRoot.itemFontSize
+                    wrapMode: Text.WordWrap
+                    horizontalAlignment: Text.AlignHCenter
+                    width: parent.width
+                    color: gridRoot.textColor
+                }
+            }
+
+            // --- Input Handlers ---
+            MouseArea {
+                id: mouseArea
+                anchors.fill: parent
+                hoverEnabled: true
+                cursorShape: Qt.PointingHandCursor
+                acceptedButtons: Qt.LeftButton | Qt.RightButton
+
+                onClicked: function(mouse) {
+                    if (!itemData.key) return;
+                    if (mouse.button === Qt.RightButton) {
+                        gridRoot.openContextMenu(itemData);
+                    } else {
+                        if (itemData.is_launcher_shortcut) {
+                            gridRoot.launchLauncherRequested();
+                        } else {
+                            gridRoot.launchRequested(itemData.key, itemData.name);
                         }
                     }
                 }
+            }
 
-                Rectangle {
-                    anchors.bottom: parent.bottom
-                    anchors.left: parent.left
-                    width: parent.width * 0.4
-                    height: 1
-                    color: gridRoot.buttonBorderColor
-                    anchors.bottomMargin: 15
+            DropArea {
+                id: dropArea
+                anchors.fill: parent
+                onDropped: function(drop) {
+                    if (itemData.key && drop.hasUrls) {
+                        gridRoot.iconDropped(itemData.key, drop.urls[0].toString())
+                        drop.acceptProposedAction()
+                    }
                 }
             }
+        }
+    }
+
+    // --- Item Context Menu ---
+    // One Menu for the whole grid, created on the first right-click and fed the clicked item,
+    // instead of a Menu (and a folder Repeater bound to folderList) inside every delegate.
+    property var itemContextMenu: null
+
+    function openContextMenu(data) {
+        if (!itemContextMenu) itemContextMenu = itemContextMenuComponent.createObject(gridRoot);
+        itemContextMenu.itemData = data;
+        itemContextMenu.popup();
+    }
+
+    Component {
+        id: itemContextMenuComponent
+        Menu {
+            id: contextMenu
+            property var itemData: ({})
+            // Toggling the check breaks its binding, so restore it for each item the menu is opened on
+            onItemDataChanged: quickAccessMenuItem.checked = Qt.binding(function() {
+                return (itemData && itemData.pinned) ? (String(itemData.pinned).indexOf("qqs") !== -1) : false
+            })
+            modal: true
+            dim: false
+            background: Rectangle {
+                implicitWidth: 150
+                color: gridRoot.backgroundColor
+                border.color: gridRoot.buttonBorderColor
+                radius: 10
+            }
+            onAboutToShow: moveSubMenu.close()
 
-            // --- Context Menu ---
+            MenuItem {
+                text: gridRoot.settingsText
+                contentItem: Text {
+                    text: parent.text
+                    font: parent.font
+                    color: gridRoot.textColor
+                    verticalAlignment: Text.AlignVCenter
+                    leftPadding: 10
+                }
+                background: Rectangle {
+                    implicitHeight: 28
+                    color: parent.hovered ? Qt.rgba(gridRoot.highlightColor.r, gridRoot.highlightColor.g, gridRoot.highlightColor.b, 0.25) : "transparent"
+                    radius: 4
+                }
+                onTriggered: {
+                    if (itemData) gridRoot.settingsRequested(itemData.key, itemData.item_type)
+                    contextMenu.close()
+                }
+            }
+            MenuItem {
+                text: gridRoot.deleteConfigText
+                contentItem: Text {
+                    text: parent.text
+                    font: parent.font
+                    color: gridRoot.textColor
+                    verticalAlignment: Text.AlignVCenter
+                    leftPadding: 10
+                }
+                background: Rectangle {
+                    implicitHeight: 28
+                    color: parent.hovered ? Qt.rgba(gridRoot.highlightColor.r, gridRoot.highlightColor.g, gridRoot.highlightColor.b, 0.25) : "transparent"
+                    radius: 4
+                }
+                onTriggered: {
+                    if (itemData) gridRoot.deleteConfigRequested(itemData.key, itemData.item_type)
+                    contextMenu.close()
+                }
+            }
+            MenuSeparator { visible: !itemData.is_launcher_shortcut }
             Menu {
-                id: contextMenu
-                modal: true
-                dim: false
+                id: moveSubMenu
+                title: gridRoot.moveToText
+                visible: !itemData.is_launcher_shortcut
                 background: Rectangle {
                     implicitWidth: 150
                     color: gridRoot.backgroundColor
                     border.color: gridRoot.buttonBorderColor
                     radius: 10
                 }
-                onAboutToShow: moveSubMenu.close()
+
+                property bool hasAllApps: (itemData && itemData.pinned !== undefined) ? (itemData.pinned !== "") : false
+                property var filteredFolders: {
+                    if (!itemData || itemData.pinned === undefined || !gridRoot.folderList) return [];
+                    return gridRoot.folderList.filter(function(f) {
+                        var pinnedStr = String(itemData.pinned || "")
+                        var parts = pinnedStr.split(',').map(function(s) { return s.trim() })
+                        return parts.indexOf(f) === -1
+                    })
+                }
 
                 MenuItem {
-                    text: gridRoot.settingsText
+                    id: quickAccessMenuItem
+                    text: gridRoot.quickAccessText
+                    checkable: true
+                    checked: (itemData && itemData.pinned) ? (String(itemData.pinned).indexOf("qqs") !== -1) : false
+                    indicator: Rectangle {
+                        implicitWidth: 18
+                        implicitHeight: 18
+                        x: 10
+                        anchors.verticalCenter: parent.verticalCenter
+                        radius: 4
+                        border.color: parent.checked ? gridRoot.highlightColor : gridRoot.buttonBorderColor
+                        border.width: 1
+                        color: "transparent"
+                        Rectangle {
+                            anchors.fill: parent
+                            anchors.margins: 3
+                            radius: 2
+                            visible: parent.parent.checked
+                            color: gridRoot.highlightColor
+                        }
+                    }
                     contentItem: Text {
                         text: parent.text
                         font: parent.font
                         color: gridRoot.textColor
                         verticalAlignment: Text.AlignVCenter
-                        leftPadding: 10
+                        leftPadding: 34
                     }
                     background: Rectangle {
                         implicitHeight: 28
@@ -278,12 +482,14 @@ Rectangle {
                         radius: 4
                     }
                     onTriggered: {
-                        if (itemData) gridRoot.settingsRequested(itemData.key, itemData.item_type)
                         contextMenu.close()
+                        gridRoot.quickAccessRequested(itemData.key, checked)
                     }
                 }
+                MenuSeparator { visible: (itemData && itemData.pinned !== undefined) || moveSubMenu.filteredFolders.length > 0 }
                 MenuItem {
-                    text: gridRoot.deleteConfigText
+                    text: gridRoot.allAppsText
+                    visible: moveSubMenu.hasAllApps
                     contentItem: Text {
                         text: parent.text
                         font: parent.font
@@ -297,74 +503,15 @@ Rectangle {
                         radius: 4
                     }
                     onTriggered: {
-                        if (itemData) gridRoot.deleteConfigRequested(itemData.key, itemData.item_type)
                         contextMenu.close()
+                        gridRoot.moveRequested(itemData.key, "all")
                     }
                 }
-                MenuSeparator { visible: !itemData.is_launcher_shortcut }
-                Menu {
-                    id: moveSubMenu
-                    title: gridRoot.moveToText
-                    visible: !itemData.is_launcher_shortcut
-                    background: Rectangle {
-                        implicitWidth: 150
-                        color: gridRoot.backgroundColor
-                        border.color: gridRoot.buttonBorderColor
-                        radius: 10
-                    }
-
-                    property bool hasAllApps: (itemData && itemData.pinned !== undefined) ? (itemData.pinned !== "") : false
-                    property var filteredFolders: {
-                        if (!itemData || itemData.pinned === undefined || !gridRoot.folderList) return [];
-                        return gridRoot.folderList.filter(function(f) {
-                            var pinnedStr = String(itemData.pinned || "")
-                            var parts = pinnedStr.split(',').map(function(s) { return s.trim() })
-                            return parts.indexOf(f) === -1
-                        })
-                    }
-
-                    MenuItem {
-                        text: gridRoot.quickAccessText
-                        checkable: true
-                        checked: (itemData && itemData.pinned) ? (String(itemData.pinned).indexOf("qqs") !== -1) : false
-                        indicator: Rectangle {
-                            implicitWidth: 18
-                            implicitHeight: 18
-                            x: 10
-                            anchors.verticalCenter: parent.verticalCenter
-                            radius: 4
-                            border.color: parent.checked ? gridRoot.highlightColor : gridRoot.buttonBorderColor
-                            border.width: 1
-                            color: "transparent"
-                            Rectangle {
-                                anchors.fill: parent
-                                anchors.margins: 3
-                                radius: 2
-                                visible: parent.parent.checked
-                                color: gridRoot.highlightColor
-                            }
-                        }
-                        contentItem: Text {
-                            text: parent.text
-                            font: parent.font
-                            color: gridRoot.textColor
-                            verticalAlignment: Text.AlignVCenter
-                            leftPadding: 34
-                        }
-                        background: Rectangle {
-                            implicitHeight: 28
-                            color: parent.hovered ? Qt.rgba(gridRoot.highlightColor.r, gridRoot.highlightColor.g, gridRoot.highlightColor.b, 0.25) : "transparent"
-                            radius: 4
-                        }
-                        onTriggered: {
-                            contextMenu.close()
-                            gridRoot.quickAccessRequested(itemData.key, checked)
-                        }
-                    }
-                    MenuSeparator { visible: (itemData && itemData.pinned !== undefined) || moveSubMenu.filteredFolders.length > 0 }
-                    MenuItem {
-                        text: gridRoot.allAppsText
-                        visible: moveSubMenu.hasAllApps
+                MenuSeparator { visible: moveSubMenu.hasAllApps && moveSubMenu.filteredFolders.length > 0 }
+                Repeater {
+                    model: moveSubMenu.filteredFolders
+                    delegate: MenuItem {
+                        text: modelData
                         contentItem: Text {
                             text: parent.text
                             font: parent.font
@@ -379,166 +526,86 @@ Rectangle {
                         }
                         onTriggered: {
                             contextMenu.close()
-                            gridRoot.moveRequested(itemData.key, "all")
+                            gridRoot.moveRequested(itemData.key, modelData)
                         }
                     }
-                    MenuSeparator { visible: moveSubMenu.hasAllApps && moveSubMenu.filteredFolders.length > 0 }
-                    Repeater {
-                        model: moveSubMenu.filteredFolders
-                        delegate: MenuItem {
-                            text: modelData
-                            contentItem: Text {
-                                text: parent.text
-                                font: parent.font
-                                color: gridRoot.textColor
-                                verticalAlignment: Text.AlignVCenter
-                                leftPadding: 10
-                            }
-                            background: Rectangle {
-                                implicitHeight: 28
-                                color: parent.hovered ? Qt.rgba(gridRoot.highlightColor.r, gridRoot.highlightColor.g, gridRoot.highlightColor.b, 0.25) : "transparent"
-                                radius: 4
-                            }
-                            onTriggered: {
-                                contextMenu.close()
-                                gridRoot.moveRequested(itemData.key, modelData)
-                            }
-                        }
+                }
+                MenuSeparator { visible: moveSubMenu.filteredFolders.length > 0 }
+                MenuItem {
+                    text: gridRoot.createNewFolderText
+                    contentItem: Text {
+                        text: parent.text
+                        font: parent.font
+                        color: gridRoot.textColor
+                        verticalAlignment: Text.AlignVCenter
+                        leftPadding: 10
                     }
-                    MenuSeparator { visible: moveSubMenu.filteredFolders.length > 0 }
-                    MenuItem {
-                        text: gridRoot.createNewFolderText
-                        contentItem: Text {
-                            text: parent.text
-                            font: parent.font
-                            color: gridRoot.textColor
-                            verticalAlignment: Text.AlignVCenter
-                            leftPadding: 10
-                        }
-                        background: Rectangle {
-                            implicitHeight: 28
-                            color: parent.hovered ? Qt.rgba(gridRoot.highlightColor.r, gridRoot.highlightColor.g, gridRoot.highlightColor.b, 0.25) : "transparent"
-                            radius: 4
-                        }
-                        onTriggered: {
-                            contextMenu.close()
-                            gridRoot.folderRequested(itemData.key)
-                        }
+                    background: Rectangle {
+                        implicitHeight: 28
+                        color: parent.hovered ? Qt.rgba(gridRoot.highlightColor.r, gridRoot.highlightColor.g, gridRoot.highlightColor.b, 0.25) : "transparent"
+                        radius: 4
                     }
-                }
-            }
-
-            // --- App/Game Item Content ---
-            Column {
-                id: contentColumn
-                visible: !!(itemData && !itemData.isSeparator)
-                anchors.centerIn: parent
-                width: parent.width - 10
-                spacing: 8 * effectiveFactor
-
-                Item {
-                    id: iconRoot
-                    anchors.horizontalCenter: parent.horizontalCenter
-                    width: gridRoot.itemIconSize * (0.8 + 0.2 * effectiveFactor)
-                    height: width
-
-                    Rectangle {
-                        anchors.fill: parent
-                        radius: 8 * (0.8 + 0.2 * effectiveFactor)
-                        color: "transparent"
-                        clip: true
-
-                        Image {
-                            id: iconImage
-                            anchors.fill: parent
-                            sourceSize: Qt.size(gridRoot.itemIconSize * 2, gridRoot.itemIconSize * 2)
-                            source: (itemData && itemData.icon_path)
-                                    ? itemData.icon_path + "?" + (gridRoot.iconMipmaps ? "hq" : "sd")
-                                    : "placeholder.png"
-                            fillMode: Image.PreserveAspectFit
-                            antialiasing: gridRoot.iconAntiAliasing
-                            smooth: gridRoot.iconSmoothing
-                            mipmap: gridRoot.iconMipmaps
-                            asynchronous: true
-                            cache: true
-                            opacity: status === Image.Ready ? 1 : 0
-                            Behavior on opacity { NumberAnimation { duration: 300 } }
-                        }
+                    onTriggered: {
+                        contextMenu.close()
+                        gridRoot.folderRequested(itemData.key)
                     }
                 }
-
-                Text {
-                    id: nameLabel
-                    text: (itemData ? itemData.name : "") || ""
-                    font.pointSize: gridRoot.itemFontSize * (0.8 + 0.2 * effectiveFactor)
-                    wrapMode: Text.WordWrap
-                    horizontalAlignment: Text.AlignHCenter
-                    width: parent.width
-                    color: gridRoot.textColor
-                    opacity: effectiveFactor > 0.6 ? 1 : 0
-                    visible: opacity > 0
-                    Behavior on opacity { NumberAnimation { duration: 250 } }
-                }
             }
+        }
+    }
 
-            // --- Input Handlers ---
-            MouseArea {
-                id: mouseArea
-                visible: !!(itemData && !itemData.isSeparator)
+    // --- Row Delegate (a section header or one row of items) ---
+    Component {
+        id: gridRowDelegate
+        Item {
+            id: rowItem
+            required property bool isHeader
+            required property int firstIndex
+            required property int firstSlot
+            required property int itemCount
+            width: ListView.view ? ListView.view.width : 0
+            height: isHeader ? gridRoot.separatorHeight : gridRoot.totalItemHeight
+
+            Loader {
                 anchors.fill: parent
-                hoverEnabled: true
-                cursorShape: Qt.PointingHandCursor
-                acceptedButtons: Qt.LeftButton | Qt.RightButton
-
-                onClicked: function(mouse) {
-                    if (!itemData || itemData.isSeparator) return;
-                    if (mouse.button === Qt.RightButton) {
-                        contextMenu.popup();
-                    } else {
-                        if (itemData.is_launcher_shortcut) {
-                            gridRoot.launchLauncherRequested();
-                        } else {
-                            gridRoot.launchRequested(itemData.key, itemData.name);
-                        }
-                    }
-                }
+                active: rowItem.isHeader
+                sourceComponent: sectionHeaderDelegate
+                onLoaded: item.modelIndex = Qt.binding(function() { return rowItem.firstIndex })
             }
 
-            DropArea {
-                id: dropArea
-                visible: !!(itemData && !itemData.isSeparator)
-                anchors.fill: parent
-                onDropped: function(drop) {
-                    if (itemData && !itemData.isSeparator && drop.hasUrls) {
-                        gridRoot.iconDropped(itemData.key, drop.urls[0].toString())
-                        drop.acceptProposedAction()
+            Row {
+                visible: !rowItem.isHeader
+                Repeater {
+                    model: rowItem.isHeader ? 0 : rowItem.itemCount
+                    delegate: Loader {
+                        required property int index
+                        sourceComponent: gridItemDelegate
+                        onLoaded: item.modelIndex = Qt.binding(function() {
+                            return gridRoot.visibleIndices[rowItem.firstSlot + index] !== undefined
+                                   ? gridRoot.visibleIndices[rowItem.firstSlot + index] : -1
+                        })
                     }
                 }
             }
         }
     }
 
-    // --- Main Layout (Flow + Repeater) ---
-    ScrollView {
-        id: scrollView
+    // --- Main Layout (virtualized rows) ---
+    ListView {
+        id: gridList
         anchors.fill: parent
         clip: true
-        topPadding: gridRoot.quickAccessVisible ? (overlaySection.height + 15) : 0
-        ScrollBar.vertical.policy: ScrollBar.AsNeeded
-        ScrollBar.horizontal.policy: ScrollBar.AlwaysOff
-        contentHeight: flowView.implicitHeight
-
-        Flow {
-            id: flowView
-            width: scrollView.width
-            clip: true
-            Repeater {
-                model: internalModel
-                delegate: gridItemDelegate
-            }
-        }
+        topMargin: gridRoot.quickAccessVisible ? (overlaySection.height + 15) : 0
+        model: rowModel
+        delegate: gridRowDelegate
+        reuseItems: true
+        // Keep about two screens of rows alive around the viewport for smooth scrolling
+        cacheBuffer: Math.max(0, height * 2)
+        boundsBehavior: Flickable.StopAtBounds
+        ScrollBar.vertical: ScrollBar { policy: ScrollBar.AsNeeded }
     }
 
+
     // --- Quick Access Delegate (icon only, no text) ---
     Component {
         id: quickAccessDelegate
@@ -639,7 +706,7 @@ Rectangle {
                 x: Math.max(0, (qaFlickable.width - qaRow.implicitWidth) / 2)
 
                 Repeater {
-                    model: internalQuickAccessModel
+                    model: typeof quickAccessItems !== "undefined" ? quickAccessItems : null
                     delegate: quickAccessDelegate
                 }
             }
@@ -1,18 +1,19 @@
 import os
 from PySide6.QtWidgets import (QHBoxLayout, QLineEdit,
                                QMessageBox)
-from PySide6.QtCore import Qt, Slot, QTimer, QUrl
-import queue
-import gc
+from PySide6.QtCore import Slot, QTimer, QUrl
+from PySide6.QtGui import QGuiApplication
 
 from .base_grid_tab import BaseGridTab
 from .workers import (AppListWorker, ScrcpyLaunchWorker, AppLaunchWorker,
-                      BatchIconDownloadWorker, BatchSaveWorker)
+                      IconWorker, BatchSaveWorker, IconRetryWorker, FolderLaunchWorker)
 from .dialogs import show_message_box, CreateSessionDialog, FoldersManagerDialog
-from .common_widgets import CustomThemedProgressDialog
+from .job_scheduler import LANE_LAUNCH, LANE_PREFETCH, PRIORITY_IDLE
 from utils.constants import *
+from utils import icon_store, icon_failures, memory_manager, tracing, window_manager
 
 
+ICON_JOB_TAG = 'apps_icons'
 
 # --- ABA DE APPS ---
 class AppsTab(BaseGridTab):
@@ -22,14 +23,9 @@ class AppsTab(BaseGridTab):
         # This will hold the complete list of app data dictionaries
         self.all_apps_data = []
 
-        # Batch icon download related attributes
+        # Icon downloads, one scheduler job per app (tagged ICON_JOB_TAG)
         self.pending_icon_downloads = {}
-        self.download_queue = queue.Queue()
-        self.icon_download_workers = []
-        self.total_icon_tasks = 0
-        self.completed_icon_tasks = 0
-        self.NUM_ICON_WORKERS = 5
-        self._icon_download_in_progress = False
+        self.icon_retry_worker = None
 
         self.placeholder_icon_path = os.path.join(self._base_path, "gui/placeholder.png")
         self.launcher_icon_path = os.path.join(self._base_path, "gui/launcher.png")
@@ -45,9 +41,11 @@ class AppsTab(BaseGridTab):
         self.refresh_action = self.menu.addAction(self.app_config.tr('apps_tab', 'refresh_btn'))
         self.menu.addSeparator()
         self.folders_action = self.menu.addAction(self.app_config.tr('apps_tab', 'folders_btn'))
+        self.launch_folder_menu = self.menu.addMenu(self.app_config.tr('apps_tab', 'launch_folder_btn'))
 
         self.refresh_action.triggered.connect(self.refresh_apps_list)
         self.folders_action.triggered.connect(self.open_folders_manager)
+        self.launch_folder_menu.aboutToShow.connect(self._populate_launch_folder_menu)
 
         top_panel.addWidget(self.search_input)
         top_panel.addWidget(self.menu_button)
@@ -57,8 +55,9 @@ class AppsTab(BaseGridTab):
         self._search_timer = QTimer()
         self._search_timer.setSingleShot(True)
         self._search_timer.setInterval(200)
-        self._search_timer.timeout.connect(self.filter_apps)
-        self.search_input.textChanged.connect(self._search_timer.start)
+        self._search_timer.timeout.connect(self._apply_search)
+        self.search_input.textChanged.connect(self._on_search_text_changed)
+        self._keystroke_ns = None
 
         self._connect_qml_signals()
         self.on_device_changed()
@@ -66,15 +65,15 @@ class AppsTab(BaseGridTab):
     def trigger_icon_redownload(self):
         """Deletes existing icon files and clears failure flags to force a complete re-download."""
         print("Forcing icon redownload for all apps...")
-        self._icon_download_in_progress = False
         self.stop_all_workers()
         for app_data in self.all_apps_data:
             pkg_name = app_data['key']
             if not app_data.get('is_launcher_shortcut'):
-                # 1. Clear failure flag in metadata
-                self.app_config.save_app_metadata(pkg_name, {'icon_fetch_failed': False})
+                # 1. Clear the failure record in metadata
+                icon_failures.clear_failure(self.app_config, pkg_name, icon_failures.KIND_APP)
 
-                # 2. Delete local icon file if it exists to force redownload
+                # 2. Unlink the shared icon (and drop any pre-store file) to force redownload
+                icon_store.forget_app_icon(self.app_config, pkg_name)
                 cached_icon_path = os.path.join(self.icon_cache_dir, f"{pkg_name}.png")
                 if os.path.exists(cached_icon_path):
                     try:
@@ -86,13 +85,14 @@ class AppsTab(BaseGridTab):
         self._update_display()
 
     def stop_all_workers(self):
-        if not hasattr(self, 'download_queue'):
+        if not hasattr(self, 'pending_icon_downloads'):
             return
         print("Stopping AppsTab workers...")
-        self._drain_queue(self.download_queue, self.NUM_ICON_WORKERS)
-        self.icon_download_workers.clear()
+        self._cancel_icon_jobs(ICON_JOB_TAG)
         self.pending_icon_downloads.clear()
-        self._icon_download_in_progress = False
+        if self.icon_retry_worker is not None:
+            self.icon_retry_worker.stop()
+            self.icon_retry_worker = None
         print("AppsTab workers signaled to stop.")
 
     def open_folders_manager(self):
@@ -104,6 +104,7 @@ class AppsTab(BaseGridTab):
         self.search_input.setPlaceholderText(self.app_config.tr('apps_tab', 'search_placeholder'))
         self.refresh_action.setText(self.app_config.tr('apps_tab', 'refresh_btn'))
         self.folders_action.setText(self.app_config.tr('apps_tab', 'folders_btn'))
+        self.launch_folder_menu.setTitle(self.app_config.tr('apps_tab', 'launch_folder_btn'))
         # Refresh the grid display and strings
         self.update_strings()
         self.filter_apps()
@@ -124,7 +125,10 @@ class AppsTab(BaseGridTab):
         root = root or self._get_qml_root()
         if root:
             folders = [f for f in self.app_config.get_custom_sessions().keys() if f != 'all']
-            root.setProperty("folderList", folders)
+            # A list property notifies even when equal; only push real folder changes to QML
+            if getattr(self, '_qml_folder_list', None) != (root, folders):
+                root.setProperty("folderList", folders)
+                self._qml_folder_list = (root, folders)
             self._set_qml_strings(root)
 
     @Slot(str, str)
@@ -201,9 +205,7 @@ class AppsTab(BaseGridTab):
         self._last_model_fingerprint = None
         device_id = self.app_config.get_connection_id()
         if not device_id or device_id == "no_device":
-            self._qa_items_cache = []
             self.pending_icon_downloads.clear()
-            self._icon_download_in_progress = False
             self.show_message(self.app_config.tr('scrcpy_tab', 'labels', key='please_connect'))
             self._clear_grid()
             self._unload_qml()
@@ -245,7 +247,7 @@ class AppsTab(BaseGridTab):
             worker.signals.finished.connect(self.main_window.resume_device_check)
 
         if self.main_window:
-            self.main_window.start_worker(worker)
+            self.main_window.start_worker(worker, device=current_device_id)
 
     def load_apps_from_cache_and_update_display(self):
         cached_data = self.app_config.get_app_list_cache()
@@ -272,7 +274,7 @@ class AppsTab(BaseGridTab):
 
         self._update_display()
         self.refresh_button.setEnabled(True)
-        gc.collect()
+        memory_manager.request_cleanup('app_list_loaded')
 
     def _update_display(self):
         cached_data = self.app_config.get_app_list_cache()
@@ -296,6 +298,9 @@ class AppsTab(BaseGridTab):
         self._populate_grid_model(apps_to_process)
         self.filter_apps() # This will apply the current filter and update the QML model
         self._update_folder_list_in_qml() # Ensure folder list is updated
+        # Started after filter_apps so the downloads follow the order the grid shows
+        if self.pending_icon_downloads:
+            self._start_batch_icon_download()
 
     def _on_app_list_error(self, error_msg):
         self.show_message(f"{self.app_config.tr('common', 'error')}: {error_msg}")
@@ -308,18 +313,14 @@ class AppsTab(BaseGridTab):
         launcher_pkg = self.app_config.get(CONF_DEFAULT_LAUNCHER)
 
         # Pass launcher key to QML
-        root = self.quick_widget.rootObject()
+        root = self._get_qml_root()
         if root:
             root.setProperty("launcherPkg", launcher_pkg if launcher_pkg else "")
 
         launcher_name = 'Launcher'
 
-        # Build a set of cached icon filenames (single listdir instead of N exists() calls)
-        try:
-            cached_icon_files = set(os.listdir(self.icon_cache_dir))
-        except OSError:
-            cached_icon_files = set()
         placeholder_exists = os.path.exists(self.placeholder_icon_path)
+        retry_icon_downloads = {}
 
         # Add launcher info first if it exists
         if launcher_pkg:
@@ -351,15 +352,18 @@ class AppsTab(BaseGridTab):
             if not isinstance(pinned_val, str): pinned_val = ""
 
             icon_path_url = ""
-            icon_filename = f"{pkg_name}.png"
-            if icon_filename in cached_icon_files:
-                full_path = os.path.join(self.icon_cache_dir, icon_filename)
+            # Shared store first: icons fetched for another device are reused without a download
+            full_path = icon_store.resolve_app_icon(self.app_config, pkg_name, metadata)
+            if full_path:
                 icon_path_url = QUrl.fromLocalFile(full_path).toString()
             else:
                 if placeholder_exists:
                     icon_path_url = QUrl.fromLocalFile(self.placeholder_icon_path).toString()
-                if not metadata.get('has_custom_icon') and not metadata.get('icon_fetch_failed'):
-                    self.pending_icon_downloads[pkg_name] = app_name
+                if not metadata.get('has_custom_icon'):
+                    if not icon_failures.has_failed(metadata, icon_failures.KIND_APP):
+                        self.pending_icon_downloads[pkg_name] = app_name
+                    elif icon_failures.is_retry_due(metadata, icon_failures.KIND_APP):
+                        retry_icon_downloads[pkg_name] = app_name
 
             self.all_apps_data.append({
                 'key': pkg_name,
@@ -370,16 +374,14 @@ class AppsTab(BaseGridTab):
                 'is_pinned': False,
                 'pinned': pinned_val
             })
-        if self.pending_icon_downloads:
-            self._start_batch_icon_download()
+        if retry_icon_downloads:
+            self._start_icon_retrier(retry_icon_downloads)
 
     @Slot(str)
     def on_delete_config_requested(self, pkg_name):
         app_name = next((app['name'] for app in self.all_apps_data if app['key'] == pkg_name), "N/A")
 
-        icon_path = os.path.join(self.icon_cache_dir, f"{pkg_name}.png")
-        if not os.path.exists(icon_path):
-            icon_path = None
+        icon_path = icon_store.resolve_app_icon(self.app_config, pkg_name)
 
         reply = show_message_box(
             self,
@@ -427,8 +429,7 @@ class AppsTab(BaseGridTab):
             if is_launcher_shortcut:
                 icon_path = self.launcher_icon_path
             else:
-                cached_icon_path = os.path.join(self.icon_cache_dir, f"{pkg_name}.png")
-                icon_path = cached_icon_path if os.path.exists(cached_icon_path) else None
+                icon_path = icon_store.resolve_app_icon(self.app_config, pkg_name)
 
             is_launcher = (pkg_name == self.app_config.get('default_launcher'))
             global_config = self.app_config.get_global_values_no_profile()
@@ -465,7 +466,31 @@ class AppsTab(BaseGridTab):
             self.main_window.tabs.setCurrentIndex(2) # Tab index for ScrcpyTab
             self.main_window.scrcpy_tab.select_profile(pkg_name)
 
-    def filter_apps(self):
+    def _update_quick_access_items(self):
+        """Quick Access shows pinned apps from the whole library, whatever the search filter is."""
+        quick_access_items = []
+        for app in self.all_apps_data:
+            pinned_val = app.get('pinned', "")
+            if app.get('is_launcher_shortcut') or (isinstance(pinned_val, str) and CONF_QUICK_ACCESS in
+                                                   [p.strip() for p in pinned_val.split(',')]):
+                quick_access_items.append(app)
+        quick_access_items.sort(key=lambda x: (0 if x.get('is_launcher_shortcut') else 1, x['name'].lower()))
+        self._set_qa_items(quick_access_items)
+
+    def _on_search_text_changed(self):
+        self._keystroke_ns = tracing.now()
+        self._search_timer.start()
+
+    def _apply_search(self):
+        """Search keystrokes only refilter the grid; the Quick Access bar doesn't depend on them."""
+        keystroke_ns = self._keystroke_ns or tracing.now()
+        tracing.record('apps.search_debounce', keystroke_ns)
+        with tracing.span('apps.search', query=self.search_input.text()):
+            self.filter_apps(update_quick_access=False)
+        self._trace_next_frame('apps.keystroke_to_frame', keystroke_ns)
+
+    def filter_apps(self, update_quick_access=True):
+        started = tracing.now()
         search_text = self.search_input.text().lower()
         is_searching = bool(search_text)
 
@@ -477,7 +502,6 @@ class AppsTab(BaseGridTab):
 
         sessions = {}
         unassigned_apps = []
-        quick_access_items = []
 
         session_order = self.app_config.get_custom_sessions_order()
 
@@ -489,11 +513,6 @@ class AppsTab(BaseGridTab):
             parts = [p.strip() for p in pinned_val.split(',') if p.strip()]
             folder = next((p for p in parts if p != CONF_QUICK_ACCESS), "")
 
-            if app.get('is_launcher_shortcut'):
-                quick_access_items.append(app)
-            elif CONF_QUICK_ACCESS in parts:
-                quick_access_items.append(app)
-
             if not app.get('is_launcher_shortcut'):
                 if folder:
                     sessions.setdefault(folder, []).append(app)
@@ -538,12 +557,15 @@ class AppsTab(BaseGridTab):
                 app_copy['isHidden'] = is_collapsed
                 qml_model_data.append(app_copy)
 
-        # Cache QA items and refresh shared model
-        self._qa_items_cache = sorted(quick_access_items, key=lambda x: (0 if x.get('is_launcher_shortcut') else 1, x['name'].lower()))
-        self._refresh_qa_model()
+        tracing.record('apps.filter', started, apps=len(self.all_apps_data), shown=len(filtered_apps))
+
+        if update_quick_access:
+            with tracing.span('apps.quick_access'):
+                self._update_quick_access_items()
 
         # Fingerprint optimization
-        model_fingerprint = hash(str(qml_model_data))
+        with tracing.span('apps.fingerprint'):
+            model_fingerprint = hash(str(qml_model_data))
         if model_fingerprint == self._last_model_fingerprint:
             return
         self._last_model_fingerprint = model_fingerprint
@@ -551,78 +573,61 @@ class AppsTab(BaseGridTab):
         self._update_grid_model(qml_model_data)
 
     def _start_batch_icon_download(self):
-        if self._icon_download_in_progress:
-            return
-
-        self.total_icon_tasks = len(self.pending_icon_downloads)
-        if not self.total_icon_tasks:
+        """
+        Queues one download per missing icon on the scheduler; icons fill in as they arrive.
+        Icons already queued or running (from an earlier refresh) are not submitted twice.
+        """
+        if not self.pending_icon_downloads or not self.main_window:
             return
 
-        self._icon_download_in_progress = True
-        self.completed_icon_tasks = 0
-        self.progress_dialog = CustomThemedProgressDialog(
-            self.app_config.tr('apps_tab', 'downloading_icons'),
-            cancelButtonText=None, # No cancel button
-            minimum=0,
-            maximum=self.total_icon_tasks,
-            parent=self
-        )
-        self.progress_dialog.setWindowFlags(self.progress_dialog.windowFlags() | Qt.WindowStaysOnTopHint)
-        self.progress_dialog.title_bar.minimize_button.setVisible(False) # Hide minimize button
-        self.progress_dialog.title_bar.close_button.setVisible(False) # Hide close button
-        self.progress_dialog.setValue(0)
-        self.progress_dialog.show()
-
-        # Clear existing queue and workers for a new batch
-        while not self.download_queue.empty():
-            self.download_queue.get()
-            self.download_queue.task_done()
-        self.icon_download_workers.clear()
-
-        # Add tasks to queue
+        in_flight = {getattr(worker, 'pkg_name', None) for worker in self.main_window.scheduler.workers(ICON_JOB_TAG)}
+        workers = {}
         for pkg_name, app_name in self.pending_icon_downloads.items():
-            self.download_queue.put((pkg_name, app_name))
-
-        # Start workers
-        self.icon_download_workers = []
-        for _ in range(self.NUM_ICON_WORKERS):
-            worker = BatchIconDownloadWorker(self.download_queue, self.icon_cache_dir, self.app_config)
+            if pkg_name in in_flight:
+                continue
+            worker = IconWorker(pkg_name, app_name, self.icon_cache_dir, self.app_config)
             worker.signals.finished.connect(self._on_icon_batch_finished)
             worker.signals.error.connect(self._on_icon_batch_error)
-            self.icon_download_workers.append(worker)
-            if self.main_window: self.main_window.start_worker(worker)
-
-        # Add sentinel values for workers to stop after processing all tasks
-        for _ in range(self.NUM_ICON_WORKERS):
-            self.download_queue.put(None)
+            workers[pkg_name] = worker
+        self._submit_icon_jobs(workers, ICON_JOB_TAG)
 
     @Slot(str, str) # pkg_name, icon_path_string
     def _on_icon_batch_finished(self, pkg_name, icon_path_string):
-        self.completed_icon_tasks += 1
-        if self.progress_dialog:
-            self.progress_dialog.setValue(self.completed_icon_tasks)
-            self.progress_dialog.setLabelText(f"{self.app_config.tr('apps_tab', 'downloading_icons')} ({self.completed_icon_tasks}/{self.total_icon_tasks})")
-
-        # Update the model in memory
-        for app_data in self.all_apps_data:
-            if app_data['key'] == pkg_name:
-                app_data['icon_path'] = QUrl.fromLocalFile(icon_path_string).toString()
-                break
-
-        if self.completed_icon_tasks >= self.total_icon_tasks:
-            self._on_all_icons_downloaded()
+        self._on_icon_model_updated(pkg_name, QUrl.fromLocalFile(icon_path_string).toString())
+        self._on_icon_task_done(pkg_name)
 
     @Slot(str, str) # pkg_name, error_msg
     def _on_icon_batch_error(self, pkg_name, error_msg):
+        # The worker already recorded the failure (class + retry window) in the metadata
         print(f"Error downloading icon for {pkg_name}: {error_msg}")
-        self._save_metadata_async(pkg_name, {'icon_fetch_failed': True}) # Mark as failed
-        self.completed_icon_tasks += 1
-        if self.progress_dialog:
-            self.progress_dialog.setValue(self.completed_icon_tasks)
-            self.progress_dialog.setLabelText(f"{self.app_config.tr('apps_tab', 'downloading_icons')} ({self.completed_icon_tasks}/{self.total_icon_tasks})")
+        self._on_icon_task_done(pkg_name)
 
-        if self.completed_icon_tasks >= self.total_icon_tasks:
+    def _on_icon_task_done(self, pkg_name):
+        self.pending_icon_downloads.pop(pkg_name, None)
+        if not self.pending_icon_downloads:
             self._on_all_icons_downloaded()
+        else:
+            self._schedule_icon_refresh()
+
+    def _start_icon_retrier(self, tasks):
+        """Retries previously failed icons whose retry window elapsed, silently and at low priority."""
+        if self.icon_retry_worker is not None:
+            return
+        self.icon_retry_worker = IconRetryWorker(tasks.items(), self.icon_cache_dir, self.app_config)
+        self.icon_retry_worker.signals.icon_ready.connect(self._on_retried_icon_ready)
+        self.icon_retry_worker.signals.finished.connect(self._on_icon_retrier_finished)
+        if self.main_window:
+            self.main_window.start_worker(self.icon_retry_worker, priority=PRIORITY_IDLE, lane=LANE_PREFETCH, tag=ICON_JOB_TAG)
+
+    @Slot(str, str)
+    def _on_retried_icon_ready(self, pkg_name, icon_path):
+        self._on_icon_model_updated(pkg_name, QUrl.fromLocalFile(icon_path).toString())
+
+    @Slot(int)
+    def _on_icon_retrier_finished(self, recovered):
+        self.icon_retry_worker = None
+        if recovered:
+            self.filter_apps()
 
     def _save_metadata_async(self, pkg_name, data):
         worker = BatchSaveWorker(pkg_name, data, self.app_config)
@@ -630,24 +635,12 @@ class AppsTab(BaseGridTab):
             self.main_window.start_worker(worker)
 
     def _on_all_icons_downloaded(self):
-        if hasattr(self, 'progress_dialog') and self.progress_dialog:
-            self.progress_dialog.close()
-            self.progress_dialog.deleteLater() # Ensure cleanup
-            self.progress_dialog = None
-
-        self.icon_download_workers.clear() # Clear worker references
-        self.pending_icon_downloads.clear() # Clear pending tasks
-        self._icon_download_in_progress = False
-
-        # Aggressive memory cleanup
-        gc.collect()
+        memory_manager.request_cleanup('icon_downloads')
 
-        self.filter_apps() # Refresh the UI once with all new icons
+        self.filter_apps() # Final refresh with every icon that arrived
 
     def _on_display_id_found_for_alt_launch(self, display_id, shortcut_path, package_name):
-        app_icon_path = os.path.join(self.icon_cache_dir, f"{package_name}.png")
-        if not os.path.exists(app_icon_path):
-            app_icon_path = None
+        app_icon_path = icon_store.resolve_app_icon(self.app_config, package_name)
         if not display_id:
             show_message_box(self, self.app_config.tr('common', 'error'), self.app_config.tr('apps_tab', 'virtual_display_error'), icon=QMessageBox.Critical, app_icon_path=app_icon_path)
             return
@@ -665,9 +658,10 @@ class AppsTab(BaseGridTab):
         )
         app_launch_worker.signals.error.connect(lambda msg: show_message_box(self, self.app_config.tr('apps_tab', 'app_launch_error_title'), msg, icon=QMessageBox.Critical, app_icon_path=app_icon_path))
         if self.main_window:
-            self.main_window.start_worker(app_launch_worker)
+            self.main_window.start_worker(app_launch_worker, lane=LANE_LAUNCH)
 
-    def execute_launch(self, package_name, app_name):
+    def _launch_config(self, package_name):
+        """Returns (config, session_type, icon_path, use_alt_launch, is_launcher) for launching an app."""
         config_to_use = self.app_config.get_global_values_no_profile().copy()
         app_metadata = self.app_config.get_app_metadata(package_name)
 
@@ -691,15 +685,82 @@ class AppsTab(BaseGridTab):
         else:
             config_to_use['start_app'] = package_name
 
-        icon_path = self.launcher_icon_path if is_launcher else os.path.join(self.icon_cache_dir, f"{package_name}.png")
-        if not os.path.exists(icon_path):
-            icon_path = None
+        icon_path = self.launcher_icon_path if is_launcher else icon_store.resolve_app_icon(self.app_config, package_name)
+        return config_to_use, session_type, icon_path, use_alt_launch, is_launcher
+
+    def execute_launch(self, package_name, app_name):
+        config_to_use, session_type, icon_path, use_alt_launch, is_launcher = self._launch_config(package_name)
 
         launch_worker = ScrcpyLaunchWorker(config_to_use, app_name, self.app_config.get_connection_id(), icon_path, session_type)
         launch_worker.signals.error.connect(lambda msg: show_message_box(self, self.app_config.tr('apps_tab', 'scrcpy_error_title'), msg, icon=QMessageBox.Critical, app_icon_path=icon_path))
+        launch_worker.signals.hook_failed.connect(lambda msg: show_message_box(self, self.app_config.tr('apps_tab', 'hook_failed_title'), msg, icon=QMessageBox.Warning, app_icon_path=icon_path))
 
         if use_alt_launch and not is_launcher:
             launch_worker.signals.display_id_found.connect(self._on_display_id_found_for_alt_launch)
 
         if self.main_window:
-            self.main_window.start_worker(launch_worker)
+            self.main_window.start_worker(launch_worker, lane=LANE_LAUNCH)
+
+    def _populate_launch_folder_menu(self):
+        self.launch_folder_menu.clear()
+        folders = [f for f in self.app_config.get_custom_sessions().keys() if f != 'all']
+        order = self.app_config.get_custom_sessions_order()
+        ordered = [f for f in order if f in folders] + sorted([f for f in folders if f not in order], key=lambda x: x.lower())
+        for folder_name in ordered:
+            self.launch_folder_menu.addAction(folder_name, lambda folder_name=folder_name: self.launch_folder(folder_name))
+        if not ordered:
+            self.launch_folder_menu.addAction(self.app_config.tr('apps_tab', 'no_folders')).setEnabled(False)
+
+    def _on_folder_launch_finished(self, failures):
+        if failures:
+            show_message_box(self, self.app_config.tr('apps_tab', 'scrcpy_error_title'), "\n".join(failures), icon=QMessageBox.Critical)
+
+    def _tiling_area(self):
+        """
+        Screen area (x, y, width, height, in device pixels) the windows of a folder launch are tiled on:
+        the first monitor as X11 reports it, the same area window_manager.tile() uses afterwards.
+        Without python-xlib the Qt screen is converted to device pixels instead. Qt keeps a screen's
+        origin in device pixels and scales only the offsets inside it, so the available area maps
+        back as origin + offset * devicePixelRatio, which is what RandR reports for that screen.
+        """
+        areas = window_manager.monitors()
+        if areas:
+            return areas[0]
+        screen = self.screen() or QGuiApplication.primaryScreen()
+        origin, available, ratio = screen.geometry().topLeft(), screen.availableGeometry(), screen.devicePixelRatio()
+        return (origin.x() + round((available.x() - origin.x()) * ratio),
+                origin.y() + round((available.y() - origin.y()) * ratio),
+                round(available.width() * ratio), round(available.height() * ratio))
+
+    def launch_folder(self, folder_name):
+        """Starts every app of the folder at once: one virtual display and one window tile per app."""
+        launcher_pkg = self.app_config.get(CONF_DEFAULT_LAUNCHER)
+        apps = []
+        for app in self.all_apps_data:
+            pinned_val = app.get('pinned', "")
+            parts = [p.strip() for p in pinned_val.split(',')] if isinstance(pinned_val, str) else []
+            # The launcher can't run on a virtual display, so it is left out of folder launches
+            if folder_name in parts and not app.get('is_launcher_shortcut') and app['key'] != launcher_pkg:
+                apps.append(app)
+        if not apps:
+            return
+        apps.sort(key=lambda x: x['name'].lower())
+
+        launches = []
+        for app, rect in zip(apps, window_manager.tile_rects(len(apps), self._tiling_area())):
+            config_to_use, session_type, icon_path, _, _ = self._launch_config(app['key'])
+            if config_to_use.get(CONF_NEW_DISPLAY, "Disabled") in ("Disabled", "", None):
+                # Each app needs its own display; size it to its tile so nothing gets scaled
+                config_to_use[CONF_NEW_DISPLAY] = f"{rect[2]}x{rect[3]}"
+            config_to_use[CONF_FULLSCREEN] = False
+            launches.append({'config_values': config_to_use, 'window_title': app['name'], 'icon_path': icon_path,
+                             'session_type': session_type, 'window_rect': rect})
+
+        folder_worker = FolderLaunchWorker(launches, self.app_config.get_connection_id())
+        # One dialog for the whole folder, listing every app that failed, once the worker is done
+        failures = []
+        folder_worker.signals.error.connect(failures.append)
+        folder_worker.signals.finished.connect(lambda launched: self._on_folder_launch_finished(failures))
+        folder_worker.signals.hook_failed.connect(lambda msg: show_message_box(self, self.app_config.tr('apps_tab', 'hook_failed_title'), msg, icon=QMessageBox.Warning))
+        if self.main_window:
+            self.main_window.start_worker(folder_worker, lane=LANE_LAUNCH)
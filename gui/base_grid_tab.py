@@ -3,16 +3,58 @@
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QMessageBox, QPushButton, QMenu
 from .dialogs import show_message_box
-from PySide6.QtCore import Qt, QUrl, QTimer, Slot, Signal
+from PySide6.QtCore import Qt, QUrl, QTimer, Slot, Signal, QCoreApplication
 from PySide6.QtGui import QPalette
+from PySide6.QtQml import QQmlEngine, QQmlComponent
 from PySide6.QtQuickWidgets import QQuickWidget
-import gc
 import os
 import sys
 import time
-import queue
+import uuid
+from utils import icon_store, memory_manager, tracing
 from utils.constants import CONF_QUICK_ACCESS, CONF_QUICK_ACCESS_FACTOR, CONF_QUICK_ACCESS_VISIBLE, CONF_HQ_ICON_RENDERING, CONF_WEB_HOVER_EFFECT
 from . import themes
+from .job_scheduler import LANE_VISIBLE, LANE_PREFETCH
+from .grid_model import GridItemModel
+
+# Icon jobs for the first rows go on the visible lane; the rest are background prefetch
+VISIBLE_ICON_JOBS = 60
+ICON_REFRESH_MS = 400
+
+GRID_QML_PATH = os.path.join(os.path.dirname(__file__), "DynamicGridView.qml")
+
+_qml_engine = None
+_qml_warmup_component = None
+_quick_access_model = None
+
+
+def shared_qml_engine():
+    """
+    One QML engine for every grid tab, so DynamicGridView.qml is compiled once per process and
+    reused when a tab (re)creates its view. Qt's on-disk cache (.qmlc) covers later runs.
+    """
+    global _qml_engine
+    if _qml_engine is None:
+        _qml_engine = QQmlEngine(QCoreApplication.instance())
+        _qml_engine.rootContext().setContextProperty("quickAccessItems", shared_quick_access_model())
+    return _qml_engine
+
+def shared_quick_access_model():
+    """
+    The Quick Access bar's model, one for the whole app: every grid view shows it through the
+    engine's `quickAccessItems` context property, and it only changes when pins or icons do.
+    """
+    global _quick_access_model
+    if _quick_access_model is None:
+        _quick_access_model = GridItemModel(QCoreApplication.instance())
+    return _quick_access_model
+
+def warm_up_grid_qml():
+    """Compiles the grid component in the background so the first view created later is instant."""
+    global _qml_warmup_component
+    if _qml_warmup_component is None:
+        _qml_warmup_component = QQmlComponent(shared_qml_engine(), QUrl.fromLocalFile(GRID_QML_PATH),
+                                              QQmlComponent.CompilationMode.Asynchronous)
 
 
 class BaseGridTab(QWidget):
@@ -27,6 +69,10 @@ class BaseGridTab(QWidget):
         self.items = {}
         self.collapsed_sections = set()
         self._qa_items_cache = []
+        # Outlives the QML view: a reloaded view picks the current content up again
+        self.grid_model = GridItemModel(self)
+        self._frame_trace_window = None
+        self._pending_frame_traces = []  # (span name, start ns) closed by the next rendered frame
         self._base_path = getattr(sys, '_MEIPASS', os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
         self.placeholder_icon_path = None
 
@@ -34,22 +80,13 @@ class BaseGridTab(QWidget):
 
         # Create and add top panel in subclasses
 
-        # New QQuickWidget for the grid
-        self.quick_widget = QQuickWidget(self)
-        # Make QML background transparent
-        self.quick_widget.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.quick_widget.setResizeMode(QQuickWidget.ResizeMode.SizeRootObjectToView)
-        qml_path = os.path.join(os.path.dirname(__file__), "DynamicGridView.qml")
-        self.quick_widget.setSource(QUrl.fromLocalFile(qml_path))
-        
-        # Pass theme colors to QML once component is ready
-        self.quick_widget.statusChanged.connect(self.update_theme)
+        # The QML grid is created by _reload_qml once there is a device to show
+        self.quick_widget = None
 
         # Info Label for messages
         self.info_label = QLabel()
         self.info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        self.main_layout.addWidget(self.quick_widget)
         self.main_layout.addWidget(self.info_label)
 
         self.info_label.hide()
@@ -110,6 +147,8 @@ class BaseGridTab(QWidget):
             root.setProperty("quickAccessFactor", self.app_config.get(CONF_QUICK_ACCESS_FACTOR, 1.0))
             root.setProperty("quickAccessVisible", self.app_config.get(CONF_QUICK_ACCESS_VISIBLE, False))
             
+            root.setProperty("gridModel", self.grid_model)
+
             # Update strings
             self.update_strings()
             
@@ -153,8 +192,8 @@ class BaseGridTab(QWidget):
                             icon=QMessageBox.Warning)
             return
         from .workers import IconSaveWorker
-        icon_key = os.path.basename(key)
-        destination_path = os.path.join(self._get_icon_cache_dir(), f"{icon_key}.png")
+        # Saved to a temporary file, then moved into the shared store as this device's override
+        destination_path = os.path.join(self._get_icon_cache_dir(), f".custom_{uuid.uuid4().hex}.png")
         worker = IconSaveWorker(key, local_path, destination_path)
         worker.signals.finished.connect(self._on_custom_icon_saved)
         worker.signals.error.connect(self._on_custom_icon_error)
@@ -163,13 +202,13 @@ class BaseGridTab(QWidget):
 
     @Slot(str, str)
     def _on_custom_icon_saved(self, key, destination_path):
-        self.app_config.save_app_metadata(key, {'has_custom_icon': True})
+        destination_path = icon_store.put_custom_icon(self.app_config, key, destination_path)
         cache_buster = int(time.time())
         new_icon_url = QUrl.fromLocalFile(destination_path).toString() + f"?t={cache_buster}"
         self._on_icon_model_updated(key, new_icon_url)
         self._last_model_data = None
         self._refresh_after_icon_update()
-        gc.collect()
+        memory_manager.request_cleanup('custom_icon')
         show_message_box(self, self.app_config.tr('apps_tab', 'custom_icon_success_title'),
                         self.app_config.tr('apps_tab', 'custom_icon_success_msg'),
                         icon=QMessageBox.Information)
@@ -204,14 +243,21 @@ class BaseGridTab(QWidget):
     def get_qa_items(self):
         return self._qa_items_cache
 
+    def _set_qa_items(self, items):
+        """Caches this tab's Quick Access items and rebuilds the shared bar only when they changed."""
+        if items == self._qa_items_cache:
+            return
+        # Copies: the tabs update their item dicts in place (icons, pins)
+        self._qa_items_cache = [dict(item) for item in items]
+        self._refresh_qa_model()
+
     def _refresh_qa_model(self):
         if self.main_window:
             self.main_window._refresh_qa_model()
 
     def _connect_qml_signals(self):
         if self.quick_widget is None:
-            QTimer.singleShot(100, self._connect_qml_signals)
-            return
+            return  # _reload_qml callers connect again once the view exists
         root = self.quick_widget.rootObject()
         if not root:
             QTimer.singleShot(100, self._connect_qml_signals)
@@ -256,21 +302,8 @@ class BaseGridTab(QWidget):
     def _clear_grid(self):
         self.items = {}
         self._last_model_data = None
-        if self.quick_widget is None:
-            return
-        root = self.quick_widget.rootObject()
-        if root:
-            root.setProperty("itemsModel", [])
-            root.setProperty("quickAccessModel", [])
-
-    def _trim_heap(self):
-        """Release free heap pages back to the OS (Linux glibc)."""
-        try:
-            import ctypes
-            libc = ctypes.CDLL("libc.so.6")
-            libc.malloc_trim(0)
-        except Exception:
-            pass
+        self.grid_model.clear()
+        self._set_qa_items([])
 
     def _unload_qml(self):
         """Destroy the QQuickWidget to free all scene graph, textures and QML engine memory."""
@@ -281,11 +314,10 @@ class BaseGridTab(QWidget):
             return
         self.quick_widget = None
         self.main_layout.removeWidget(old)
-        from PySide6.QtCore import QCoreApplication
         # step 1: unload QML component tree (frees delegates, textures, scene graph)
         old.setSource(QUrl())
+        # The shared engine keeps the compiled component for the next _reload_qml
         if old.engine():
-            old.engine().clearComponentCache()
             old.engine().collectGarbage()
         try:
             old.quickWindow().releaseResources()
@@ -301,21 +333,21 @@ class BaseGridTab(QWidget):
         # step 3: clear caches and release heap
         from PySide6.QtGui import QPixmapCache
         QPixmapCache.clear()
-        gc.collect()
-        self._trim_heap()
+        memory_manager.request_cleanup('qml_unload', trim=True)
 
     def _reload_qml(self):
         """Create a new QQuickWidget in place of the destroyed one."""
         if self.quick_widget is not None:
             return
-        self.quick_widget = QQuickWidget(self)
+        self.quick_widget = QQuickWidget(shared_qml_engine(), self)
+        # Make QML background transparent
         self.quick_widget.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.quick_widget.setResizeMode(QQuickWidget.ResizeMode.SizeRootObjectToView)
         info_idx = self.main_layout.indexOf(self.info_label)
         self.main_layout.insertWidget(info_idx, self.quick_widget)
-        qml_path = os.path.join(os.path.dirname(__file__), "DynamicGridView.qml")
+        # Pass theme colors to QML once component is ready
         self.quick_widget.statusChanged.connect(self.update_theme)
-        self.quick_widget.setSource(QUrl.fromLocalFile(qml_path))
+        self.quick_widget.setSource(QUrl.fromLocalFile(GRID_QML_PATH))
 
     def show_message(self, text):
         self.info_label.setText(text)
@@ -329,33 +361,68 @@ class BaseGridTab(QWidget):
             self.quick_widget.show()
 
     def _update_grid_model(self, model_data):
-        """Updates the model in the QML GridView with optimization."""
-        if self.quick_widget is None:
+        """Applies the new item list to the grid model; only the rows that differ reach QML."""
+        # Skip if model data is identical to last update
+        if getattr(self, '_last_model_data', None) == model_data:
             return
-        root = self.quick_widget.rootObject()
-        if root:
-            # Skip if model data is identical to last update
-            if hasattr(self, '_last_model_data') and self._last_model_data == model_data:
-                return
-            self._last_model_data = model_data
-            
-            # Set the item list for the QML model property
-            root.setProperty("itemsModel", model_data)
-            gc.collect()
-        else:
-            # If the root object is not ready, wait a bit and retry.
-            QTimer.singleShot(100, lambda: self._update_grid_model(model_data))
-
-    @staticmethod
-    def _drain_queue(q, num_workers):
-        while not q.empty():
-            try:
-                q.get_nowait()
-                q.task_done()
-            except queue.Empty:
-                break
-        for _ in range(num_workers):
-            q.put(None)
+        self._last_model_data = model_data
+        with tracing.span('grid.update_model', rows=len(model_data)):
+            self.grid_model.set_items(model_data)
+
+    def _trace_next_frame(self, name, start_ns):
+        """Records a tracing span from start_ns to the end of the next frame the grid renders."""
+        if not tracing.is_enabled():
+            return
+        window = self.quick_widget.quickWindow() if self.quick_widget is not None else None
+        if window is None:
+            tracing.record(name, start_ns, frame=False)
+            return
+        if self._frame_trace_window is not window:
+            window.afterRendering.connect(self._on_grid_frame_rendered)
+            self._frame_trace_window = window
+        self._pending_frame_traces.append((name, start_ns))
+        # Unchanged results don't dirty the scene; still measure up to the next frame
+        window.update()
+
+    def _on_grid_frame_rendered(self):
+        pending, self._pending_frame_traces = self._pending_frame_traces, []
+        end_ns = tracing.now()
+        for name, start_ns in pending:
+            tracing.record(name, start_ns, end_ns, frame=True)
+
+    def _display_rank(self):
+        """key -> position of the item in the grid as last shown; collapsed (hidden) items rank last."""
+        model_data = getattr(self, '_last_model_data', None) or []
+        shown = [item['key'] for item in model_data if not item.get('isSeparator') and not item.get('isHidden')]
+        hidden = [item['key'] for item in model_data if not item.get('isSeparator') and item.get('isHidden')]
+        return {key: rank for rank, key in enumerate(shown + hidden)}
+
+    def _submit_icon_jobs(self, workers, tag):
+        """
+        Queues one icon worker per item ({key: worker}) on the scheduler: the first rows of the grid
+        on the visible lane, the rest on the background prefetch lane, both in display order.
+        """
+        if not self.main_window:
+            return
+        rank = self._display_rank()
+        ordered = sorted(workers.items(), key=lambda entry: rank.get(entry[0], len(rank)))
+        for position, (key, worker) in enumerate(ordered):
+            lane = LANE_VISIBLE if position < VISIBLE_ICON_JOBS else LANE_PREFETCH
+            self.main_window.start_worker(worker, priority=position, lane=lane, tag=tag)
+
+    def _cancel_icon_jobs(self, tag):
+        if self.main_window and hasattr(self.main_window, 'scheduler'):
+            self.main_window.scheduler.cancel(tag)
+
+    def _schedule_icon_refresh(self):
+        """Throttles grid refreshes while icons arrive one by one."""
+        if not hasattr(self, '_icon_refresh_timer'):
+            self._icon_refresh_timer = QTimer(self)
+            self._icon_refresh_timer.setSingleShot(True)
+            self._icon_refresh_timer.setInterval(ICON_REFRESH_MS)
+            self._icon_refresh_timer.timeout.connect(self._refresh_after_icon_update)
+        if not self._icon_refresh_timer.isActive():
+            self._icon_refresh_timer.start()
 
     def set_device_status_message(self, message):
         if message:
@@ -1,6 +1,6 @@
 import os
 import base64
-from PySide6.QtCore import Qt, Signal, QThreadPool, QSize
+from PySide6.QtCore import Qt, Signal, QSize
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import (QApplication, QMessageBox, QHBoxLayout, QLabel,
                                QPushButton, QStyle, QCheckBox, QLineEdit,
@@ -9,6 +9,7 @@ from PySide6.QtWidgets import (QApplication, QMessageBox, QHBoxLayout, QLabel,
 from .common_widgets import CustomThemedDialog, CustomTitleBar
 from . import themes
 from .workers import AdbConnectWorker, AdbPairWorker
+from .job_scheduler import get_scheduler
 from utils.constants import CONF_SHOW_WINLATOR_TAB
 
 
@@ -495,7 +496,6 @@ class AdbWifiWindow(QWidget):
     def __init__(self, app_config, parent=None):
         super().__init__(parent)
         self.app_config = app_config
-        self.thread_pool = QThreadPool.globalInstance()
         self.setWindowTitle(self.app_config.tr('adb_wifi', 'title'))
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.Tool)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
@@ -595,7 +595,7 @@ class AdbWifiWindow(QWidget):
         worker = AdbConnectWorker(address)
         worker.signals.result.connect(self._on_connect_success)
         worker.signals.error.connect(self._on_connect_error)
-        self.thread_pool.start(worker)
+        get_scheduler().submit(worker)
 
     def handle_pair(self):
         address = self.pair_address_input.text().strip()
@@ -610,7 +610,7 @@ class AdbWifiWindow(QWidget):
         worker = AdbPairWorker(address, code)
         worker.signals.result.connect(self._on_connect_success)
         worker.signals.error.connect(self._on_connect_error)
-        self.thread_pool.start(worker)
+        get_scheduler().submit(worker)
 
     def _on_connect_success(self, message):
         self.set_status(message)
@@ -0,0 +1,143 @@
+# FILE: gui/grid_model.py
+# PURPOSE: List model of the QML grid. Python diffs each new item list against the current one
+#          (utils.model_diff) and applies only the inserted/removed/moved/changed rows, so QML keeps its
+#          delegates instead of rebuilding them when apps are pinned, moved or get their icon.
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, Slot
+
+from utils import model_diff, tracing
+
+# role name -> default for items that don't set it
+_ROLE_DEFAULTS = {
+    'key': "", 'name': "", 'icon_path': "", 'item_type': "",
+    'pinned': "", 'isSeparator': False, 'isHidden': False,
+    'isCollapsed': False, 'sectionId': "", 'text': "",
+    'is_launcher_shortcut': False,
+}
+_ROLES = {Qt.ItemDataRole.UserRole + 1 + i: name for i, name in enumerate(_ROLE_DEFAULTS)}
+_ROLE_IDS = {name: role for role, name in _ROLES.items()}
+
+
+def item_key(item):
+    """Identity of a grid item across updates (separators by their section)."""
+    if item.get('isSeparator'):
+        return "sep_" + str(item.get('sectionId', ""))
+    return "item_" + str(item.get('key', ""))
+
+
+class GridItemModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def roleNames(self):
+        return {role: name.encode() for role, name in _ROLES.items()}
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._items):
+            return None
+        name = _ROLES.get(role)
+        if name is None:
+            return None
+        return self._items[index.row()].get(name, _ROLE_DEFAULTS[name])
+
+    def items(self):
+        return list(self._items)
+
+    def set_items(self, items):
+        """Replaces the content with a minimal batch of row operations. Returns how many were applied."""
+        # Tabs keep mutating their own dicts (icons, pins), so the model diffs against its own copies
+        items = [dict(item) for item in items]
+        with tracing.span('grid.diff', rows=len(items)):
+            ops = model_diff.diff_items(self._items, items, item_key)
+        applied = tracing.now()
+        for op in ops:
+            kind = op[0]
+            if kind == model_diff.OP_REMOVE:
+                _, start, count = op
+                self.beginRemoveRows(QModelIndex(), start, start + count - 1)
+                del self._items[start:start + count]
+                self.endRemoveRows()
+            elif kind == model_diff.OP_MOVE:
+                _, start, count, dest = op
+                # Qt takes the destination as the row the block goes before, in pre-move numbering
+                destination_child = dest + count if dest > start else dest
+                self.beginMoveRows(QModelIndex(), start, start + count - 1, QModelIndex(), destination_child)
+                block = self._items[start:start + count]
+                del self._items[start:start + count]
+                self._items[dest:dest] = block
+                self.endMoveRows()
+            elif kind == model_diff.OP_INSERT:
+                _, start, new_items = op
+                self.beginInsertRows(QModelIndex(), start, start + len(new_items) - 1)
+                self._items[start:start] = new_items
+                self.endInsertRows()
+            elif kind == model_diff.OP_CHANGE:
+                _, row, item, fields = op
+                self._items[row] = item
+                roles = [_ROLE_IDS[field] for field in fields if field in _ROLE_IDS]
+                if roles:
+                    index = self.index(row)
+                    self.dataChanged.emit(index, index, roles)
+        self._items[:] = items
+        tracing.record('grid.apply', applied, ops=len(ops))
+        return len(ops)
+
+    def clear(self):
+        self.set_items([])
+
+    @Slot(int, result='QVariantMap')
+    def get(self, row):
+        if not 0 <= row < len(self._items):
+            return {}
+        item = self._items[row]
+        return {name: item.get(name, default) for name, default in _ROLE_DEFAULTS.items()}
+
+    @Slot(int, result='QVariantMap')
+    def rowLayout(self, columns):
+        """
+        Splits the items into grid rows for the QML ListView: each row is a section header or up to
+        `columns` shown items. Returns {'rows': [...], 'indices': [model rows of the shown items]}.
+        """
+        columns = max(1, columns)
+        rows = []
+        indices = []
+        current = None
+        for row, item in enumerate(self._items):
+            if item.get('isSeparator'):
+                rows.append({'isHeader': True, 'firstIndex': row, 'firstSlot': -1, 'itemCount': 0})
+                current = None
+                continue
+            if item.get('isHidden'):
+                continue
+            if current is None or current['itemCount'] >= columns:
+                current = {'isHeader': False, 'firstIndex': row, 'firstSlot': len(indices), 'itemCount': 0}
+                rows.append(current)
+            indices.append(row)
+            current['itemCount'] += 1
+        return {'rows': rows, 'indices': indices}
+
+    @Slot(result='QVariantList')
+    def layoutRoles(self):
+        """Roles whose changes move items between grid rows; any other change only touches its cells."""
+        return [_ROLE_IDS['isSeparator'], _ROLE_IDS['isHidden']]
+
+    @Slot(int, result=bool)
+    def toggleSection(self, row):
+        """Collapses/expands the section whose header is at row (hiding its items). Returns the new state."""
+        if not 0 <= row < len(self._items) or not self._items[row].get('isSeparator'):
+            return False
+        collapsed = not self._items[row].get('isCollapsed', False)
+        end = row + 1
+        while end < len(self._items) and not self._items[end].get('isSeparator'):
+            end += 1
+        self._items[row] = dict(self._items[row], isCollapsed=collapsed)
+        for i in range(row + 1, end):
+            self._items[i] = dict(self._items[i], isHidden=collapsed)
+        self.dataChanged.emit(self.index(row), self.index(row), [_ROLE_IDS['isCollapsed']])
+        if end > row + 1:
+            self.dataChanged.emit(self.index(row + 1), self.index(end - 1), [_ROLE_IDS['isHidden']])
+        return collapsed
@@ -0,0 +1,262 @@
+# FILE: gui/job_scheduler.py
+# PURPOSE: Agenda os workers em faixas (lanes) nomeadas, cada uma com seu próprio QThreadPool:
+#          lançamentos, interativa (consultas ao dispositivo), ícones visíveis e prefetch em segundo
+#          plano. Cada faixa segue a prioridade; jobs de um mesmo dispositivo podem ser serializados
+#          (adb), todos recebem um token de cancelamento e o agendador mede fila e latência.
+#          As faixas de ícones pausam automaticamente enquanto uma sessão do scrcpy está transmitindo.
+
+import time
+import heapq
+import itertools
+import threading
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+from utils import scrcpy_handler
+
+LANE_LAUNCH = 'launch'
+LANE_INTERACTIVE = 'interactive'
+LANE_VISIBLE = 'visible'
+LANE_PREFETCH = 'prefetch'
+
+# lane -> max concurrent jobs; launches and device queries never wait behind icon work
+_LANE_THREADS = {
+    LANE_LAUNCH: 4,
+    LANE_INTERACTIVE: 4,
+    LANE_VISIBLE: 3,
+    LANE_PREFETCH: 1,
+}
+# Lanes held back while scrcpy is streaming, so icon work doesn't compete with the session
+_STREAMING_PAUSED_LANES = (LANE_VISIBLE, LANE_PREFETCH)
+STREAMING_POLL_MS = 1500
+# Priority for jobs that should only run after everything else queued on their lane
+PRIORITY_IDLE = 1 << 30
+
+_instance = None
+
+
+def get_scheduler():
+    """The application's scheduler (created by the main window), for widgets without a main_window."""
+    return _instance
+
+
+def _emit_dropped_finished(worker):
+    """
+    Emits finished() for a worker that was dropped before it ran. Workers whose finished signal
+    carries a result (icons, folder launches) are left alone: their owners cancel them by tag and
+    reset their own state at the same time.
+    """
+    signals = getattr(worker, 'signals', None)
+    if signals is None or not hasattr(signals, 'finished'):
+        return
+    if signals.metaObject().indexOfSignal('finished()') != -1:
+        signals.finished.emit()
+
+
+class CancellationToken:
+    """Shared flag a worker can poll (worker.cancel_token) to stop early once its job is cancelled."""
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    def is_cancelled(self):
+        return self._event.is_set()
+
+
+class _JobSignals(QObject):
+    done = Signal(object)
+
+
+class _Job(QRunnable):
+    """Runs a worker inside a lane pool and reports back so the lane can start its next job."""
+    def __init__(self, worker, lane, tag, device, token, signals):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.worker = worker
+        self.lane = lane
+        self.tag = tag
+        self.device = device
+        self.token = token
+        self.signals = signals
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+        self.run_seconds = 0.0
+
+    def run(self):
+        began = time.monotonic()
+        try:
+            if not self.token.is_cancelled():
+                self.worker.run()
+            else:
+                # Cancelled between pool.start() and here: report it like a job dropped from the queue
+                _emit_dropped_finished(self.worker)
+        finally:
+            self.run_seconds = time.monotonic() - began
+            self.signals.done.emit(self)
+
+
+class JobScheduler(QObject):
+    paused_changed = Signal(bool)
+    job_finished = Signal(object)  # the worker, once per job (run to completion or dropped by cancel)
+
+    def __init__(self, parent=None):
+        global _instance
+        super().__init__(parent)
+        self._pools = {}
+        for lane, threads in _LANE_THREADS.items():
+            pool = QThreadPool(self)
+            pool.setMaxThreadCount(threads)
+            self._pools[lane] = pool
+        self._pending = {lane: [] for lane in _LANE_THREADS}  # lane -> heap of (priority, seq, job)
+        self._running = {lane: set() for lane in _LANE_THREADS}
+        self._busy_devices = set()
+        self._seq = itertools.count()
+        self._signals = _JobSignals()
+        self._signals.done.connect(self._on_job_done)
+        self._paused = False
+        self._stats = {lane: {'submitted': 0, 'completed': 0, 'cancelled': 0,
+                              'wait_total': 0.0, 'wait_max': 0.0, 'run_total': 0.0}
+                       for lane in _LANE_THREADS}
+
+        self._streaming_timer = QTimer(self)
+        self._streaming_timer.setInterval(STREAMING_POLL_MS)
+        self._streaming_timer.timeout.connect(self._check_streaming)
+        self._streaming_timer.start()
+        _instance = self
+
+    def submit(self, worker, lane=LANE_INTERACTIVE, priority=0, tag=None, device=None):
+        """
+        Queues a QRunnable-style worker on a lane; lower priority values run first. Jobs given the
+        same device id run one at a time. Returns the CancellationToken set on worker.cancel_token.
+        """
+        token = CancellationToken()
+        worker.cancel_token = token
+        job = _Job(worker, lane, tag, device, token, self._signals)
+        heapq.heappush(self._pending[lane], (priority, next(self._seq), job))
+        self._stats[lane]['submitted'] += 1
+        self._drain(lane)
+        return token
+
+    def cancel(self, tag=None, device=None):
+        """
+        Cancels the jobs matching a tag or a device: queued ones are dropped and their worker's
+        argument-less finished signal is emitted, so owners re-enable their widgets and release the
+        worker as if it had run; running ones get their token cancelled and finish on their own.
+        Returns how many queued jobs were dropped.
+        """
+        def matches(job):
+            return (tag is not None and job.tag == tag) or (device is not None and job.device == device)
+
+        dropped = []
+        for lane, heap in self._pending.items():
+            kept = [entry for entry in heap if not matches(entry[2])]
+            dropped.extend(entry[2] for entry in heap if matches(entry[2]))
+            heapq.heapify(kept)
+            self._pending[lane] = kept
+        for jobs in self._running.values():
+            for job in jobs:
+                if matches(job):
+                    job.token.cancel()
+        for job in dropped:
+            job.token.cancel()
+            self._stats[job.lane]['cancelled'] += 1
+            _emit_dropped_finished(job.worker)
+            self.job_finished.emit(job.worker)
+        return len(dropped)
+
+    def workers(self, tag):
+        """Workers submitted with this tag that are still queued or running."""
+        jobs = [entry[2] for heap in self._pending.values() for entry in heap]
+        jobs.extend(job for running in self._running.values() for job in running)
+        return [job.worker for job in jobs if job.tag == tag]
+
+    def pending_count(self, tag=None):
+        return sum(1 for heap in self._pending.values() for entry in heap if tag is None or entry[2].tag == tag)
+
+    def metrics(self):
+        """Per-lane queue depth, running jobs, counters and latency (queue wait / run time, ms)."""
+        result = {}
+        for lane, stats in self._stats.items():
+            completed = stats['completed']
+            result[lane] = {
+                'queued': len(self._pending[lane]),
+                'running': len(self._running[lane]),
+                'submitted': stats['submitted'],
+                'completed': completed,
+                'cancelled': stats['cancelled'],
+                'avg_wait_ms': round(stats['wait_total'] / completed * 1000, 1) if completed else 0.0,
+                'max_wait_ms': round(stats['wait_max'] * 1000, 1),
+                'avg_run_ms': round(stats['run_total'] / completed * 1000, 1) if completed else 0.0,
+            }
+        return result
+
+    def is_idle(self):
+        """True when no job is running or queued on any lane."""
+        return not any(self._running.values()) and not any(self._pending.values())
+
+    def is_paused(self):
+        return self._paused
+
+    def set_paused(self, paused):
+        if paused == self._paused:
+            return
+        self._paused = paused
+        self.paused_changed.emit(paused)
+        if not paused:
+            for lane in _STREAMING_PAUSED_LANES:
+                self._drain(lane)
+
+    def shutdown(self, timeout_ms=3000):
+        self._streaming_timer.stop()
+        for heap in self._pending.values():
+            for _, _, job in heap:
+                job.token.cancel()
+            heap.clear()
+        for running in self._running.values():
+            for job in running:
+                job.token.cancel()
+        for pool in self._pools.values():
+            pool.clear()
+            pool.waitForDone(timeout_ms)
+        for lane, lane_metrics in self.metrics().items():
+            print(f"[Scheduler] {lane}: {lane_metrics}")
+
+    def _check_streaming(self):
+        self.set_paused(scrcpy_handler.has_active_scrcpy_sessions())
+
+    def _drain(self, lane):
+        if self._paused and lane in _STREAMING_PAUSED_LANES:
+            return
+        heap = self._pending[lane]
+        blocked = []  # jobs waiting for their device to be free
+        while heap and len(self._running[lane]) < _LANE_THREADS[lane]:
+            entry = heapq.heappop(heap)
+            job = entry[2]
+            if job.device is not None and job.device in self._busy_devices:
+                blocked.append(entry)
+                continue
+            if job.device is not None:
+                self._busy_devices.add(job.device)
+            job.started_at = time.monotonic()
+            self._running[lane].add(job)
+            self._pools[lane].start(job)
+        for entry in blocked:
+            heapq.heappush(heap, entry)
+
+    def _on_job_done(self, job):
+        self._running[job.lane].discard(job)
+        stats = self._stats[job.lane]
+        wait = job.started_at - job.submitted_at
+        stats['completed'] += 1
+        stats['wait_total'] += wait
+        stats['wait_max'] = max(stats['wait_max'], wait)
+        stats['run_total'] += job.run_seconds
+        if job.device is not None:
+            self._busy_devices.discard(job.device)
+            # A device-serialized job may be waiting on another lane
+            for lane in self._pending:
+                self._drain(lane)
+        else:
+            self._drain(job.lane)
+        self.job_finished.emit(job.worker)
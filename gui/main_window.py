@@ -1,11 +1,6 @@
-import gc
 import os
-import weakref
-import asyncio
-import uvicorn
-import logging
 import time
-from PySide6.QtCore import Qt, QThreadPool, Signal, QThread, QEvent
+from PySide6.QtCore import Qt, Signal, QEvent, QTimer
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                                QPushButton, QTabWidget, QLineEdit, QMessageBox)
 from .common_widgets import DeviceSelectorDialog
@@ -15,64 +10,25 @@ from .scrcpy_tab import ScrcpyTab
 from .apps_tab import AppsTab
 from .scrcpy_session_manager_window_pyside import ScrcpySessionManagerWindow
 from .winlator_tab import WinlatorTab
-from .workers import DeviceMonitor, DeviceConfigLoaderWorker, DeviceUnlockCheckWorker, DeviceUnlockWorker
+from .workers import DeviceMonitor, DeviceConfigLoaderWorker, DeviceUnlockCheckWorker, DeviceUnlockWorker, WarmStandbyWorker
 from .dialogs import show_message_box, AdbWifiWindow
+from .job_scheduler import JobScheduler, LANE_INTERACTIVE, LANE_LAUNCH, LANE_PREFETCH, PRIORITY_IDLE
+from .base_grid_tab import warm_up_grid_qml, shared_quick_access_model
 from . import themes
 from .common_widgets import CustomTitleBar, CustomThemedInputDialog
 from utils.constants import *
-from utils import adb_handler
-import web_server
-
-class WebServerThread(QThread):
-    """
-    Thread to run the FastAPI web server with graceful shutdown using uvicorn.Server.
-    """
-    config_needs_reload = Signal() # Added for synchronization
-    def __init__(self, app_config, parent=None):
-        super().__init__(parent)
-        self.app_config = app_config
-        self.server = None
-        self._loop = None
-
-    def run(self):
-        try:
-            # Suppress all uvicorn logging
-            logging.getLogger("uvicorn").disabled = True
-            logging.getLogger("uvicorn.access").disabled = True
-            logging.getLogger("uvicorn.error").disabled = True
-
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
-
-            # Set the thread instance in the web_server module
-            web_server.set_thread_instance(self)
-
-            port = int(self.app_config.get('web_port', 8000))
-            config = uvicorn.Config(web_server.app, host="0.0.0.0", port=port, log_level="warning", access_log=False, loop="asyncio")
-            self.server = uvicorn.Server(config)
-
-            self._loop.run_until_complete(self.server.serve())
+from utils import adb_handler, memory_manager, startup_timeline, tracing
 
-        except Exception as e:
-            if "Event loop is closed" not in str(e):
-                 print(f"Web server thread crashed: {e}")
-        finally:
-            if self._loop and self._loop.is_running():
-                self._loop.close()
-            print("Web server event loop finished.")
+MEMORY_FLUSH_INTERVAL_MS = 2000
 
-
-    def stop(self):
-        """Gracefully signals the uvicorn server to shut down."""
-        if self.server and self.isRunning():
-            print("Requesting web server shutdown...")
-            self.server.should_exit = True
-            if not self.wait(5000):
-                print("Web server thread did not terminate gracefully within 5 seconds.")
-                # We do not call terminate() here as it can lead to resource leaks.
-                # Instead, we rely on the main application to eventually exit.
-
-            print("Web server thread has been stopped.")
+# Tabs in QTabWidget order: attribute name, class, translation key
+_TABS = (
+    ('apps_tab', AppsTab, 'apps'),
+    ('winlator_tab', WinlatorTab, 'winlator'),
+    ('scrcpy_tab', ScrcpyTab, 'config'),
+)
+_TAB_CLASSES = {name: tab_class for name, tab_class, _ in _TABS}
+_WINLATOR_TAB_INDEX = 1
 
 
 class MainWindow(QMainWindow):
@@ -86,8 +42,12 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.app = app
         self.app_config = app_config
-        self.thread_pool = QThreadPool.globalInstance()
-        self.active_workers = []
+        self.scheduler = JobScheduler(self)
+        # Batched memory cleanup: requests from anywhere are flushed here when the workers are idle
+        self._memory_timer = QTimer(self)
+        self._memory_timer.setInterval(MEMORY_FLUSH_INTERVAL_MS)
+        self._memory_timer.timeout.connect(self._flush_memory_when_idle)
+        self._memory_timer.start()
         self.web_server_thread = None
         self.web_config_window = None
         self.winlator_frontend_config_window = None
@@ -120,33 +80,28 @@ class MainWindow(QMainWindow):
         content_layout.setContentsMargins(10, 10, 10, 10)
 
         self.tabs = QTabWidget()
-        self.scrcpy_tab = ScrcpyTab(self.app_config, self)
-        self.apps_tab = AppsTab(self.app_config, self)
-        self.winlator_tab = WinlatorTab(self.app_config, self)
-        self.tabs.addTab(self.apps_tab, self.app_config.tr('main', 'tabs', key='apps'))
-        self.tabs.addTab(self.winlator_tab, self.app_config.tr('main', 'tabs', key='winlator'))
-        self.tabs.addTab(self.scrcpy_tab, self.app_config.tr('main', 'tabs', key='config'))
+        # Each tab page is an empty slot; the real tab is built on first use (see _get_tab)
+        self._built_tabs = {}
+        self._tab_slots = {}
+        self._idle_build_started = False
+        for name, _, tr_key in _TABS:
+            slot = QWidget()
+            slot_layout = QVBoxLayout(slot)
+            slot_layout.setContentsMargins(0, 0, 0, 0)
+            self._tab_slots[name] = slot
+            self.tabs.addTab(slot, self.app_config.tr('main', 'tabs', key=tr_key))
 
         if not self.app_config.get(CONF_SHOW_WINLATOR_TAB, True):
-            self.tabs.setTabVisible(1, False)
-
-        self.apps_tab.launch_requested.connect(
-            lambda pkg, name: self._handle_launch_request(pkg, name, 'app')
-        )
-        self.winlator_tab.launch_requested.connect(
-            lambda key, name: self._handle_launch_request(key, name, 'winlator')
-        )
+            self.tabs.setTabVisible(_WINLATOR_TAB_INDEX, False)
 
-        # Shared Quick Access model
-        self._qa_model = []
-        self._refresh_qa_model()
+        self.connected_devices = []
+        self.last_known_device_id = None
+        self._pending_config_loader = None
 
-        self.apps_tab.config_changed.connect(self.scrcpy_tab.update_profile_dropdown)
-        self.apps_tab.config_deleted.connect(self.scrcpy_tab.update_profile_dropdown)
-        self.winlator_tab.config_changed.connect(self.scrcpy_tab.update_profile_dropdown)
-        self.winlator_tab.config_deleted.connect(self.scrcpy_tab.update_profile_dropdown)
-        self.scrcpy_tab.theme_changed.connect(self.update_theme)
-        self.scrcpy_tab.config_updated_on_worker.connect(self._on_scrcpy_tab_config_ready)
+        # Only the tab shown at startup is built now; the others follow in idle time
+        self._get_tab('apps_tab')
+        startup_timeline.mark("apps tab built")
+        self.tabs.currentChanged.connect(self._on_current_tab_changed)
 
         self.device_btn = QPushButton(self.app_config.tr('main', 'no_device_msg'))
         self.device_btn.setObjectName("device_selector_btn")
@@ -186,9 +141,6 @@ class MainWindow(QMainWindow):
 
         self.update_theme()
 
-        self.connected_devices = []
-        self.last_known_device_id = None
-        self._pending_config_loader = None
         # Persistent device monitor thread
         self.device_monitor = DeviceMonitor(interval_ms=2000)
         self.device_monitor.device_changed.connect(self._handle_device_list_update)
@@ -200,6 +152,78 @@ class MainWindow(QMainWindow):
         if self.app_config.get('start_web_server_on_launch'):
             self.start_web_server()
 
+        QTimer.singleShot(0, self._build_tabs_in_idle_time)
+
+    @property
+    def apps_tab(self):
+        return self._get_tab('apps_tab')
+
+    @property
+    def winlator_tab(self):
+        return self._get_tab('winlator_tab')
+
+    @property
+    def scrcpy_tab(self):
+        return self._get_tab('scrcpy_tab')
+
+    def loaded_tabs(self, *names):
+        """Tabs already built (all, or only the given names), for updates that unbuilt tabs pick up when created."""
+        return [self._built_tabs[name] for name, _, _ in _TABS
+                if name in self._built_tabs and (not names or name in names)]
+
+    def _get_tab(self, name):
+        tab = self._built_tabs.get(name)
+        if tab is None:
+            tab = _TAB_CLASSES[name](self.app_config, self)
+            self._built_tabs[name] = tab
+            self._tab_slots[name].layout().addWidget(tab)
+            self._wire_tab(name, tab)
+        return tab
+
+    def _wire_tab(self, name, tab):
+        if name == 'apps_tab':
+            tab.launch_requested.connect(lambda pkg, item_name: self._handle_launch_request(pkg, item_name, 'app'))
+        elif name == 'winlator_tab':
+            tab.launch_requested.connect(lambda key, item_name: self._handle_launch_request(key, item_name, 'winlator'))
+        if name in ('apps_tab', 'winlator_tab'):
+            tab.config_changed.connect(self._on_profiles_changed)
+            tab.config_deleted.connect(self._on_profiles_changed)
+            self._refresh_qa_model()
+        elif name == 'scrcpy_tab':
+            tab.theme_changed.connect(self.update_theme)
+            tab.config_updated_on_worker.connect(self._on_scrcpy_tab_config_ready)
+            # Built after the device was loaded: fetch what _update_all_tabs_status would have
+            if self.last_known_device_id and self._pending_config_loader is None:
+                tab.refresh_device_info()
+
+    def _on_current_tab_changed(self, index):
+        page = self.tabs.widget(index)
+        for name, slot in self._tab_slots.items():
+            if slot is page:
+                self._get_tab(name)
+
+    def _build_tabs_in_idle_time(self):
+        """Builds the remaining tabs one per event-loop turn after the window is interactive."""
+        if not self._idle_build_started:
+            self._idle_build_started = True
+            startup_timeline.mark("window interactive")
+            warm_up_grid_qml()
+        pending = [name for name, _, _ in _TABS if name not in self._built_tabs
+                   and (name != 'winlator_tab' or self.tabs.isTabVisible(_WINLATOR_TAB_INDEX))]
+        if pending:
+            self._get_tab(pending[0])
+            startup_timeline.mark(f"{pending[0]} built (idle)")
+            QTimer.singleShot(0, self._build_tabs_in_idle_time)
+        else:
+            startup_timeline.report()
+
+    def _on_profiles_changed(self, *args):
+        for tab in self.loaded_tabs('scrcpy_tab'):
+            tab.update_profile_dropdown()
+
+    def _on_web_config_reloaded(self):
+        self.scrcpy_tab.on_config_reloaded()
+
     def retranslate_ui(self):
         """Updates all UI texts based on the current language."""
         self.title_bar.title_label.setText(self.app_config.tr('main', 'title'))
@@ -210,10 +234,9 @@ class MainWindow(QMainWindow):
         self.session_manager_button.setToolTip(self.app_config.tr('main', 'session_manager_tooltip'))
         self.device_btn.setToolTip(self.app_config.tr('main', 'device_selector_tooltip'))
 
-        # Retranslate tabs content
-        self.apps_tab.retranslate_ui()
-        self.winlator_tab.retranslate_ui()
-        self.scrcpy_tab.retranslate_ui()
+        # Retranslate tabs content (tabs not built yet start in the current language)
+        for tab in self.loaded_tabs():
+            tab.retranslate_ui()
 
         if self.adb_wifi_window:
             self.adb_wifi_window.retranslate_ui()
@@ -346,13 +369,15 @@ class MainWindow(QMainWindow):
         if self.is_web_server_running():
             return
 
-        # Lazy initialization
+        # Lazy initialization: the web stack is only loaded when the server is started
+        from .web_server_thread import WebServerThread
         self.web_server_thread = WebServerThread(self.app_config)
         # Connect the signal from the web server thread to the ScrcpyTab's reload slot
-        self.web_server_thread.config_needs_reload.connect(self.scrcpy_tab.on_config_reloaded)
+        self.web_server_thread.config_needs_reload.connect(self._on_web_config_reloaded)
+        # The thread reports the status itself: True once uvicorn listens, False if it fails or ends
+        self.web_server_thread.status_changed.connect(self.web_server_status_changed)
         self.web_server_thread.start()
-        self.web_server_status_changed.emit(True)
-        print("Web server started.")
+        print("Web server starting...")
 
     def stop_web_server(self):
         if not self.is_web_server_running():
@@ -385,18 +410,14 @@ class MainWindow(QMainWindow):
             self.adb_wifi_window.close()
 
         # 4. Stop workers in all tabs
-        self.scrcpy_tab.stop_all_workers()
-        self.apps_tab.stop_all_workers()
-        self.winlator_tab.stop_all_workers()
-
-        # 5. Clear active workers list
-        self.active_workers.clear()
+        for tab in self.loaded_tabs():
+            tab.stop_all_workers()
 
-        # 6. Clear and wait for the global thread pool
-        self.thread_pool.clear()
-        self.thread_pool.waitForDone(3000)
+        # 5. Cancel queued jobs and wait for the scheduler lanes
+        self.scheduler.shutdown(3000)
 
-        gc.collect()
+        self._memory_timer.stop()
+        print(f"[Memory] totals: {memory_manager.get_totals()}")
         print("Application closed successfully.")
         event.accept()
 
@@ -419,7 +440,7 @@ class MainWindow(QMainWindow):
                 lambda state: self._on_lock_state_result(state, item_key, item_name, launch_type, device_id))
             worker.signals.error.connect(
                 lambda msg: self._do_launch(item_key, item_name, launch_type))
-            self.start_worker(worker)
+            self.start_worker(worker, lane=LANE_LAUNCH)
         else:
             self._do_launch(item_key, item_name, launch_type)
 
@@ -437,7 +458,7 @@ class MainWindow(QMainWindow):
                     lambda: self._do_launch(item_key, item_name, launch_type))
                 worker.signals.error.connect(
                     lambda msg: self._do_launch(item_key, item_name, launch_type))
-                self.start_worker(worker)
+                self.start_worker(worker, lane=LANE_LAUNCH)
             else:
                 if ok and not pin:
                     show_message_box(self, self.app_config.tr('common', 'warning'), self.app_config.tr('main', 'unlock_skipped'), icon=QMessageBox.Warning)
@@ -453,23 +474,19 @@ class MainWindow(QMainWindow):
             self.winlator_tab.execute_launch(item_key, item_name)
 
     def _refresh_qa_model(self):
-        """Merge QA items from both tabs and push to both QML widgets."""
-        app_items = self.apps_tab.get_qa_items() if hasattr(self.apps_tab, 'get_qa_items') else []
-        win_items = self.winlator_tab.get_qa_items() if hasattr(self.winlator_tab, 'get_qa_items') else []
+        """Merge QA items from both tabs into the shared Quick Access model (both grids show it)."""
+        items = []
+        for tab in self.loaded_tabs('apps_tab', 'winlator_tab'):
+            items.extend(tab.get_qa_items())
         combined = sorted(
-            app_items + win_items,
+            items,
             key=lambda x: (
                 0 if x.get('is_launcher_shortcut') else 1,
                 x.get('name', '').lower()
             )
         )
-        self._qa_model = combined
-        for tab in [self.apps_tab, self.winlator_tab]:
-            if not tab.quick_widget:
-                continue
-            root = tab.quick_widget.rootObject()
-            if root:
-                root.setProperty("quickAccessModel", combined)
+        with tracing.span('qa.refresh', items=len(combined)):
+            shared_quick_access_model().set_items(combined)
 
     def update_theme(self):
         from PySide6.QtWidgets import QApplication
@@ -483,8 +500,8 @@ class MainWindow(QMainWindow):
         if self.winlator_frontend_config_window and self.winlator_frontend_config_window.isVisible():
             self.winlator_frontend_config_window.update_theme()
 
-        self.apps_tab.update_theme()
-        self.winlator_tab.update_theme()
+        for tab in self.loaded_tabs('apps_tab', 'winlator_tab'):
+            tab.update_theme()
 
     def minimize(self):
         self.showMinimized()
@@ -531,28 +548,27 @@ class MainWindow(QMainWindow):
     def set_winlator_tab_visible(self, visible):
         self.tabs.setTabVisible(1, visible)
 
-    def start_worker(self, worker):
-        self.active_workers.append(worker)
-        wr = weakref.ref(worker)
-        worker.signals.finished.connect(lambda *args, wr=wr: self._on_worker_finished(wr))
-        self.thread_pool.start(worker)
+    def start_worker(self, worker, priority=0, lane=LANE_INTERACTIVE, tag=None, device=None):
+        """
+        Runs a worker on a scheduler lane (launches on LANE_LAUNCH, icons on LANE_VISIBLE/LANE_PREFETCH).
+        Pass device for adb work that must not overlap on the same device. Returns the cancellation token.
+        """
+        return self.scheduler.submit(worker, lane=lane, priority=priority, tag=tag, device=device)
 
-    def _on_worker_finished(self, worker_ref):
-        worker = worker_ref()
-        if worker and worker in self.active_workers:
-            self.active_workers.remove(worker)
-        gc.collect()
+    def _flush_memory_when_idle(self):
+        memory_manager.flush_if_due(busy=not self.scheduler.is_idle())
 
     def _update_all_tabs_status(self, message=None):
+        # Tabs built later read the device state in their own __init__
         if message:
-            for i in range(self.tabs.count()):
-                tab = self.tabs.widget(i)
+            for tab in self.loaded_tabs():
                 if hasattr(tab, 'set_device_status_message'):
                     tab.set_device_status_message(message)
         else:
-            self.scrcpy_tab.refresh_device_info()
-            self.apps_tab.on_device_changed()
-            self.winlator_tab.on_device_changed()
+            for tab in self.loaded_tabs('scrcpy_tab'):
+                tab.refresh_device_info()
+            for tab in self.loaded_tabs('apps_tab', 'winlator_tab'):
+                tab.on_device_changed()
 
     def _handle_device_list_update(self, devices):
         """Called when the list of connected ADB devices changes."""
@@ -566,17 +582,13 @@ class MainWindow(QMainWindow):
             self._load_device_config(current_id)
         elif not current_id and old_selected is not None:
             self.last_known_device_id = None
-            self.active_workers.clear()
+            self.scheduler.cancel(device=old_selected)
             self._pending_config_loader = None
             self.app_config.load_config_for_device(None)
-            self._qa_model = []
-            for tab in [self.apps_tab, self.winlator_tab]:
-                root = tab.quick_widget.rootObject()
-                if root:
-                    root.setProperty("quickAccessModel", [])
+            shared_quick_access_model().clear()
             self._update_device_btn_text(None)
             self._update_all_tabs_status()
-            gc.collect()
+            memory_manager.request_cleanup('device_disconnected')
         elif current_id:
             self._update_device_btn_text(current_id)
         else:
@@ -624,23 +636,25 @@ class MainWindow(QMainWindow):
                 self._pending_config_loader.signals.finished.disconnect()
             except (TypeError, RuntimeError):
                 pass
-            if self._pending_config_loader in self.active_workers:
-                self.active_workers.remove(self._pending_config_loader)
+            self.scheduler.cancel(tag='device_config')
         config_loader_worker = DeviceConfigLoaderWorker(device_id, self.app_config)
         config_loader_worker.signals.result.connect(self._on_device_config_loaded)
         config_loader_worker.signals.error.connect(self._on_device_load_error)
         config_loader_worker.signals.finished.connect(self.resume_device_check)
         self._pending_config_loader = config_loader_worker
-        self.start_worker(config_loader_worker)
+        self.start_worker(config_loader_worker, tag='device_config', device=device_id)
 
     def _on_device_config_loaded(self, result_data, installed_apps_packages, winlator_shortcuts_on_device):
         self._pending_config_loader = None
         self.app_config.device_app_cache['installed_apps'] = installed_apps_packages
         self.app_config.device_app_cache['winlator_shortcuts'] = winlator_shortcuts_on_device
-        gc.collect()
+        memory_manager.request_cleanup('device_config_loaded')
         device_id = result_data.get("device_id")
         if device_id:
             self._update_device_btn_text(device_id)
+            if self.app_config.get(CONF_WARM_STANDBY, False):
+                # Idle pre-stage, off the device-serialized config load so the app list isn't delayed
+                self.start_worker(WarmStandbyWorker(device_id), priority=PRIORITY_IDLE, lane=LANE_PREFETCH, tag='warm_standby')
         self._update_all_tabs_status()
 
     def _on_device_load_error(self, error_message):
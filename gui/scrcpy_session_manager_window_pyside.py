@@ -1,9 +1,9 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTreeWidget, QTreeWidgetItem,
-    QMessageBox, QTextEdit
+    QMessageBox, QTextEdit, QMenu, QAbstractItemView
 )
 from PySide6.QtGui import QPixmap, QImage, QIcon
-from PySide6.QtCore import Qt, QTimer, Signal, QEvent
+from PySide6.QtCore import Qt, Signal, QEvent
 
 import os
 import shlex
@@ -12,18 +12,22 @@ import subprocess
 from utils.env_helper import get_clean_env
 from PIL import Image # Still need PIL for loading various image formats into QImage
 
-from utils import scrcpy_handler
+from utils import scrcpy_handler, window_manager
 from . import themes
 from .common_widgets import CustomTitleBar, CustomThemedDialog, CustomThemedConfirmationDialog
 
 class ScrcpySessionManagerWindow(QWidget):
     # Signal to emit when the window is closed
     windowClosed = Signal()
+    # Registry events arrive on launcher/wait threads; this queues them to the GUI thread
+    _sessionEvent = Signal(str, object)
 
     def __init__(self, app_config, parent_widget, parent_x, parent_y, parent_width, close_callback=None):
         super().__init__()
         self.app_config = app_config
         self.session_data_map = {}
+        self._session_items = {}  # pid -> QTreeWidgetItem
+        self._no_sessions_item = None
         self.parent_widget = parent_widget
         self.close_callback = close_callback
         self.setWindowTitle(self.app_config.tr('session_manager', 'title'))
@@ -60,6 +64,8 @@ class ScrcpySessionManagerWindow(QWidget):
         self.tree.setColumnCount(1)
         self.tree.setIndentation(0) # Remove indentation for cleaner look
         self.tree.setObjectName("session_tree_widget") # Add objectName
+        self.tree.setSelectionMode(QAbstractItemView.ExtendedSelection) # Several sessions can be tiled together
+        self.tree.setContextMenuPolicy(Qt.CustomContextMenu)
         content_layout.addWidget(self.tree)
 
         # Bottom command buttons
@@ -72,9 +78,14 @@ class ScrcpySessionManagerWindow(QWidget):
         self.command_button.setEnabled(False)
         self.command_button.setFixedSize(120, 30) # Fixed size for consistency
 
+        self.tile_button = QPushButton(self.app_config.tr('session_manager', 'tile_btn'))
+        self.tile_button.setEnabled(False)
+        self.tile_button.setFixedSize(80, 30)
+
         command_layout.addStretch() # Left stretch
         command_layout.addWidget(self.terminate_button)
         command_layout.addWidget(self.command_button)
+        command_layout.addWidget(self.tile_button)
         command_layout.addStretch() # Right stretch
 
         content_layout.addLayout(command_layout)
@@ -88,13 +99,10 @@ class ScrcpySessionManagerWindow(QWidget):
         self.default_icon_pixmap = self._load_icon("gui/placeholder.png")
         self.winlator_icon_pixmap = self._load_icon("gui/winlator_placeholder.png")
 
-        # Start auto-refresh timer
-        self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self.populate_sessions)
-        self.refresh_timer.start(5000) # Refresh every 5 seconds
-
-        # Initial population
-        self.populate_sessions()
+        # Initial population, then only the added/exited deltas from the session registry
+        self._sessionEvent.connect(self._on_session_event)
+        self._session_listener = self._sessionEvent.emit  # same object to unregister on close
+        self.populate_sessions(scrcpy_handler.add_session_listener(self._session_listener))
 
         # Apply theme from parent
         self.update_theme()
@@ -110,8 +118,9 @@ class ScrcpySessionManagerWindow(QWidget):
         self.title_bar.title_label.setText(self.app_config.tr('session_manager', 'title'))
         self.terminate_button.setText(self.app_config.tr('session_manager', 'kill_btn'))
         self.command_button.setText(self.app_config.tr('session_manager', 'check_command_btn'))
-        # Refresh the list to update "No active Scrcpy sessions" message if necessary
-        self.populate_sessions()
+        self.tile_button.setText(self.app_config.tr('session_manager', 'tile_btn'))
+        if self._no_sessions_item is not None:
+            self._no_sessions_item.setText(0, self.app_config.tr('session_manager', 'no_sessions'))
 
 
     def _load_icon(self, relative_path):
@@ -160,6 +169,8 @@ class ScrcpySessionManagerWindow(QWidget):
         self.tree.itemDoubleClicked.connect(self._focus_selected_session_window)
         self.terminate_button.clicked.connect(self._terminate_selected_session)
         self.command_button.clicked.connect(self._show_command_for_selected_session)
+        self.tile_button.clicked.connect(lambda: self._tile_sessions(0))
+        self.tree.customContextMenuRequested.connect(self._show_context_menu)
         self.parent_widget.installEventFilter(self) # Install event filter on parent for position tracking
 
     def eventFilter(self, obj, event):
@@ -182,14 +193,22 @@ class ScrcpySessionManagerWindow(QWidget):
         else:
             self.terminate_button.setEnabled(False)
             self.command_button.setEnabled(False)
+        self.tile_button.setEnabled(bool(self._session_items) and window_manager.is_available())
+
+    def _selected_pids(self):
+        return [item.data(0, Qt.UserRole) for item in self.tree.selectedItems()
+                if item.data(0, Qt.UserRole) in self.session_data_map]
 
     def _focus_selected_session_window(self, item):
-        """Brings the selected scrcpy window to the foreground using wmctrl."""
+        """Brings the selected scrcpy window to the foreground (by PID on X11, by title through wmctrl otherwise)."""
         pid = item.data(0, Qt.UserRole)
         session_data = self.session_data_map.get(pid)
         if not session_data:
             return
 
+        if window_manager.focus(pid):
+            return
+
         window_title = session_data.get('app_name')
         if not window_title:
             return
@@ -203,56 +222,97 @@ class ScrcpySessionManagerWindow(QWidget):
             # Fail silently if wmctrl is not available or if there's an error
             pass
 
-    def populate_sessions(self):
-        current_selection_id = None
-        if self.tree.selectedItems():
-            current_selection_id = self.tree.selectedItems()[0].data(0, Qt.UserRole) # Get PID from UserRole
+    def _tile_sessions(self, monitor):
+        """Tiles the selected sessions (all of them when one or none is selected) on a monitor."""
+        pids = self._selected_pids()
+        if len(pids) < 2:
+            pids = list(self._session_items)
+        window_manager.tile(pids, monitor)
 
-        self.tree.clear()
-        self.session_data_map.clear()
+    def _move_selected_to_monitor(self, monitor):
+        for pid in self._selected_pids():
+            window_manager.move_to_monitor(pid, monitor)
 
-        sessions = scrcpy_handler.get_active_scrcpy_sessions()
-
-        if not sessions:
-            item = QTreeWidgetItem(self.tree)
-            item.setText(0, self.app_config.tr('session_manager', 'no_sessions'))
-            self.tree.addTopLevelItem(item)
-            self.tree.clearSelection()
-            self._on_tree_select() # Update button states
+    def _show_context_menu(self, pos):
+        item = self.tree.itemAt(pos)
+        if item is None or item.data(0, Qt.UserRole) not in self.session_data_map:
             return
-
-        reselect_item = None
+        menu = QMenu(self)
+        menu.addAction(self.app_config.tr('session_manager', 'focus_action'),
+                       lambda: self._focus_selected_session_window(item))
+        monitors = window_manager.monitors()
+        if monitors:
+            tile_menu = menu.addMenu(self.app_config.tr('session_manager', 'tile_on'))
+            move_menu = menu.addMenu(self.app_config.tr('session_manager', 'move_to'))
+            for index in range(len(monitors)):
+                label = self.app_config.tr('session_manager', 'monitor', n=index + 1)
+                tile_menu.addAction(label, lambda index=index: self._tile_sessions(index))
+                move_menu.addAction(label, lambda index=index: self._move_selected_to_monitor(index))
+        menu.exec(self.tree.viewport().mapToGlobal(pos))
+
+    def populate_sessions(self, sessions):
+        """Fills the tree once; afterwards _on_session_event applies only the changes."""
+        self.tree.clear()
+        self.session_data_map.clear()
+        self._session_items.clear()
+        self._no_sessions_item = None
         for session in sessions:
-            icon_pixmap = None
-            if session.get('icon_path'):
-                icon_pixmap = self._load_icon(session['icon_path'])
-
-            if icon_pixmap is None:
-                if session.get('session_type') == 'winlator':
-                    icon_pixmap = self.winlator_icon_pixmap
-                else:
-                    icon_pixmap = self.default_icon_pixmap
-
-            item = QTreeWidgetItem(self.tree)
-            item.setText(0, session['app_name'])
-            item.setIcon(0, QIcon(icon_pixmap))
-            item.setData(0, Qt.UserRole, session['pid']) # Store PID in UserRole
-            self.tree.addTopLevelItem(item)
-            self.session_data_map[session['pid']] = session
-
-            if str(session['pid']) == str(current_selection_id):
-                reselect_item = item
-
-        if reselect_item:
-            reselect_item.setSelected(True)
-            self.tree.setCurrentItem(reselect_item)
-        elif self.tree.topLevelItemCount() > 0:
-            # Select the first item if no previous selection or previous selection is gone
+            self._add_session_item(session)
+        self._update_placeholder()
+        self._ensure_selection()
+
+    def _on_session_event(self, event, session):
+        if event == scrcpy_handler.SESSION_ADDED:
+            if session['pid'] in self._session_items:
+                return
+            self._add_session_item(session)
+        elif event == scrcpy_handler.SESSION_EXITED:
+            item = self._session_items.pop(session['pid'], None)
+            if item is None:
+                return
+            self.session_data_map.pop(session['pid'], None)
+            window_manager.forget(session['pid'])
+            self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(item))
+        self._update_placeholder()
+        self._ensure_selection()
+
+    def _add_session_item(self, session):
+        icon_pixmap = None
+        if session.get('icon_path'):
+            icon_pixmap = self._load_icon(session['icon_path'])
+
+        if icon_pixmap is None:
+            if session.get('session_type') == 'winlator':
+                icon_pixmap = self.winlator_icon_pixmap
+            else:
+                icon_pixmap = self.default_icon_pixmap
+
+        item = QTreeWidgetItem(self.tree)
+        item.setText(0, session['app_name'])
+        item.setIcon(0, QIcon(icon_pixmap))
+        item.setData(0, Qt.UserRole, session['pid']) # Store PID in UserRole
+        self.tree.addTopLevelItem(item)
+        self.session_data_map[session['pid']] = session
+        self._session_items[session['pid']] = item
+
+    def _update_placeholder(self):
+        """Shows the "no sessions" row only while the list is empty."""
+        if self._session_items and self._no_sessions_item is not None:
+            self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(self._no_sessions_item))
+            self._no_sessions_item = None
+        elif not self._session_items and self._no_sessions_item is None:
+            self._no_sessions_item = QTreeWidgetItem(self.tree)
+            self._no_sessions_item.setText(0, self.app_config.tr('session_manager', 'no_sessions'))
+            self._no_sessions_item.setFlags(Qt.ItemFlag.NoItemFlags)
+            self.tree.addTopLevelItem(self._no_sessions_item)
+
+    def _ensure_selection(self):
+        # The selected session stays selected; if it exited (or none was), select the first one
+        if not self.tree.selectedItems() and self._session_items:
             first_item = self.tree.topLevelItem(0)
             first_item.setSelected(True)
             self.tree.setCurrentItem(first_item)
-
-        self._on_tree_select() # Update button states after populating
+        self._on_tree_select() # Update button states
 
     def _terminate_selected_session(self):
         selected_items = self.tree.selectedItems()
@@ -276,7 +336,7 @@ class ScrcpySessionManagerWindow(QWidget):
                 QMessageBox.information(self.parent_widget, self.app_config.tr('common', 'success'), self.app_config.tr('session_manager', 'kill_success', name=app_name))
             else:
                 QMessageBox.critical(self.parent_widget, self.app_config.tr('common', 'error'), self.app_config.tr('session_manager', 'kill_error', name=app_name, pid=pid))
-            self.populate_sessions() # Refresh the list after terminating
+            # The row goes away with the registry's exited event
 
     def _show_command_for_selected_session(self):
         selected_items = self.tree.selectedItems()
@@ -289,6 +349,9 @@ class ScrcpySessionManagerWindow(QWidget):
 
         command_args = session_data.get('command_args', ["N/A"])
         command_str = shlex.join(command_args)
+        hook_log = scrcpy_handler.get_session_log(pid)
+        if hook_log:
+            command_str += "\n\n" + self.app_config.tr('session_manager', 'hook_log_header') + "\n" + "\n".join(hook_log)
 
         command_dialog = CustomThemedDialog(self, title=self.app_config.tr('session_manager', 'command_title', name=session_data['app_name']))
         command_dialog.setFixedSize(600, 200)
@@ -306,9 +369,8 @@ class ScrcpySessionManagerWindow(QWidget):
         command_dialog.exec()
 
     def closeEvent(self, event):
-        # Stop the refresh timer when the window is closed
-        if self.refresh_timer.isActive():
-            self.refresh_timer.stop()
+        # Stop listening to the session registry when the window is closed
+        scrcpy_handler.remove_session_listener(self._session_listener)
         
         # Clear resources to prevent leaks
         self.session_data_map.clear()
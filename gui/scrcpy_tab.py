@@ -1,5 +1,4 @@
-from PySide6.QtCore import Qt, QThreadPool, Signal, QRect, QPoint
-import weakref
+from PySide6.QtCore import Qt, Signal, QRect, QPoint
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
                                QLineEdit, QCheckBox, QSlider, QMessageBox,
                                QScrollArea, QSizePolicy, QPushButton, QGridLayout,
@@ -11,10 +10,13 @@ from .flow_layout import FlowLayout
 from .workers import DeviceInfoWorker, EncoderListWorker, DeviceConfigLoaderWorker
 from . import themes
 from utils.constants import *
+from utils import capability_cache
 from .dialogs import WebServerConfigWindow, WinlatorFrontendConfigWindow
 from .common_widgets import CustomThemedConfirmationDialog
 from .dialogs import show_message_box
 
+JOB_TAG = 'scrcpy_tab'
+
 
 class NoArrowScrollBar(QScrollBar):
     def subControlRect(self, control, option):
@@ -133,8 +135,6 @@ class ScrcpyTab(QWidget):
         self.option_checkboxes = {}
         self.sliders = {}
         self.section_cards = {}
-        self.thread_pool = QThreadPool.globalInstance()
-        self.active_workers = []
         self._setup_ui()
         self.app_config.load_profile(self.app_config.active_profile)
         self.update_profile_dropdown()
@@ -155,7 +155,7 @@ class ScrcpyTab(QWidget):
         worker.signals.result.connect(self._on_device_cache_refreshed)
         worker.signals.error.connect(self._on_cache_refresh_error)
         worker.signals.finished.connect(lambda: self._set_all_widgets_enabled(True))
-        self._start_worker(worker)
+        self._start_worker(worker, device=device_id)
 
     def _on_device_cache_refreshed(self, result_data, installed_apps_packages, winlator_shortcuts_on_device):
         self.update_profile_dropdown()
@@ -240,8 +240,8 @@ class ScrcpyTab(QWidget):
     def _on_rendering_option_changed(self, var_key, state):
         self.app_config.set(var_key, state)
         if self.main_window:
-            self.main_window.apps_tab.update_theme()
-            self.main_window.winlator_tab.update_theme()
+            for tab in self.main_window.loaded_tabs('apps_tab', 'winlator_tab'):
+                tab.update_theme()
 
     def _create_yascrcpy_card(self):
         card, layout = self._create_section_card('yascrcpy')
@@ -381,6 +381,8 @@ class ScrcpyTab(QWidget):
             CONF_STAY_AWAKE: 'stay_awake', CONF_MIPMAPS: 'disable_mipmaps',
             CONF_NO_AUDIO: 'no_audio', CONF_NO_VIDEO: 'no_video',
             CONF_TRY_UNLOCK: 'unlock_device', CONF_FORCE_ADB_FORWARD: 'force_adb_forward',
+            CONF_WARM_STANDBY: 'warm_standby',
+            CONF_AUTO_RESTART: 'auto_restart',
             ALTERNATE_LAUNCH_METHOD: 'alternate_launch',
         }
         for var_key, label_key in opt_trans.items():
@@ -843,6 +845,8 @@ class ScrcpyTab(QWidget):
             (self.app_config.tr('scrcpy_tab', 'options', key='no_video'), CONF_NO_VIDEO),
             (self.app_config.tr('scrcpy_tab', 'options', key='unlock_device'), CONF_TRY_UNLOCK),
             (self.app_config.tr('scrcpy_tab', 'options', key='force_adb_forward'), CONF_FORCE_ADB_FORWARD),
+            (self.app_config.tr('scrcpy_tab', 'options', key='warm_standby'), CONF_WARM_STANDBY),
+            (self.app_config.tr('scrcpy_tab', 'options', key='auto_restart'), CONF_AUTO_RESTART),
         ]
         for i, (text, var_key) in enumerate(config_checkboxes):
             checkbox = QCheckBox(text)
@@ -975,7 +979,7 @@ class ScrcpyTab(QWidget):
         worker = DeviceInfoWorker(device_id)
         worker.signals.result.connect(lambda info: self.on_device_info_ready(info, force_encoder_fetch))
         worker.signals.error.connect(self.on_device_info_error)
-        self._start_worker(worker)
+        self._start_worker(worker, device=device_id)
 
     def on_device_info_ready(self, info, force_encoder_fetch):
         self.last_device_info = info
@@ -985,22 +989,22 @@ class ScrcpyTab(QWidget):
             self.app_config.save_config()
         if default_launcher := info.get('default_launcher'):
             self.app_config.set(CONF_DEFAULT_LAUNCHER, default_launcher)
-        if force_encoder_fetch or not self.app_config.has_encoder_cache():
-            self._fetch_and_update_encoders()
-        else:
-            self._load_encoders_from_cache()
+        # Show what we already know right away; the worker revalidates against the build fingerprint
+        self._load_encoders_from_cache()
+        self._fetch_and_update_encoders(force=force_encoder_fetch)
         self.config_updated_on_worker.emit()
 
     def on_device_info_error(self, error_msg):
         self._load_encoders_from_cache()
 
-    def _fetch_and_update_encoders(self):
+    def _fetch_and_update_encoders(self, force=False):
         device_id = self.app_config.get_connection_id()
         if device_id == DEVICE_NOT_FOUND or device_id is None: return
-        worker = EncoderListWorker(device_id)
+        serial = self.app_config.get(CONF_DEVICE_ID) or device_id
+        worker = EncoderListWorker(self.app_config, serial, device_id, force=force)
         worker.signals.result.connect(self._on_encoders_ready)
         worker.signals.error.connect(self._on_encoder_fetch_error)
-        self._start_worker(worker)
+        self._start_worker(worker, device=device_id)
 
     def _on_encoder_fetch_error(self, err):
         device_id = self.app_config.get_connection_id()
@@ -1010,12 +1014,16 @@ class ScrcpyTab(QWidget):
                              icon=QMessageBox.Critical)
 
     def _on_encoders_ready(self, result):
+        if result == (self.video_encoders, self.audio_encoders):
+            return
         self.video_encoders, self.audio_encoders = result
-        self.app_config.save_encoder_cache(self.video_encoders, self.audio_encoders)
         self._populate_encoder_widgets()
 
     def _load_encoders_from_cache(self):
-        cached_data = self.app_config.get_encoder_cache()
+        cached_data = capability_cache.peek(self.app_config, self.app_config.get(CONF_DEVICE_ID), capability_cache.KIND_ENCODERS)
+        if cached_data is None:
+            # Per-device cache written by older versions
+            cached_data = self.app_config.get_encoder_cache()
         self.video_encoders = cached_data.get('video', {})
         self.audio_encoders = cached_data.get('audio', {})
         self._populate_encoder_widgets()
@@ -1133,19 +1141,14 @@ class ScrcpyTab(QWidget):
         if include_profile:
             self.profile_combo.setEnabled(enabled)
 
-    def _start_worker(self, worker):
-        self.active_workers.append(worker)
-        wr = weakref.ref(worker)
-        worker.signals.finished.connect(lambda *args, wr=wr: self._on_worker_finished(wr))
-        self.thread_pool.start(worker)
-
-    def _on_worker_finished(self, worker_ref):
-        worker = worker_ref()
-        if worker and worker in self.active_workers:
-            self.active_workers.remove(worker)
+    def _start_worker(self, worker, device=None):
+        if self.main_window:
+            self.main_window.start_worker(worker, tag=JOB_TAG, device=device)
 
     def stop_all_workers(self):
-        for worker in self.active_workers:
+        if not self.main_window:
+            return
+        for worker in self.main_window.scheduler.workers(JOB_TAG):
             try:
                 worker.signals.finished.disconnect()
             except (TypeError, RuntimeError):
@@ -1158,7 +1161,7 @@ class ScrcpyTab(QWidget):
                 worker.signals.error.disconnect()
             except (TypeError, RuntimeError):
                 pass
-        self.active_workers.clear()
+        self.main_window.scheduler.cancel(JOB_TAG)
 
     def select_profile(self, profile_key):
         self.update_profile_dropdown()
@@ -2,6 +2,7 @@
 # PURPOSE: Centralizes theme management for the application.
 
 from PySide6.QtGui import QPalette, QColor
+from PySide6.QtWidgets import QApplication
 import os
 import json
 
@@ -11,6 +12,18 @@ def is_dark_theme(palette):
     """Checks if the provided palette corresponds to a dark theme."""
     return palette.color(QPalette.ColorRole.Window).value() < 128
 
+# Rendered stylesheets by color set: themes and dialogs re-render the same ~370 lines otherwise
+_stylesheet_cache = {}
+
+
+def compile_stylesheet(colors):
+    """Returns the stylesheet for a color set, rendering it only the first time the colors are seen."""
+    fingerprint = tuple(sorted(colors.items()))
+    stylesheet = _stylesheet_cache.get(fingerprint)
+    if stylesheet is None:
+        stylesheet = _stylesheet_cache[fingerprint] = _build_stylesheet(colors)
+    return stylesheet
+
 def _build_stylesheet(colors):
     main_bg_color = colors['main_bg']
     title_text_color = colors['title_text']
@@ -399,17 +412,14 @@ def get_theme_stylesheet(palette):
         colors['button_hover'] = btn.lighter(140).name()
     else:
         colors['button_hover'] = btn.darker(115).name()
-    return _build_stylesheet(colors)
+    return compile_stylesheet(colors)
 
 def _load_json_theme_colors(name):
-    path = os.path.join(_THEMES_DIR, f'{name}.json')
-    with open(path) as f:
-        data = json.load(f)
-    return data['colors']
+    return _JSON_THEME_COLORS[name]
 
 def _json_theme_generator(palette, name):
     colors = _load_json_theme_colors(name)
-    return _build_stylesheet(colors)
+    return compile_stylesheet(colors)
 
 def apply_theme_to_custom_title_bar(title_bar, palette):
     """Applies specific styles to a CustomTitleBar."""
@@ -438,6 +448,9 @@ def _make_palette_from_colors(colors):
     return p
 
 
+# Theme colors by file name and by display name, parsed once at import
+_JSON_THEME_COLORS = {}
+
 def _discover_json_themes():
     themes = {}
     if not os.path.isdir(_THEMES_DIR):
@@ -448,6 +461,8 @@ def _discover_json_themes():
             with open(os.path.join(_THEMES_DIR, fname)) as f:
                 data = json.load(f)
             display_name = data.get('name', name)
+            _JSON_THEME_COLORS[name] = data['colors']
+            _JSON_THEME_COLORS.setdefault(display_name, data['colors'])
             themes[display_name] = lambda p, n=name: _json_theme_generator(p, n)
     return themes
 
@@ -468,13 +483,7 @@ def get_available_themes():
     return ["System"] + themes
 
 def _get_json_colors(theme_name):
-    for fname in os.listdir(_THEMES_DIR):
-        if fname.endswith('.json'):
-            with open(os.path.join(_THEMES_DIR, fname)) as f:
-                data = json.load(f)
-            if data.get('name') == theme_name or fname[:-5] == theme_name:
-                return data['colors']
-    return None
+    return _JSON_THEME_COLORS.get(theme_name)
 
 _THEME_COLORS_FILE = os.path.join(
     os.path.expanduser("~/.config/yaScrcpy"), "current_theme.json"
@@ -510,15 +519,26 @@ def _extract_web_colors(palette):
         'danger_hover': '#dc2626',
     }
 
+_saved_web_colors = None
+
 def _save_theme_colors_for_web(palette):
+    global _saved_web_colors
     try:
-        os.makedirs(os.path.dirname(_THEME_COLORS_FILE), exist_ok=True)
         colors = _extract_web_colors(palette)
+        if colors == _saved_web_colors:
+            return
+        os.makedirs(os.path.dirname(_THEME_COLORS_FILE), exist_ok=True)
         with open(_THEME_COLORS_FILE, 'w') as f:
             json.dump(colors, f)
+        _saved_web_colors = colors
     except Exception:
         pass
 
+def _set_stylesheet(widget, stylesheet):
+    """setStyleSheet re-parses and re-polishes the whole widget tree, so skip it when nothing changes."""
+    if widget.styleSheet() != stylesheet:
+        widget.setStyleSheet(stylesheet)
+
 def apply_theme(app, theme_name):
     """Applies a theme to the entire application."""
     global _current_theme, _original_system_palette
@@ -541,7 +561,7 @@ def apply_theme(app, theme_name):
             palette = QPalette(_original_system_palette)
     app.setPalette(palette)
     stylesheet = generator(palette)
-    app.setStyleSheet(stylesheet)
+    _set_stylesheet(app, stylesheet)
     _save_theme_colors_for_web(palette)
     return palette
 
@@ -556,12 +576,18 @@ def apply_stylesheet_to_window(window, theme_name=None):
     from .common_widgets import CustomTitleBar
 
     name = theme_name or _current_theme
-    palette = _make_palette_from_colors(_get_json_colors(name)) if name != "System" and _get_json_colors(name) else window.palette()
+    json_colors = _get_json_colors(name) if name != "System" else None
+    palette = _make_palette_from_colors(json_colors) if json_colors else window.palette()
     if name in THEMES:
         app_stylesheet = THEMES[name](palette)
     else:
         app_stylesheet = get_theme_stylesheet(palette)
-    window.setStyleSheet(app_stylesheet)
+    app = QApplication.instance()
+    if app is not None and app_stylesheet == app.styleSheet():
+        # Same rules as the application stylesheet, which the window already inherits
+        _set_stylesheet(window, "")
+    else:
+        _set_stylesheet(window, app_stylesheet)
     window.setPalette(palette)
 
     title_bar = window.findChild(CustomTitleBar, "CustomTitleBar")
@@ -0,0 +1,80 @@
+# FILE: gui/web_server_thread.py
+# PURPOSE: Thread que executa o servidor web (FastAPI/uvicorn). O módulo só é importado quando o
+#          servidor é iniciado, e o próprio stack web só é carregado dentro da thread, para que a
+#          inicialização da interface não pague por ele.
+
+import asyncio
+import logging
+from PySide6.QtCore import QThread, Signal
+
+
+class WebServerThread(QThread):
+    """
+    Thread to run the FastAPI web server with graceful shutdown using uvicorn.Server.
+    """
+    config_needs_reload = Signal() # Added for synchronization
+    status_changed = Signal(bool) # True once uvicorn is listening, False when the thread ends
+    def __init__(self, app_config, parent=None):
+        super().__init__(parent)
+        self.app_config = app_config
+        self.server = None
+        self._loop = None
+
+    def run(self):
+        port = None
+        try:
+            # The web stack (FastAPI, uvicorn, pydantic) is only imported once the server starts
+            import uvicorn
+            import web_server
+
+            # Suppress all uvicorn logging
+            logging.getLogger("uvicorn").disabled = True
+            logging.getLogger("uvicorn.access").disabled = True
+            logging.getLogger("uvicorn.error").disabled = True
+
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+
+            # Set the thread instance in the web_server module
+            web_server.set_thread_instance(self)
+
+            port = int(self.app_config.get('web_port', 8000))
+            config = uvicorn.Config(web_server.app, host="0.0.0.0", port=port, log_level="warning", access_log=False, loop="asyncio")
+            thread = self
+
+            class _Server(uvicorn.Server):
+                async def startup(self, sockets=None):
+                    await super().startup(sockets=sockets)
+                    if self.started:
+                        thread.status_changed.emit(True)
+
+            self.server = _Server(config)
+
+            self._loop.run_until_complete(self.server.serve())
+            if not self.server.started:
+                print(f"Web server could not start on port {port}.")
+
+        except SystemExit:
+            # uvicorn exits instead of raising when it cannot bind the port
+            print(f"Web server could not start: port {port} is unavailable.")
+        except Exception as e:
+            if "Event loop is closed" not in str(e):
+                 print(f"Web server thread crashed: {e}")
+        finally:
+            self.status_changed.emit(False)
+            if self._loop and self._loop.is_running():
+                self._loop.close()
+            print("Web server event loop finished.")
+
+
+    def stop(self):
+        """Gracefully signals the uvicorn server to shut down."""
+        if self.server and self.isRunning():
+            print("Requesting web server shutdown...")
+            self.server.should_exit = True
+            if not self.wait(5000):
+                print("Web server thread did not terminate gracefully within 5 seconds.")
+                # We do not call terminate() here as it can lead to resource leaks.
+                # Instead, we rely on the main application to eventually exit.
+
+            print("Web server thread has been stopped.")
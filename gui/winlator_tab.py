@@ -1,29 +1,27 @@
 import os
 import tempfile
-import queue
 
 from PySide6.QtWidgets import (QHBoxLayout, QMessageBox)
-from PySide6.QtCore import Qt, Slot, QUrl, QTimer
+from PySide6.QtCore import Slot, QUrl, QTimer
 import time
-import gc
 
 from utils.constants import *
+from utils import icon_store, icon_failures, memory_manager
 from .workers import GameListWorker, IconExtractorWorker, WinlatorLaunchWorker, ScrcpyLaunchWorker
 from .dialogs import show_message_box
 from .base_grid_tab import BaseGridTab
-from .common_widgets import CustomThemedProgressDialog
+from .job_scheduler import LANE_LAUNCH
+
+ICON_JOB_TAG = 'winlator_icons'
 
 class WinlatorTab(BaseGridTab):
     def __init__(self, app_config, main_window=None):
         super().__init__(app_config, main_window)
         self.all_games_data = []
         self.game_items = {}
+        self._game_items_device = None  # device whose games game_items holds
         self.temp_dir = tempfile.gettempdir()
-        self.extraction_queue = queue.Queue()
-        self.icon_extractor_workers = []
-        self.total_tasks = 0
-        self.completed_tasks_count = 0
-        self.NUM_WORKERS = 2
+        self.pending_icon_extractions = set()
         self.scrcpy_process = None
         self.icon_cache_dir = self.app_config.get_icon_cache_dir()
 
@@ -49,10 +47,11 @@ class WinlatorTab(BaseGridTab):
         self.on_device_changed()
 
     def stop_all_workers(self):
-        if not hasattr(self, 'extraction_queue'):
+        if not hasattr(self, 'pending_icon_extractions'):
             return
         print("Stopping WinlatorTab workers...")
-        self._drain_queue(self.extraction_queue, self.NUM_WORKERS)
+        self._cancel_icon_jobs(ICON_JOB_TAG)
+        self.pending_icon_extractions.clear()
         self.scrcpy_launch_worker = None
         self.winlator_launch_worker = None
         self.scrcpy_process = None
@@ -66,8 +65,8 @@ class WinlatorTab(BaseGridTab):
         self.folders_action.setText(self.app_config.tr('apps_tab', 'folders_btn'))
         # Update strings in QML
         self.update_strings()
-        # Re-populate to update separators and other texts
-        self.populate_games_grid_model(list(self.game_items.values()))
+        # Re-render to update separators and other texts
+        self._render_games_grid()
 
     def _connect_tab_signals(self, root):
         root.launchRequested.connect(self._on_qml_launch_requested)
@@ -80,14 +79,16 @@ class WinlatorTab(BaseGridTab):
 
 
     def _on_quick_access_updated(self, key, new_pinned):
-        self.populate_games_grid_model(list(self.game_items.values()))
+        if key in self.game_items:
+            self.game_items[key]['pinned'] = new_pinned
+        self._render_games_grid()
 
     def on_device_changed(self):
         self.all_games_data = []
         device_id = self.app_config.get_connection_id()
+        self.game_items.clear()
+        self._game_items_device = None
         if not device_id or device_id == "no_device":
-            self.game_items.clear()
-            self._qa_items_cache = []
             self.show_message(self.app_config.tr('scrcpy_tab', 'labels', key='please_connect'))
             self._clear_grid()
             self._unload_qml()
@@ -116,39 +117,53 @@ class WinlatorTab(BaseGridTab):
             return
 
         self.menu_button.setEnabled(False)
-        self._clear_grid()
-        self.show_message(self.app_config.tr('winlator_tab', 'searching_games'))
+        cached_records = self.app_config.get_app_list_cache().get('winlator_games', [])
+        # Deltas only apply to a grid built from this device's cache; anything else is rebuilt
+        rebuild = not self.game_items or not cached_records or self._game_items_device != device_id
+        if rebuild:
+            self.game_items.clear()
+            self._clear_grid()
+            self.show_message(self.app_config.tr('winlator_tab', 'searching_games'))
 
-        self.game_list_worker = GameListWorker(device_id)
-        self.game_list_worker.signals.result.connect(self._on_game_list_loaded)
+        self.game_list_worker = GameListWorker(device_id, cached_records)
+        self.game_list_worker.signals.result.connect(
+            lambda result, rebuild=rebuild: self._on_game_list_loaded(result, rebuild, device_id))
         self.game_list_worker.signals.error.connect(self._on_game_list_error)
         self.game_list_worker.signals.finished.connect(lambda: self.menu_button.setEnabled(True))
         self.game_list_worker.signals.finished.connect(self._on_game_list_worker_finished)
         if self.main_window:
-            self.main_window.start_worker(self.game_list_worker)
+            self.main_window.start_worker(self.game_list_worker, device=device_id)
 
-    def _on_game_list_loaded(self, games_with_pkg):
+    def _on_game_list_loaded(self, sync_result, rebuild=False, device_id=None):
+        if device_id is not None and device_id != self.app_config.get_connection_id():
+            return  # The device changed while the list was loading; its games belong to the old one
+        games_with_pkg = sync_result.records
         if not games_with_pkg:
+            self.game_items.clear()
+            self._clear_grid()
             self.show_message(self.app_config.tr('winlator_tab', 'no_shortcuts'))
-        else:
+        elif rebuild or not self.game_items:
             self.populate_games_grid_model(games_with_pkg)
             self.show_grid()
-        
-        # Save to cache
-        cache = self.app_config.get_app_list_cache()
-        cache['winlator_games'] = games_with_pkg
-        self.app_config.save_app_list_cache(cache)
+        elif sync_result.changed:
+            self._apply_game_list_delta(sync_result)
+            self.show_grid()
+
+        # Save to cache only when something (content or fingerprint) moved
+        if sync_result.changed or sync_result.fingerprints_changed:
+            cache = self.app_config.get_app_list_cache()
+            cache['winlator_games'] = games_with_pkg
+            self.app_config.save_app_list_cache(cache)
         
         # Synchronize memory cache for ScrcpyTab profile filtering
         self.app_config.device_app_cache['winlator_shortcuts'] = {g['path'] for g in games_with_pkg}
 
         self.menu_button.setEnabled(True)
-        gc.collect()
+        memory_manager.request_cleanup('game_list_loaded')
 
     def _on_game_list_error(self, error_msg):
         self.show_message(f"{self.app_config.tr('common', 'error')}: {error_msg}")
         self.menu_button.setEnabled(True)
-        gc.collect()
 
     def _on_game_list_worker_finished(self):
         self.game_list_worker = None
@@ -156,15 +171,53 @@ class WinlatorTab(BaseGridTab):
     def populate_games_grid_model(self, games):
         self.all_games_data = []
         self.game_items = {} # Reset game_items for new population
+        self._game_items_device = self.app_config.get_connection_id()
+        for game_info in games:
+            game_path = game_info.get('path') or game_info.get('key', '')
+            self.game_items[game_path] = self._make_game_item(game_info)
+        self._render_games_grid()
+
+    def _apply_game_list_delta(self, sync_result):
+        """Applies the sync deltas to game_items; unchanged games keep their resolved icon and metadata."""
+        for game_path in sync_result.removed:
+            self.game_items.pop(game_path, None)
+        for game_info in sync_result.added + sync_result.updated:
+            self.game_items[game_info['path']] = self._make_game_item(game_info)
+        self._render_games_grid()
+
+    def _make_game_item(self, game_info):
+        game_path = game_info.get('path') or game_info.get('key', '')
+        game_name = game_info.get('name', 'Unnamed')
+        pkg = game_info.get('pkg', 'com.winlator.cmod') # Default to cmod if pkg is missing
+
+        metadata = self.app_config.get_app_metadata(game_path)
+
+        icon_url = QUrl.fromLocalFile(self.placeholder_icon_path).toString()
+        cached_icon_path = icon_store.resolve_winlator_icon(self.app_config, game_path, metadata) if game_path else None
+        if cached_icon_path:
+            mtime = int(os.path.getmtime(cached_icon_path))
+            icon_url = QUrl.fromLocalFile(cached_icon_path).toString() + f"?t={mtime}"
+
+        pinned_val = metadata.get('pinned', "")
+        if not isinstance(pinned_val, str): pinned_val = ""
+
+        return {
+            'key': game_path,
+            'name': game_name,
+            'item_type': "winlator_game",
+            'icon_path': icon_url,
+            'pkg': pkg,
+            'pinned': pinned_val,
+            'isHidden': False
+        }
+
+    def _render_games_grid(self):
         quick_access_items = []
 
         # Group games by their 'pkg' (which represents the Winlator CMOD version)
         grouped_games = {}
-        for game_info in games:
-            pkg = game_info.get('pkg', 'com.winlator.cmod') # Default to cmod if pkg is missing
-            if pkg not in grouped_games:
-                grouped_games[pkg] = []
-            grouped_games[pkg].append(game_info)
+        for game_data in self.game_items.values():
+            grouped_games.setdefault(game_data['pkg'], []).append(game_data)
         
         # Sort packages (e.g., cmod first, then by version string)
         sorted_packages = sorted(grouped_games.keys(), key=lambda p: (0 if p == 'com.winlator.cmod' else 1, p))
@@ -192,44 +245,17 @@ class WinlatorTab(BaseGridTab):
                 'key': f"sep_{display_name}"
             })
 
-            for game_info in games_in_pkg:
-                game_path = game_info.get('path') or game_info.get('key', '')
-                game_name = game_info.get('name', 'Unnamed')
-                
-                icon_url = QUrl.fromLocalFile(self.placeholder_icon_path).toString()
-                if game_path:
-                    icon_key = os.path.basename(game_path)
-                    cached_icon_path = os.path.join(self.app_config.get_icon_cache_dir(), f"{icon_key}.png")
-                    if os.path.exists(cached_icon_path):
-                        mtime = int(os.path.getmtime(cached_icon_path))
-                        icon_url = QUrl.fromLocalFile(cached_icon_path).toString() + f"?t={mtime}"
-
-                metadata = self.app_config.get_app_metadata(game_path)
-                pinned_val = metadata.get('pinned', "")
-                if not isinstance(pinned_val, str): pinned_val = ""
-                
-                game_data = {
-                    'key': game_path,
-                    'name': game_name,
-                    'item_type': "winlator_game",
-                    'icon_path': icon_url,
-                    'pkg': pkg,
-                    'pinned': pinned_val,
-                    'isHidden': is_collapsed
-                }
-                
-                if CONF_QUICK_ACCESS in pinned_val.split(','):
+            for game_data in games_in_pkg:
+                game_data['isHidden'] = is_collapsed
+                if CONF_QUICK_ACCESS in game_data['pinned'].split(','):
                     quick_access_items.append(game_data)
+                # Copy so _update_grid_model can tell a changed model from the previous one
+                qml_model_data.append(dict(game_data))
 
-                qml_model_data.append(game_data)
-                self.game_items[game_path] = game_data
-
-        # Cache QA items and refresh shared model
-        self._qa_items_cache = sorted(quick_access_items, key=lambda x: x['name'].lower())
-        self._refresh_qa_model()
+        # Cache QA items; the shared model only refreshes when they changed
+        self._set_qa_items(sorted(quick_access_items, key=lambda x: x['name'].lower()))
 
         self._update_grid_model(qml_model_data)
-        gc.collect()
 
     @Slot(str, str)
     def on_settings_requested(self, itemKey, itemType):
@@ -254,7 +280,7 @@ class WinlatorTab(BaseGridTab):
             self.game_items[key]['icon_path'] = new_icon_url
 
     def _refresh_after_icon_update(self):
-        self.populate_games_grid_model(list(self.game_items.values()))
+        self._render_games_grid()
 
     def _on_custom_icon_error(self, key, error_message):
         game_name = self.game_items.get(key, {}).get('name', key)
@@ -284,19 +310,15 @@ class WinlatorTab(BaseGridTab):
                 show_message_box(self, self.app_config.tr('common', 'warning'), self.app_config.tr('apps_tab', 'delete_not_found', name=game_name), icon=QMessageBox.Warning, app_icon_path=icon_path)
 
     def _get_game_icon_path(self, game_path):
-        icon_key = os.path.basename(game_path)
-        icon_path = os.path.join(self.app_config.get_icon_cache_dir(), f"{icon_key}.png")
-        return icon_path if os.path.exists(icon_path) else None
+        return icon_store.resolve_winlator_icon(self.app_config, game_path)
 
     def prompt_for_icon_update(self):
         missing_icons = []
         for path, item_data in self.game_items.items():
-            icon_key = os.path.basename(path)
-            cached_icon_path = os.path.join(self.app_config.get_icon_cache_dir(), f"{icon_key}.png")
-            if not os.path.exists(cached_icon_path):
-                metadata = self.app_config.get_app_metadata(path)
-                if not metadata.get('exe_icon_fetch_failed') and not metadata.get('has_custom_icon'):
-                    missing_icons.append((path, cached_icon_path))
+            metadata = self.app_config.get_app_metadata(path)
+            if not icon_store.resolve_winlator_icon(self.app_config, path, metadata):
+                if icon_failures.is_retry_due(metadata, icon_failures.KIND_EXE) and not metadata.get('has_custom_icon'):
+                    missing_icons.append(path)
 
         if not missing_icons:
             show_message_box(self, self.app_config.tr('common', 'info'), self.app_config.tr('winlator_tab', 'no_icons_to_extract'), icon=QMessageBox.Information)
@@ -311,62 +333,34 @@ class WinlatorTab(BaseGridTab):
             self.start_icon_extraction_flow(missing_icons)
 
     def start_icon_extraction_flow(self, tasks):
-        self.total_tasks = len(tasks)
-        self.completed_tasks_count = 0
-        self._extraction_finished = False
-        self.progress_dialog = CustomThemedProgressDialog(self.app_config.tr('winlator_tab', 'extracting_icons'), None, 0, self.total_tasks, self)
-        # Ensure it has the method; if it's the class in common_widgets, it definitely has it.
-        # Maybe the reference is not what we think it is.
-        self.progress_dialog.setWindowFlags(self.progress_dialog.windowFlags() | Qt.WindowStaysOnTopHint)
-        self.progress_dialog.title_bar.minimize_button.setVisible(False)
-        self.progress_dialog.title_bar.close_button.setVisible(False)
-        self.progress_dialog.setValue(0)
-        self.progress_dialog.show()
-
-        self.icon_extractor_workers = []
-        for _ in range(self.NUM_WORKERS):
-            worker = IconExtractorWorker(self.extraction_queue, self.app_config, self.temp_dir, self.placeholder_icon_path, self.app_config.get_connection_id())
+        """Queues one extraction per shortcut on the scheduler; icons fill in as they arrive."""
+        tasks = [path for path in tasks if path not in self.pending_icon_extractions]
+        workers = {}
+        for path in tasks:
+            worker = IconExtractorWorker(path, self.app_config, self.temp_dir, self.placeholder_icon_path, self.app_config.get_connection_id())
             worker.signals.icon_extracted.connect(self._on_icon_extracted)
             worker.signals.error.connect(self._on_icon_extraction_error)
-            self.icon_extractor_workers.append(worker)
-            if self.main_window: self.main_window.start_worker(worker)
-
-        for task in tasks: self.extraction_queue.put(task)
-        for _ in range(self.NUM_WORKERS): self.extraction_queue.put(None)
+            workers[path] = worker
+        self.pending_icon_extractions.update(workers)
+        self._submit_icon_jobs(workers, ICON_JOB_TAG)
 
     def _on_icon_extracted(self, path, success, new_icon_path=None):
-        self.completed_tasks_count += 1
-        try:
-            self.progress_dialog.setValue(self.completed_tasks_count)
-            self.progress_dialog.setLabelText(self.app_config.tr('winlator_tab', 'processing_icons', current=self.completed_tasks_count, total=self.total_tasks))
-        except RuntimeError:
-            pass
-
+        self.pending_icon_extractions.discard(path)
         if path in self.game_items and success and new_icon_path:
             self.game_items[path]['icon_path'] = QUrl.fromLocalFile(new_icon_path).toString()
-        
-        if self.completed_tasks_count >= self.total_tasks:
+
+        if not self.pending_icon_extractions:
             self._finish_extraction()
+        elif success:
+            self._schedule_icon_refresh()
 
     def _on_icon_extraction_error(self, path, error_msg):
         print(f"Error extracting icon for {path}: {error_msg}")
-        # _on_icon_extracted will also be called via the worker's finally block,
-        # so we do NOT increment completed_tasks_count here to avoid double-counting.
+        # _on_icon_extracted is also emitted from the worker's finally block, which settles the task.
 
     def _finish_extraction(self):
-        if getattr(self, '_extraction_finished', False):
-            return
-        self._extraction_finished = True
-        if hasattr(self, 'progress_dialog') and self.progress_dialog is not None:
-            try:
-                if self.progress_dialog.isVisible():
-                    self.progress_dialog.close()
-            except RuntimeError:
-                pass
-        show_message_box(self, self.app_config.tr('common', 'success'), self.app_config.tr('winlator_tab', 'extraction_finished'))
-        self.icon_extractor_workers.clear()
-        self.populate_games_grid_model(list(self.game_items.values()))
-        gc.collect()
+        self._render_games_grid()
+        memory_manager.request_cleanup('icon_extraction')
 
     def execute_launch(self, shortcut_path, game_name):
         game_info = self.game_items.get(shortcut_path)
@@ -399,11 +393,12 @@ class WinlatorTab(BaseGridTab):
             session_type='winlator'
         )
         self.scrcpy_launch_worker.signals.error.connect(lambda msg: self._on_scrcpy_launch_error(msg, icon_path))
+        self.scrcpy_launch_worker.signals.hook_failed.connect(lambda msg: show_message_box(self, self.app_config.tr('apps_tab', 'hook_failed_title'), msg, icon=QMessageBox.Warning, app_icon_path=icon_path))
         self.scrcpy_launch_worker.signals.scrcpy_process_started.connect(self._on_scrcpy_process_started)
         self.scrcpy_launch_worker.signals.display_id_found.connect(self._on_display_id_found)
         self.scrcpy_launch_worker.signals.finished.connect(self._on_scrcpy_launch_worker_finished)
         if self.main_window:
-            self.main_window.start_worker(self.scrcpy_launch_worker)
+            self.main_window.start_worker(self.scrcpy_launch_worker, lane=LANE_LAUNCH)
 
     def _on_scrcpy_launch_error(self, error_msg, icon_path=None):
         show_message_box(self, self.app_config.tr('apps_tab', 'scrcpy_error_title'), f"{self.app_config.tr('common', 'error')}: {error_msg}", icon=QMessageBox.Critical, app_icon_path=icon_path)
@@ -435,7 +430,7 @@ class WinlatorTab(BaseGridTab):
         self.winlator_launch_worker.signals.error.connect(lambda msg: show_message_box(self, self.app_config.tr('apps_tab', 'winlator_launch_error_title'), msg, icon=QMessageBox.Critical, app_icon_path=icon_path))
         self.winlator_launch_worker.signals.finished.connect(self._on_winlator_launch_worker_finished)
         if self.main_window:
-            self.main_window.start_worker(self.winlator_launch_worker)
+            self.main_window.start_worker(self.winlator_launch_worker, lane=LANE_LAUNCH)
 
     def _on_winlator_launch_worker_finished(self):
         self.winlator_launch_worker = None
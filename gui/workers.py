@@ -1,12 +1,12 @@
 from PySide6.QtCore import QObject, Signal, QRunnable, QThread
-from utils import scrcpy_handler, icon_scraper, adb_handler
+from utils import scrcpy_handler, icon_scraper, adb_handler, capability_cache, winlator_sync, icon_store, icon_failures, window_manager
 from utils.constants import CONF_UPDATE_APPS_ON_STARTUP
 import re
 import os
 import time
 import subprocess
 import shlex
-import queue
+import uuid
 import select
 from utils.env_helper import get_clean_env
 from utils.isolated_extractor import extract_icon_in_process
@@ -64,10 +64,14 @@ class IconWorker(QRunnable):
 
     def run(self):
         try:
+            # get_icon records success/failure (with its class) in the metadata
             icon_path = icon_scraper.get_icon(self.app_name, self.pkg_name, self.cache_dir, self.app_config)
             if icon_path:
                 self.signals.finished.emit(self.pkg_name, icon_path) # Emit path string instead of QPixmap
+            else:
+                self.signals.error.emit(self.pkg_name, "Icon not found or could not be downloaded.")
         except Exception as e:
+            icon_failures.record_failure(self.app_config, self.pkg_name, icon_failures.KIND_APP, icon_failures.FAILURE_OTHER)
             self.signals.error.emit(self.pkg_name, str(e))
 
 class ScrcpyLaunchWorkerSignals(QObject):
@@ -75,6 +79,7 @@ class ScrcpyLaunchWorkerSignals(QObject):
     finished = Signal()
     error = Signal(str)
     display_id_found = Signal(str, str, str)
+    hook_failed = Signal(str)
 
 class ScrcpyLaunchWorker(QRunnable):
     def __init__(self, config_values, window_title, connection_id, icon_path, session_type):
@@ -91,7 +96,8 @@ class ScrcpyLaunchWorker(QRunnable):
             process = scrcpy_handler.launch_scrcpy(
                 config_values=self.config_values, window_title=self.window_title,
                 device_id=self.connection_id, icon_path=self.icon_path, session_type=self.session_type,
-                capture_output=(self.session_type in ['winlator', 'app_alt_launch'])
+                capture_output=(self.session_type in ['winlator', 'app_alt_launch']),
+                on_hook_failure=self._on_hook_failure
             )
 
             scrcpy_handler.add_active_scrcpy_session(
@@ -135,8 +141,96 @@ class ScrcpyLaunchWorker(QRunnable):
         finally:
             self.signals.finished.emit()
 
+    def _on_hook_failure(self, result):
+        # Called from the hook threads, possibly long after run() returned (POST hooks)
+        self.signals.hook_failed.emit(f"{result.hook.phase}:: {result.hook.command}\n{result.describe_failure()}")
+
+# Pause between the sessions of a folder launch, so the device doesn't start every encoder at once
+FOLDER_LAUNCH_STAGGER_S = 1.0
+# How long a folder launch waits for its windows to be mapped before re-tiling them
+FOLDER_TILE_TIMEOUT_S = 10.0
+FOLDER_TILE_POLL_S = 0.25
+
+class FolderLaunchWorkerSignals(QObject):
+    error = Signal(str)
+    hook_failed = Signal(str)
+    finished = Signal(int)
+
+class FolderLaunchWorker(QRunnable):
+    """
+    Starts every app of a folder, each on its own virtual display and window tile, after a single
+    device probe. `launches` holds dicts with config_values, window_title, icon_path, session_type
+    and window_rect; the sessions are started FOLDER_LAUNCH_STAGGER_S apart and then run concurrently.
+    window_rect only sizes the client area, so once the windows are mapped they are tiled again
+    through window_manager, which accounts for the decorations the WM adds around each one.
+    """
+    cancel_token = None  # set by the scheduler on submit
+
+    def __init__(self, launches, connection_id, stagger=FOLDER_LAUNCH_STAGGER_S):
+        super().__init__()
+        self.signals = FolderLaunchWorkerSignals()
+        self.launches = launches
+        self.connection_id = connection_id
+        self.stagger = stagger
+
+    def run(self):
+        launched = 0
+        pids = []
+        try:
+            if not adb_handler.ping_device(self.connection_id):
+                raise RuntimeError(f"Device {self.connection_id} did not respond; no session was started.")
+            for i, launch in enumerate(self.launches):
+                if self.cancel_token and self.cancel_token.is_cancelled():
+                    break
+                if i:
+                    time.sleep(self.stagger)
+                try:
+                    process = scrcpy_handler.launch_scrcpy(
+                        config_values=launch['config_values'], window_title=launch['window_title'],
+                        device_id=self.connection_id, icon_path=launch['icon_path'],
+                        session_type=launch['session_type'],
+                        # scrcpy_handler finds the new display and starts the app itself
+                        perform_alternate_app_launch=(launch['session_type'] == 'app_alt_launch'),
+                        on_hook_failure=self._on_hook_failure, window_rect=launch['window_rect']
+                    )
+                except Exception as e:
+                    self.signals.error.emit(f"{launch['window_title']}: {e}")
+                    continue
+                scrcpy_handler.add_active_scrcpy_session(
+                    pid=process.pid,
+                    app_name=launch['window_title'],
+                    command_args=process.args,
+                    icon_path=launch['icon_path'],
+                    session_type=launch['session_type']
+                )
+                launched += 1
+                pids.append(process.pid)
+            self._retile(pids)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        finally:
+            self.signals.finished.emit(launched)
+
+    def _retile(self, pids):
+        """Waits for the sessions' windows to appear, then lays them out frame included."""
+        if not pids or not window_manager.is_available():
+            return
+        deadline = time.monotonic() + FOLDER_TILE_TIMEOUT_S
+        while time.monotonic() < deadline:
+            if self.cancel_token and self.cancel_token.is_cancelled():
+                return
+            if all(window_manager.window_for_pid(pid) is not None for pid in pids):
+                break
+            time.sleep(FOLDER_TILE_POLL_S)
+        window_manager.tile(pids)
+
+    def _on_hook_failure(self, result):
+        self.signals.hook_failed.emit(f"{result.hook.phase}:: {result.hook.command}\n{result.describe_failure()}")
+
 
 # --- Launch Workers ---
+
+
 class DeviceUnlockCheckWorkerSignals(BaseRunnableWorkerSignals):
     result = Signal(str)  # lock_state: LOCKED_SCREEN_OFF, LOCKED_SCREEN_ON, or UNLOCKED
 
@@ -216,14 +310,19 @@ class EncoderListWorkerSignals(BaseRunnableWorkerSignals):
     result = Signal(object)
 
 class EncoderListWorker(BaseRunnableWorker):
-    def __init__(self, connection_id=None):
+    def __init__(self, app_config, serial, connection_id=None, force=False):
         super().__init__()
+        self.app_config = app_config
+        self.serial = serial
         self.connection_id = connection_id
+        self.force = force
         self.signals = EncoderListWorkerSignals()
 
     def run(self):
         try:
-            video_encoders, audio_encoders = scrcpy_handler.list_encoders(self.connection_id)
+            # Only hits scrcpy (and pushes the server) when the build fingerprint changed
+            video_encoders, audio_encoders = capability_cache.get_encoders(
+                self.app_config, self.serial, self.connection_id, force=self.force)
             self.signals.result.emit((video_encoders, audio_encoders))
         except Exception as e:
             self.signals.error.emit(str(e))
@@ -237,19 +336,17 @@ class GameListWorkerSignals(QObject):
     result = Signal(object)
 
 class GameListWorker(BaseRunnableWorker):
-    def __init__(self, connection_id):
+    def __init__(self, connection_id, cached_records=None):
         super().__init__()
         self.connection_id = connection_id
+        self.cached_records = list(cached_records or [])
         self.signals = GameListWorkerSignals()
 
     def run(self):
         try:
-            shortcuts = adb_handler.list_winlator_shortcuts_with_names(self.connection_id)
-            games_with_pkg = []
-            for name, path in shortcuts:
-                pkg = adb_handler.get_package_name_from_shortcut(path, self.connection_id)
-                games_with_pkg.append({'name': name, 'path': path, 'pkg': pkg})
-            self.signals.result.emit(games_with_pkg)
+            # Stat listing first; only new/changed shortcuts are read from the device
+            sync_result = winlator_sync.sync_winlator_library(self.connection_id, self.cached_records)
+            self.signals.result.emit(sync_result)
         except Exception as e:
             self.signals.error.emit(str(e))
         finally:
@@ -261,59 +358,68 @@ class IconExtractorWorkerSignals(QObject):
     finished = Signal()
 
 class IconExtractorWorker(BaseRunnableWorker):
-    def __init__(self, extraction_queue, app_config, temp_dir, placeholder_icon, connection_id):
+    """Extracts (or reuses from the icon store) the icon of one Winlator shortcut."""
+    def __init__(self, shortcut_path, app_config, temp_dir, placeholder_icon, connection_id):
         super().__init__()
         self.signals = IconExtractorWorkerSignals()
-        self.extraction_queue = extraction_queue
+        self.shortcut_path = shortcut_path
         self.app_config = app_config
         self.temp_dir = temp_dir
         self.placeholder_icon = placeholder_icon
         self.connection_id = connection_id
 
     def run(self):
-        try:
-            while True:
-                task = self.extraction_queue.get()
-                if task is None:
-                    self.extraction_queue.task_done()
-                    break
-
-                path, save_path = task
-                success = False
+        path = self.shortcut_path
+        success = False
+        icon_hash = None
+        failure_class = icon_failures.FAILURE_OTHER
 
-                try:
-                    remote_exe_path = adb_handler.get_game_executable_info(path, self.connection_id)
-                    if not remote_exe_path:
-                        print(f"[IconExtractor] get_game_executable_info returned None for {path}")
-                    else:
-                        print(f"[IconExtractor] Got exe path: {remote_exe_path}, pulling via ADB...")
-                        result_queue = Queue()
-                        process = Process(target=extract_icon_in_process, args=(remote_exe_path, save_path, result_queue, self.connection_id))
-                        process.start()
-                        process.join()
-
-                        if not result_queue.empty():
-                            result_success, result_data = result_queue.get()
-                            if result_success:
-                                success = True
-                                print(f"[IconExtractor] SUCCESS: {save_path}")
-                            else:
-                                print(f"[IconExtractor] FAIL (process result): {result_data}")
+        try:
+            record = self.app_config.get_winlator_shortcut_record(path)
+            remote_exe_path = adb_handler.get_game_executable_info(path, self.connection_id, record=record)
+            if not remote_exe_path:
+                failure_class = icon_failures.FAILURE_NOT_FOUND
+                print(f"[IconExtractor] get_game_executable_info returned None for {path}")
+            else:
+                # Same .exe (duplicate shortcut, other device) -> reuse the stored icon, no pull
+                head = adb_handler.read_remote_head(remote_exe_path, icon_store.PE_HEADER_BYTES, self.connection_id)
+                identity = icon_store.exe_identity(*head) if head else None
+                icon_hash = icon_store.lookup_exe(self.app_config, identity)
+                if icon_hash:
+                    print(f"[IconExtractor] Reusing stored icon {icon_hash} for {remote_exe_path}")
+                else:
+                    print(f"[IconExtractor] Got exe path: {remote_exe_path}, pulling via ADB...")
+                    save_path = os.path.join(self.temp_dir, f"yascrcpy_icon_{uuid.uuid4().hex}.png")
+                    result_queue = Queue()
+                    process = Process(target=extract_icon_in_process, args=(remote_exe_path, save_path, result_queue, self.connection_id))
+                    process.start()
+                    process.join()
+
+                    if not result_queue.empty():
+                        result_success, result_data = result_queue.get()
+                        if result_success:
+                            icon_hash = icon_store.put_file(self.app_config, save_path, identity)
+                            print(f"[IconExtractor] SUCCESS: {icon_hash}")
                         else:
-                            print(f"[IconExtractor] FAIL: result_queue was empty (process probably crashed)")
-                except Exception as e:
-                    print(f"[IconExtractor] EXCEPTION: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    self.signals.error.emit(path, str(e))
-                finally:
-                    self.app_config.save_app_metadata(path, {'exe_icon_fetch_failed': not success})
-                    self.signals.icon_extracted.emit(path, success, save_path if success else self.placeholder_icon)
-                    self.extraction_queue.task_done()
+                            failure_class = icon_failures.FAILURE_PARSE
+                            print(f"[IconExtractor] FAIL (process result): {result_data}")
+                    else:
+                        print(f"[IconExtractor] FAIL: result_queue was empty (process probably crashed)")
+                success = icon_hash is not None
         except Exception as e:
-            self.signals.error.emit("worker_startup_error", str(e)) # Catch any unexpected worker-level errors
+            print(f"[IconExtractor] EXCEPTION: {e}")
+            import traceback
+            traceback.print_exc()
+            self.signals.error.emit(path, str(e))
         finally:
-            self.signals.finished.emit() # Ensure finished is always emitted
+            if success:
+                icon_failures.clear_failure(self.app_config, path, icon_failures.KIND_EXE)
+                self.app_config.save_app_metadata(path, {'icon_hash': icon_hash})
+            else:
+                icon_failures.record_failure(self.app_config, path, icon_failures.KIND_EXE, failure_class)
+            icon_path = icon_store.blob_path(self.app_config, icon_hash) if success else self.placeholder_icon
+            self.signals.icon_extracted.emit(path, success, icon_path)
+            self.signals.finished.emit()
 
 class WinlatorLaunchWorkerSignals(QObject):
     finished = Signal()
@@ -424,45 +530,49 @@ class IconSaveWorker(QRunnable):
         except Exception as e:
             self.signals.error.emit(self.key, str(e))
 
-class BatchIconDownloadWorkerSignals(QObject):
-    finished = Signal(str, str) # pkg_name, icon_path_string
-    error = Signal(str, str) # pkg_name, error_msg
-    task_done = Signal() # Signal to indicate a single task from queue is done
+class IconRetryWorkerSignals(QObject):
+    icon_ready = Signal(str, str) # pkg_name, icon_path
+    finished = Signal(int) # number of icons recovered
 
-class BatchIconDownloadWorker(QRunnable):
-    """Worker to download multiple icons from Play Store in batch."""
-    def __init__(self, download_queue, cache_dir, app_config):
+class IconRetryWorker(QRunnable):
+    """
+    Low-priority background retry of icon downloads that failed before. Each item is only
+    attempted once its retry window (icon_failures) has elapsed; requests are spaced out.
+    """
+    cancel_token = None  # set by the scheduler on submit
+    def __init__(self, tasks, cache_dir, app_config, delay=2.0):
         super().__init__()
-        self.signals = BatchIconDownloadWorkerSignals()
-        self.download_queue = download_queue
+        self.signals = IconRetryWorkerSignals()
+        self.tasks = list(tasks)
         self.cache_dir = cache_dir
         self.app_config = app_config
+        self.delay = delay
+        self._stopped = False
+
+    def stop(self):
+        self._stopped = True
 
     def run(self):
+        recovered = 0
         try:
-            while True:
-                task = self.download_queue.get()
-                if task is None: # Sentinel value to stop worker
-                    self.download_queue.task_done()
+            QThread.currentThread().setPriority(QThread.Priority.LowestPriority)
+            for pkg_name, app_name in self.tasks:
+                if self._stopped or (self.cancel_token and self.cancel_token.is_cancelled()):
                     break
-
-                pkg_name, app_name = task
-                icon_path = None
+                metadata = self.app_config.get_app_metadata(pkg_name)
+                if not icon_failures.is_retry_due(metadata, icon_failures.KIND_APP):
+                    continue
                 try:
                     icon_path = icon_scraper.get_icon(app_name, pkg_name, self.cache_dir, self.app_config)
-                    if icon_path:
-                        self.app_config.save_app_metadata(pkg_name, {'icon_fetch_failed': False})
-                        self.signals.finished.emit(pkg_name, icon_path)
-                    else:
-                        self.app_config.save_app_metadata(pkg_name, {'icon_fetch_failed': True})
-                        self.signals.error.emit(pkg_name, "Icon not found or could not be downloaded.")
                 except Exception as e:
-                    self.app_config.save_app_metadata(pkg_name, {'icon_fetch_failed': True})
-                    self.signals.error.emit(pkg_name, str(e))
-                finally:
-                    self.download_queue.task_done() # Mark task as done regardless of success/failure
-        except Exception as e:
-            self.signals.error.emit("worker_startup_error", str(e))
+                    print(f"Icon retry for {pkg_name} failed: {e}")
+                    icon_path = None
+                if icon_path:
+                    recovered += 1
+                    self.signals.icon_ready.emit(pkg_name, icon_path)
+                time.sleep(self.delay)
+        finally:
+            self.signals.finished.emit(recovered)
 
 
 # --- Main Window Workers ---
@@ -573,6 +683,22 @@ class DeviceConfigLoaderWorker(QRunnable):
             self.signals.finished.emit()
 
 
+class WarmStandbyWorker(BaseRunnableWorker):
+    """Idle launch pre-stage (scrcpy_handler.warm_standby), queued after the device config has loaded."""
+    def __init__(self, connection_id):
+        super().__init__()
+        self.connection_id = connection_id
+        self.signals = BaseRunnableWorkerSignals()
+
+    def run(self):
+        try:
+            scrcpy_handler.warm_standby(self.connection_id)
+        except Exception as e:
+            print(f"Warm standby failed for {self.connection_id}: {e}")
+        finally:
+            self.signals.finished.emit()
+
+
 class AdbWorkerSignals(QObject):
     result = Signal(str)
     error = Signal(str)
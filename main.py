@@ -6,12 +6,14 @@
 import sys
 import json
 import multiprocessing
+from utils import startup_timeline, tracing
 from PySide6.QtWidgets import QApplication
 from utils.dependencies import check_dependencies
 from app_config import AppConfig
 from gui.main_window import MainWindow
 from gui import themes
-import web_server
+
+startup_timeline.mark("imports")
 
 def dump_theme_colors(app):
     from PySide6.QtGui import QPalette
@@ -66,7 +68,9 @@ def main():
     import argparse
     parser = argparse.ArgumentParser()
     parser.add_argument('--theme', action='store_true', help='Dump current theme colors and exit')
+    parser.add_argument('--trace', metavar='FILE', help='Write a Chrome trace (chrome://tracing) of the session on exit')
     args, remaining = parser.parse_known_args()
+    tracing.set_enabled(bool(args.trace))
 
     if args.theme:
         app = QApplication(remaining)
@@ -84,22 +88,28 @@ def main():
     QApplication.setApplicationName("yaScrcpy")
     QApplication.setApplicationDisplayName("yaScrcpy")
     app = QApplication(remaining)
+    startup_timeline.mark("QApplication")
 
     if not check_dependencies():
         return
-
-
+    startup_timeline.mark("dependency check")
 
     app_config = AppConfig(None)
+    startup_timeline.mark("config loaded")
     
     # Apply the initial theme
     themes.apply_theme(app, app_config.get('theme', 'System'))
 
     main_window = MainWindow(app, app_config)
+    startup_timeline.mark("main window built")
 
     main_window.show()
+    startup_timeline.mark("main window shown")
 
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    if args.trace:
+        print(f"[Trace] {tracing.dump_chrome_trace(args.trace)} events written to {args.trace}")
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     multiprocessing.freeze_support()
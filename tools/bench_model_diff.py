@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# FILE: tools/bench_model_diff.py
+# PURPOSE: Benchmark do diff do modelo da grade (utils.model_diff) com 2.000 itens: reordenações,
+#          fixar um app, mover um bloco para uma pasta, ícones novos. Compara com o algoritmo antigo
+#          do syncModel (QML), portado para Python, e confere que as operações geram a lista final.
+#
+# Usage: python tools/bench_model_diff.py [--items 2000] [--repeat 5]
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils import model_diff  # noqa: E402
+
+
+def item_key(item):
+    # Same identity as gui.grid_model.item_key, without importing Qt
+    if item.get('isSeparator'):
+        return "sep_" + str(item.get('sectionId', ""))
+    return "item_" + str(item.get('key', ""))
+
+def make_items(count, sections=8):
+    items = []
+    per_section = max(1, count // sections)
+    for i in range(count):
+        if i % per_section == 0:
+            section = f"folder{i // per_section}"
+            items.append({'isSeparator': True, 'sectionId': section, 'text': section, 'isCollapsed': False})
+        items.append({'key': f"com.example.app{i:05d}", 'name': f"App {i:05d}",
+                      'icon_path': f"file:///icons/app{i:05d}.png", 'item_type': "app",
+                      'pinned': "", 'isHidden': False, 'is_launcher_shortcut': False})
+    return items
+
+def legacy_sync(old_items, new_items):
+    """Port of the removed QML syncModel: move with an index fix-up over the whole map, then compare roles."""
+    target = [dict(item) for item in old_items]
+    old_map = {item_key(item): i for i, item in enumerate(target)}
+    operations = 0
+    for j, new_item in enumerate(new_items):
+        new_id = item_key(new_item)
+        if new_id in old_map:
+            old_idx = old_map[new_id]
+            if old_idx != j:
+                target.insert(j, target.pop(old_idx))
+                operations += 1
+                for key, idx in old_map.items():
+                    if old_idx < j:
+                        if old_idx < idx <= j:
+                            old_map[key] = idx - 1
+                    elif j <= idx < old_idx:
+                        old_map[key] = idx + 1
+                old_map[new_id] = j
+            for prop, value in new_item.items():
+                if target[j].get(prop) != value:
+                    target[j][prop] = value
+                    operations += 1
+            del old_map[new_id]
+        else:
+            target.insert(j, dict(new_item))
+            operations += 1
+            for key in old_map:
+                if old_map[key] >= j:
+                    old_map[key] += 1
+    for idx in sorted(old_map.values(), reverse=True):
+        del target[idx]
+        operations += 1
+    return target, operations
+
+
+def scenarios(items, rng):
+    apps = [item for item in items if not item.get('isSeparator')]
+    separators = [item for item in items if item.get('isSeparator')]
+
+    shuffled = list(items)
+    rng.shuffle(shuffled)
+    yield "shuffle (full reorder)", shuffled
+    yield "reverse", list(reversed(items))
+
+    # Pin one app: it leaves its section and shows up under the first folder
+    pinned = apps[len(apps) // 2]
+    pin = [item for item in items if item is not pinned]
+    pin.insert(1, dict(pinned, pinned="folder0"))
+    yield "pin one app", pin
+
+    # Move a block of 50 apps to the last folder
+    block = apps[100:150]
+    block_ids = {id(item) for item in block}
+    moved = [item for item in items if id(item) not in block_ids] + [dict(item, pinned="folder7") for item in block]
+    yield "move 50 apps to a folder", moved
+
+    # Icons arrive for 500 apps (changes only)
+    refreshed_keys = {item['key'] for item in rng.sample(apps, min(500, len(apps)))}
+    yield "500 new icons", [dict(item, icon_path=item['icon_path'] + "?t=1")
+                            if item.get('key') in refreshed_keys else item for item in items]
+
+    # Collapse a section
+    first_section = separators[0]['sectionId'] if separators else None
+    collapsed = []
+    in_section = False
+    for item in items:
+        if item.get('isSeparator'):
+            in_section = item['sectionId'] == first_section
+            collapsed.append(dict(item, isCollapsed=True) if in_section else item)
+        else:
+            collapsed.append(dict(item, isHidden=True) if in_section else item)
+    yield "collapse a section", collapsed
+
+    # Search filter: keep every tenth app
+    yield "filter to 10%", separators[:1] + apps[::10]
+
+def main():
+    parser = argparse.ArgumentParser(description="Grid model diff benchmark")
+    parser.add_argument('--items', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    items = make_items(args.items)
+    print(f"{len(items)} rows ({args.items} items), best of {args.repeat}")
+    print(f"{'scenario':28} {'diff ms':>9} {'ops':>6} {'legacy ms':>10} {'legacy ops':>11}")
+    failures = 0
+    for name, new_items in scenarios(items, rng):
+        diff_best = legacy_best = float('inf')
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            ops = model_diff.diff_items(items, new_items, item_key)
+            diff_best = min(diff_best, time.perf_counter() - started)
+        for _ in range(max(1, args.repeat // 2)):
+            started = time.perf_counter()
+            legacy_result, legacy_ops = legacy_sync(items, new_items)
+            legacy_best = min(legacy_best, time.perf_counter() - started)
+
+        if model_diff.apply_ops(items, ops) != new_items or legacy_result != new_items:
+            failures += 1
+            print(f"FAIL: {name} does not reproduce the new list")
+        print(f"{name:28} {diff_best * 1000:9.2f} {len(ops):6d} {legacy_best * 1000:10.2f} {legacy_ops:11d}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
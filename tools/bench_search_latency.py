@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# FILE: tools/bench_search_latency.py
+# PURPOSE: Benchmark da latência da busca na aba de apps, de cada tecla até o quadro seguinte da
+#          grade, com QT_QPA_PLATFORM=offscreen e bibliotecas sintéticas (500/2.000/5.000 apps).
+#          Usa os spans de utils.tracing para mostrar p50/p99 total e por etapa.
+#
+# Usage: python tools/bench_search_latency.py [--sizes 500,2000,5000] [--debounce-ms 0] [--trace out.json]
+
+import os
+import sys
+import time
+import random
+import tempfile
+import argparse
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, REPO_ROOT)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+# Keep the benchmark's config (sessions, metadata) out of the user's real one
+os.environ['HOME'] = tempfile.mkdtemp(prefix='yascrcpy-bench-')
+
+from PySide6.QtCore import QCoreApplication  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+from app_config import AppConfig  # noqa: E402
+from gui.apps_tab import AppsTab  # noqa: E402
+from utils import tracing  # noqa: E402
+
+STAGES = ('apps.search_debounce', 'apps.filter', 'apps.fingerprint', 'grid.update_model',
+          'grid.diff', 'grid.apply', 'apps.search', 'apps.keystroke_to_frame')
+QUERIES = ("a", "ap", "app", "app 1", "app 12", "app 1", "app", "", "game", "ga", "")
+WORDS = ("app", "game", "music", "photo", "mail", "maps", "notes", "camera", "chat", "store")
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+def synthetic_apps(count, rng, placeholder):
+    apps = []
+    for i in range(count):
+        pinned = ""
+        roll = rng.random()
+        if roll < 0.1:
+            pinned = f"Folder {i % 5}"
+        elif roll < 0.12:
+            pinned = "qqs"
+        apps.append({'key': f"com.bench.{rng.choice(WORDS)}{i}", 'name': f"{rng.choice(WORDS).title()} {i}",
+                     'item_type': "app", 'is_launcher_shortcut': False,
+                     'icon_path': placeholder, 'pinned': pinned})
+    return apps
+
+def wait_until(app, condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+    return condition()
+
+def run_size(app, tab, size, rounds, rng):
+    placeholder = 'file://' + os.path.join(REPO_ROOT, 'gui', 'placeholder.png')
+    tab.all_apps_data = synthetic_apps(size, rng, placeholder)
+    tab._last_model_fingerprint = None
+    tab.search_input.blockSignals(True)
+    tab.search_input.setText("")
+    tab.search_input.blockSignals(False)
+    tab.filter_apps()
+    wait_until(app, lambda: False, timeout=0.3)  # first layout/render of the full library
+    tracing.clear()
+
+    expected = 0
+    for _ in range(rounds):
+        for query in QUERIES:
+            tab.search_input.setText(query)
+            expected += 1
+            wait_until(app, lambda: len(tracing.durations_ms('apps.keystroke_to_frame')) >= expected)
+    return {stage: tracing.durations_ms(stage) for stage in STAGES}
+
+def main():
+    parser = argparse.ArgumentParser(description="Apps tab search latency benchmark (offscreen)")
+    parser.add_argument('--sizes', default="500,2000,5000")
+    parser.add_argument('--rounds', type=int, default=3, help='times the query sequence is typed per size')
+    parser.add_argument('--debounce-ms', type=int, default=0,
+                        help='search debounce to use (the app uses 200 ms; 0 measures only the work)')
+    parser.add_argument('--trace', metavar='FILE', help='also write the last size as a Chrome trace')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    tracing.set_enabled(True)  # the stage timings below are read back from the trace buffer
+
+    app = QApplication(sys.argv[:1])
+    app_config = AppConfig(None)
+    tab = AppsTab(app_config)
+    tab._search_timer.setInterval(args.debounce_ms)
+    tab._reload_qml()
+    tab._connect_qml_signals()
+    tab.show_grid()
+    tab.resize(1000, 700)
+    tab.show()
+    if not wait_until(app, lambda: tab._get_qml_root() is not None):
+        print("FAIL: the grid QML did not load")
+        return 2
+    tab.update_theme()
+
+    rng = random.Random(args.seed)
+    for size in (int(s) for s in args.sizes.split(',') if s.strip()):
+        results = run_size(app, tab, size, args.rounds, rng)
+        frames = results['apps.keystroke_to_frame']
+        print(f"\n{size} apps, {len(frames)} keystrokes (debounce {args.debounce_ms} ms)")
+        print(f"  {'stage':26} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+        for stage in STAGES:
+            values = results[stage]
+            if values:
+                print(f"  {stage:26} {percentile(values, 0.5):8.2f} {percentile(values, 0.99):8.2f} {max(values):8.2f}")
+
+    if args.trace:
+        print(f"\n{tracing.dump_chrome_trace(args.trace)} events written to {args.trace}")
+    tab.stop_all_workers()
+    QCoreApplication.processEvents()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# FILE: tools/check_import_budget.py
+# PURPOSE: Verifica o custo de importação da inicialização da interface com `python -X importtime`:
+#          falha se o stack web (FastAPI/uvicorn/pydantic) for importado junto com a GUI ou se o
+#          tempo cumulativo de `import main` passar do orçamento.
+#
+# Usage: python tools/check_import_budget.py [--budget-ms 1500] [--top 15]
+
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+ENTRY_MODULE = 'main'
+# Top-level packages that must only load when the web server is started
+FORBIDDEN_AT_STARTUP = ('web_server', 'fastapi', 'uvicorn', 'starlette', 'pydantic', 'pydantic_core')
+DEFAULT_BUDGET_MS = 1500
+
+_LINE_RE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+
+
+def measure_imports(module=ENTRY_MODULE):
+    """Imports the module in a fresh interpreter and returns [(name, self_us, cumulative_us, depth)]."""
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"'import {module}' failed:\n{result.stderr[-2000:]}")
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return entries
+
+def check(entries, budget_ms, module=ENTRY_MODULE):
+    """Returns a list of failure messages (empty when the startup is within budget)."""
+    failures = []
+    loaded = {name for name, _, _, _ in entries}
+    forbidden = sorted(name for name in loaded if name.split('.')[0] in FORBIDDEN_AT_STARTUP)
+    if forbidden:
+        failures.append(f"web stack imported at GUI startup: {', '.join(forbidden[:10])}")
+
+    total_us = next((cumulative for name, _, cumulative, _ in entries if name == module), None)
+    if total_us is None:
+        failures.append(f"no importtime entry for '{module}'")
+    elif total_us / 1000 > budget_ms:
+        failures.append(f"'import {module}' took {total_us / 1000:.0f} ms (budget {budget_ms} ms)")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--budget-ms', type=int, default=DEFAULT_BUDGET_MS)
+    parser.add_argument('--top', type=int, default=15, help='show the N slowest modules (self time)')
+    args = parser.parse_args()
+
+    try:
+        entries = measure_imports()
+    except RuntimeError as e:
+        print(e)
+        return 2
+
+    for name, self_us, cumulative_us, _ in sorted(entries, key=lambda e: e[1], reverse=True)[:args.top]:
+        print(f"{self_us / 1000:8.1f} ms self {cumulative_us / 1000:9.1f} ms cumulative  {name}")
+
+    failures = check(entries, args.budget_ms)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print(f"OK: GUI startup imports within {args.budget_ms} ms and without the web stack")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
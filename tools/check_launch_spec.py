@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# FILE: tools/check_launch_spec.py
+# PURPOSE: Confere a validação de flags do utils.launch_spec contra uma saída capturada do
+#          `scrcpy --help` (scrcpy 3.x): flags curtas sozinhas na linha (-K, -M, -G) são aceitas
+#          e valores negativos (`--angle -10`) não são confundidos com flags.
+#
+# Usage: python tools/check_launch_spec.py
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils import launch_spec  # noqa: E402
+
+# Excerpt of `scrcpy --help` (3.1), keeping its layout: short flags alone or before the long form
+CAPTURED_HELP = """\
+Usage: scrcpy [options]
+
+Options:
+
+    --always-on-top
+        Make scrcpy window always visible on top of other windows.
+
+    --angle=degrees
+        Rotate the video content by a custom angle, in degrees (clockwise).
+
+    -b, --video-bit-rate=value
+        Encode the video at the given bit rate, expressed in bits/s. Unit
+        suffixes are supported: 'K' (x1000) and 'M' (x1000000).
+        Default is 8M (8000000).
+
+    -f, --fullscreen
+        Start in fullscreen.
+
+    -G
+        Same as --gamepad=uhid, or --gamepad=aoa if --otg is set.
+
+    -K
+        Same as --keyboard=uhid, or --keyboard=aoa if --otg is set.
+
+    -M
+        Same as --mouse=uhid, or --mouse=aoa if --otg is set.
+
+    -m, --max-size=value
+        Limit both the width and height of the video to value. The other
+        dimension is computed so that the device aspect-ratio is preserved.
+        Default is 0 (unlimited).
+
+    --new-display[=[<width>x<height>][/<dpi>]]
+        Create a new display with the specified resolution and density.
+
+    -s, --serial=serial
+        The device serial number. Mandatory only if several devices are
+        connected to adb.
+
+    -S, --turn-screen-off
+        Turn the device screen off immediately.
+
+    --start-app=name
+        Start an Android app, by its exact package name.
+
+    --window-title=text
+        Set a custom window title.
+
+    --window-x=value
+        Set the initial window horizontal position.
+        Default is "auto".
+"""
+
+EXPECTED_FLAGS = ('-G', '-K', '-M', '-b', '-f', '-m', '-s', '-S', '--angle', '--always-on-top',
+                  '--new-display', '--start-app', '--window-x')
+
+
+def main():
+    failures = []
+    flags = launch_spec.parse_help_flags(CAPTURED_HELP)
+    for flag in EXPECTED_FLAGS:
+        if flag not in flags:
+            failures.append(f"{flag} missing from the parsed --help flags")
+    for not_a_flag in ('-1', '-D', '-c'):
+        if not_a_flag in flags:
+            failures.append(f"{not_a_flag} parsed as a flag")
+
+    launch_spec._supported_flags = flags
+    accepted = ("-K -M -G", "--angle -10", "--angle=-10 -b 4M", "-m 1024")
+    rejected = ("--no-such-flag", "-Z")
+    for extra in accepted:
+        try:
+            launch_spec._compile({'extraargs': extra})
+        except launch_spec.LaunchSpecError as e:
+            failures.append(f"'{extra}' rejected: {e}")
+    for extra in rejected:
+        try:
+            launch_spec._compile({'extraargs': extra})
+            failures.append(f"'{extra}' accepted")
+        except launch_spec.LaunchSpecError:
+            pass
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    print("OK" if not failures else f"{len(failures)} check(s) failed")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# FILE: tools/check_window_manager.py
+# PURPOSE: Confere o utils.window_manager num servidor X de teste (Xvfb): cria janelas falsas com
+#          _NET_WM_PID, acha cada uma pelo PID (com cache), foca, organiza 4 e 8 sessões em grade e
+#          move para o monitor (descontando as bordas do _NET_FRAME_EXTENTS). Também mede o tempo de
+#          foco com o cache quente.
+#
+# Usage: xvfb-run -s "-screen 0 1920x1080x24" python tools/check_window_manager.py
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from Xlib import X, Xatom, display as xdisplay  # noqa: E402
+from utils import window_manager  # noqa: E402
+
+FAKE_PID_BASE = 900000
+
+
+def create_session_window(conn, pid, title):
+    root = conn.screen().root
+    window = root.create_window(0, 0, 320, 640, 0, conn.screen().root_depth, X.InputOutput, X.CopyFromParent)
+    window.set_wm_name(title)
+    window.change_property(conn.intern_atom('_NET_WM_PID'), Xatom.CARDINAL, 32, [pid])
+    window.map()
+    return window
+
+def absolute_geometry(conn, window):
+    geometry = window.get_geometry()
+    origin = window.translate_coords(conn.screen().root, 0, 0)
+    return (-origin.x, -origin.y, geometry.width, geometry.height)
+
+def check(condition, message, failures):
+    if not condition:
+        failures.append(message)
+        print(f"FAIL: {message}")
+
+def main():
+    if not window_manager.is_available():
+        print("FAIL: no X connection (run under xvfb-run) or python-xlib missing")
+        return 2
+    conn = xdisplay.Display()
+    failures = []
+
+    # Same title on purpose: wmctrl -a could not tell these apart
+    windows = {FAKE_PID_BASE + i: create_session_window(conn, FAKE_PID_BASE + i, "Same App") for i in range(8)}
+    conn.sync()
+
+    for pid, window in windows.items():
+        check(window_manager.window_for_pid(pid) == window.id, f"PID {pid} mapped to the wrong window", failures)
+    check(window_manager.window_for_pid(FAKE_PID_BASE + 99) is None, "unknown PID found a window", failures)
+
+    started = time.perf_counter()
+    for _ in range(100):
+        window_manager.focus(FAKE_PID_BASE + 3)
+    focus_ms = (time.perf_counter() - started) * 10
+    conn.sync()
+    check(conn.get_input_focus().focus.id == windows[FAKE_PID_BASE + 3].id, "focus went to another window", failures)
+    print(f"focus (cached): {focus_ms:.3f} ms per call")
+
+    area = window_manager.monitors()[0]
+    for count in (4, 8):
+        pids = list(windows)[:count]
+        check(window_manager.tile(pids) == count, f"tile placed fewer than {count} windows", failures)
+        conn.sync()
+        expected = window_manager.tile_rects(count, area)
+        placed = [absolute_geometry(conn, windows[pid]) for pid in pids]
+        check(placed == expected, f"tile {count}: {placed} != {expected}", failures)
+
+    # Decorations reported by the WM are taken out of each cell, so framed windows don't overlap
+    left, right, top, bottom = 4, 4, 28, 4
+    pids = list(windows)[:4]
+    for pid in pids:
+        windows[pid].change_property(conn.intern_atom('_NET_FRAME_EXTENTS'), Xatom.CARDINAL, 32, [left, right, top, bottom])
+    conn.sync()
+    window_manager.tile(pids)
+    conn.sync()
+    expected = [(x + left, y + top, w - left - right, h - top - bottom) for x, y, w, h in window_manager.tile_rects(4, area)]
+    placed = [absolute_geometry(conn, windows[pid]) for pid in pids]
+    check(placed == expected, f"tile with frame extents: {placed} != {expected}", failures)
+    for pid in pids:
+        windows[pid].delete_property(conn.intern_atom('_NET_FRAME_EXTENTS'))
+
+    pid = FAKE_PID_BASE
+    check(window_manager.move_to_monitor(pid, 0), "move_to_monitor did not find the window", failures)
+    conn.sync()
+    x, y, width, height = absolute_geometry(conn, windows[pid])
+    check((x, y) == (area[0] + (area[2] - width) // 2, area[1] + (area[3] - height) // 2),
+          "move_to_monitor did not center the window", failures)
+
+    # A destroyed window is dropped from the cache on the next lookup
+    windows[pid].destroy()
+    conn.sync()
+    check(window_manager.window_for_pid(pid) is None, "destroyed window still resolved", failures)
+
+    print("OK" if not failures else f"{len(failures)} check(s) failed")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@
 # PURPOSE: Centraliza todos os comandos que interagem com o Android Debug Bridge (adb).
 
 import subprocess
+import hashlib
 import shlex
 import re
 import os
@@ -16,8 +17,11 @@ def _get_startupinfo():
         return startupinfo
     return None
 
-def _run_adb_command(command, device_id=None, print_command=False, ignore_errors=False, timeout=10):
-    """Helper para executar um comando adb, retornando a saída decodificada."""
+def _run_adb_command(command, device_id=None, print_command=False, ignore_errors=False, timeout=10, decode_errors=None):
+    """
+    Helper para executar um comando adb, retornando a saída decodificada.
+    Com decode_errors (ex.: 'replace'), a saída é lida como UTF-8 e bytes inválidos não descartam o resto.
+    """
     base_cmd = ['adb']
     if device_id:
         base_cmd.extend(['-s', device_id])
@@ -31,7 +35,10 @@ def _run_adb_command(command, device_id=None, print_command=False, ignore_errors
     env = get_clean_env()
 
     try:
-        result = subprocess.check_output(full_cmd, text=True, stderr=subprocess.PIPE, startupinfo=startupinfo, env=env, timeout=timeout)
+        if decode_errors:
+            result = subprocess.check_output(full_cmd, encoding='utf-8', errors=decode_errors, stderr=subprocess.PIPE, startupinfo=startupinfo, env=env, timeout=timeout)
+        else:
+            result = subprocess.check_output(full_cmd, text=True, stderr=subprocess.PIPE, startupinfo=startupinfo, env=env, timeout=timeout)
         return result.strip()
     except FileNotFoundError:
         if not ignore_errors:
@@ -62,63 +69,147 @@ def get_device_info(device_id=None):
 
     return {"commercial_name": name, "battery": battery_level}
 
-def list_winlator_shortcuts_with_names(device_id=None):
-    """Retorna uma lista de tuplas (nome, caminho) para os atalhos do Winlator."""
-    paths_to_search = [
-        '/storage/emulated/0/Download/Winlator/Frontend/',
-        '/storage/emulated/0/winlator/Shortcuts/'
-    ]
-    all_shortcuts = []
-    for search_path in paths_to_search:
-        command = ['shell', 'find', search_path, '-type', 'f', '-name', '*.desktop']
-        output = _run_adb_command(command, device_id, ignore_errors=True)
-        if output:
-            all_shortcuts.extend(output.splitlines())
-
-    games_with_names = []
-    # Use a set to avoid duplicates if a shortcut exists in both locations
-    for path in sorted(list(set(all_shortcuts))):
-        if path:
-            basename = os.path.basename(path)
-            name = basename.rsplit('.desktop', 1)[0]
-            games_with_names.append((name, path))
-    return games_with_names
+WINLATOR_SHORTCUT_DIRS = [
+    '/storage/emulated/0/Download/Winlator/Frontend/',
+    '/storage/emulated/0/winlator/Shortcuts/'
+]
+_SCAN_BEGIN = '@@YASCRCPY_SHORTCUT_BEGIN@@'
+_SCAN_END = '@@YASCRCPY_SHORTCUT_END@@'
+_STAT_DONE = '@@YASCRCPY_STAT_DONE@@'
 
-def get_package_name_from_shortcut(shortcut_path, device_id=None):
-    """Lê o arquivo .desktop para extrair o nome do pacote da linha 'Exec='."""
-    content = _run_adb_command(['shell', 'cat', shlex.quote(shortcut_path)], device_id)
-    if not content:
-        return "unknown"
+def _find_shortcuts_script():
+    dirs = ' '.join(shlex.quote(d) for d in WINLATOR_SHORTCUT_DIRS)
+    return f"for d in {dirs}; do [ -d \"$d\" ] && find \"$d\" -type f -name '*.desktop' 2>/dev/null; done | sort -u"
 
-    for line in content.splitlines():
-        line = line.strip()
-        if line.lower().startswith('exec='):
-            match = re.search(r'/0/([^/]+)/files/', line)
-            if match:
-                return match.group(1)
-    return "unknown"
-
-def get_game_executable_info(shortcut_path, device_id=None):
-    """Lê o .desktop e processa os caminhos na memória de forma flexível."""
-    # Usamos o 'cat' para pegar o conteúdo bruto. O arquivo original no celular NÃO é modificado.
-    content = _run_adb_command(['shell', 'cat', shlex.quote(shortcut_path)], device_id)
-    if not content:
-        return None
+def _shortcut_name(path):
+    return os.path.basename(path).rsplit('.desktop', 1)[0]
 
-    path_val = None
-    exec_val = None
-    wm_class = None
+def list_winlator_shortcuts_with_names(device_id=None):
+    """Retorna uma lista de tuplas (nome, caminho) para os atalhos do Winlator."""
+    # Both folders in one adb spawn; sort -u drops duplicates present in both locations
+    output = _run_adb_command(['shell', _find_shortcuts_script()], device_id, ignore_errors=True)
+    return [(_shortcut_name(path), path) for path in sorted(set(output.splitlines())) if path]
 
+def _parse_desktop_entry(content):
+    """Extrai os campos Path=, Exec= e StartupWMClass= do conteúdo de um .desktop."""
+    fields = {'working_dir': None, 'exec': None, 'wm_class': None}
     for line in content.splitlines():
         line = line.strip()
         lower_line = line.lower()
         if lower_line.startswith('path='):
-            path_val = line[5:].strip()
+            fields['working_dir'] = line[5:].strip()
         elif lower_line.startswith('exec='):
-            exec_val = line[5:].strip()
+            fields['exec'] = line[5:].strip()
         elif lower_line.startswith('startupwmclass='):
-            wm_class = line[15:].strip()
+            fields['wm_class'] = line[15:].strip()
+    return fields
+
+def _package_from_exec(exec_val):
+    if exec_val:
+        match = re.search(r'/0/([^/]+)/files/', exec_val)
+        if match:
+            return match.group(1)
+    return "unknown"
+
+def _parse_shortcut_blocks(output):
+    """Interpreta a saída delimitada por _SCAN_BEGIN/_SCAN_END (caminho, 'mtime tamanho', conteúdo)."""
+    records = []
+    for block in output.split(_SCAN_BEGIN)[1:]:
+        # Each shortcut on its own: a malformed one is skipped without losing the rest
+        try:
+            record = _parse_shortcut_block(block)
+        except Exception as e:
+            print(f"Skipping unreadable Winlator shortcut block: {e}")
+            continue
+        if record:
+            records.append(record)
+    return records
+
+def _parse_shortcut_block(block):
+    block = block.split(_SCAN_END, 1)[0].strip('\n')
+    lines = block.split('\n')
+    if len(lines) < 2 or not lines[0].strip():
+        return None
+    path = lines[0].strip()
+    try:
+        mtime, size = (int(v) for v in lines[1].split()[:2])
+    except ValueError:
+        mtime, size = 0, 0
+    content = '\n'.join(lines[2:])
+    fields = _parse_desktop_entry(content)
+    record = {'name': _shortcut_name(path), 'path': path, 'pkg': _package_from_exec(fields['exec']),
+              'mtime': mtime, 'size': size, 'hash': hashlib.md5(content.strip().encode('utf-8')).hexdigest()}
+    record.update(fields)
+    return record
+
+def _dump_shortcuts_script(source):
+    return (f"{source} | while IFS= read -r f; do "
+            f"echo {_SCAN_BEGIN}; echo \"$f\"; stat -c '%Y %s' \"$f\" 2>/dev/null || echo '0 0'; "
+            f"cat \"$f\" 2>/dev/null; echo; echo {_SCAN_END}; done")
+
+def scan_winlator_shortcuts(device_id=None, timeout=30):
+    """
+    Varredura única: um só 'adb shell' lista os atalhos das duas pastas e devolve, para cada um,
+    caminho, mtime, tamanho, hash do conteúdo e os campos Exec/Path/StartupWMClass já interpretados.
+    Retorna uma lista de dicts ordenada por nome.
+    """
+    # Shortcuts often carry Windows-codepage names; one invalid byte must not empty the whole scan
+    output = _run_adb_command(['shell', _dump_shortcuts_script(_find_shortcuts_script())], device_id, ignore_errors=True, timeout=timeout, decode_errors='replace')
+    return sorted(_parse_shortcut_blocks(output), key=lambda r: r['name'].lower())
 
+def stat_winlator_shortcuts(device_id=None, timeout=30):
+    """
+    Lista apenas caminho -> (mtime, tamanho) dos atalhos, sem ler o conteúdo.
+    Levanta RuntimeError se a listagem não terminou (adb falhou), para não confundir com pasta vazia.
+    """
+    script = (f"{_find_shortcuts_script()} | while IFS= read -r f; do "
+              f"echo \"$(stat -c '%Y %s' \"$f\" 2>/dev/null || echo '0 0') $f\"; done; echo {_STAT_DONE}")
+    output = _run_adb_command(['shell', script], device_id, ignore_errors=True, timeout=timeout, decode_errors='replace')
+    if _STAT_DONE not in output:
+        raise RuntimeError("Could not list Winlator shortcuts on the device.")
+
+    stats = {}
+    for line in output.splitlines():
+        parts = line.split(' ', 2)
+        if len(parts) == 3 and parts[2].endswith('.desktop'):
+            try:
+                stats[parts[2]] = (int(parts[0]), int(parts[1]))
+            except ValueError:
+                continue
+    return stats
+
+def read_winlator_shortcuts(paths, device_id=None, timeout=30):
+    """Lê somente os atalhos informados, num único 'adb shell'. Retorna registros como scan_winlator_shortcuts."""
+    if not paths:
+        return []
+    source = "printf '%s\\n' " + ' '.join(shlex.quote(p) for p in paths)
+    output = _run_adb_command(['shell', _dump_shortcuts_script(source)], device_id, ignore_errors=True, timeout=timeout, decode_errors='replace')
+    return _parse_shortcut_blocks(output)
+
+def get_package_name_from_shortcut(shortcut_path, device_id=None):
+    """Lê o arquivo .desktop para extrair o nome do pacote da linha 'Exec='."""
+    content = _run_adb_command(['shell', 'cat', shlex.quote(shortcut_path)], device_id)
+    if not content:
+        return "unknown"
+    return _package_from_exec(_parse_desktop_entry(content)['exec'])
+
+def get_game_executable_info(shortcut_path, device_id=None, record=None):
+    """
+    Lê o .desktop e processa os caminhos na memória de forma flexível.
+    Se `record` (de scan_winlator_shortcuts) for informado, o arquivo não é lido de novo.
+    """
+    if record is not None and 'exec' in record:
+        fields = record
+    else:
+        # Usamos o 'cat' para pegar o conteúdo bruto. O arquivo original no celular NÃO é modificado.
+        content = _run_adb_command(['shell', 'cat', shlex.quote(shortcut_path)], device_id)
+        if not content:
+            return None
+        fields = _parse_desktop_entry(content)
+    return _resolve_game_executable(fields.get('working_dir'), fields.get('exec'), fields.get('wm_class'))
+
+def _resolve_game_executable(path_val, exec_val, wm_class):
+    """Resolve o caminho remoto do .exe a partir dos campos Path=, Exec= e StartupWMClass=."""
     # 1. Tenta pegar o nome do executável da linha Exec= (mais chance de preservar o Case correto)
     exe_name = None
     if exec_val:
@@ -206,6 +297,30 @@ def pull_file(remote_path, local_path, device_id=None, timeout=60):
     except (subprocess.SubprocessError, FileNotFoundError):
         return False
 
+def read_remote_head(remote_path, num_bytes=4096, device_id=None, timeout=15):
+    """
+    Lê o tamanho e os primeiros num_bytes de um arquivo do dispositivo num único 'adb exec-out'.
+    Retorna (tamanho, bytes) ou None se o arquivo não puder ser lido.
+    """
+    cmd = ['adb']
+    if device_id:
+        cmd.extend(['-s', device_id])
+    quoted_path = shlex.quote(remote_path)
+    cmd.extend(['exec-out', f"stat -c%s {quoted_path} 2>/dev/null && dd if={quoted_path} bs={num_bytes} count=1 2>/dev/null"])
+
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, startupinfo=_get_startupinfo(), env=get_clean_env(), timeout=timeout)
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return None
+    size_line, sep, head = result.stdout.partition(b'\n')
+    if not sep or not size_line.strip().isdigit():
+        return None
+    return int(size_line.strip()), head
+
+def ping_device(device_id=None):
+    """Runs a no-op shell command; used to measure/warm up the adb transport."""
+    return _run_adb_command(['shell', 'echo', 'ok'], device_id=device_id, ignore_errors=True) == 'ok'
+
 def start_winlator_app(shortcut_path, display_id, package_name, device_id=None, windowing_mode=1):
     """Inicia um aplicativo Winlator em um display virtual específico."""
 
@@ -318,6 +433,12 @@ def get_serial_from_wifi_device(device_id):
         return None
     return _run_adb_command(['shell', 'getprop', 'ro.serialno'], device_id=device_id, ignore_errors=True)
 
+def get_build_fingerprint(device_id):
+    """Gets the ro.build.fingerprint property, which changes whenever the OS build changes."""
+    if not device_id:
+        return ""
+    return _run_adb_command(['shell', 'getprop', 'ro.build.fingerprint'], device_id=device_id, ignore_errors=True)
+
 def get_connected_device_id():
     """Retorna o ID do primeiro dispositivo ADB conectado que está online."""
     devices = get_all_connected_devices()
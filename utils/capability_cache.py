@@ -0,0 +1,148 @@
+# FILE: utils/capability_cache.py
+# PURPOSE: Cache compartilhado (GUI + web) das capacidades do dispositivo (encoders),
+#          indexado por serial + ro.build.fingerprint, com atualização em background (single-flight).
+
+import os
+import json
+import time
+import threading
+from . import adb_handler, scrcpy_handler
+
+CAPABILITIES_FILE_NAME = 'device_capabilities.json'
+
+KIND_ENCODERS = 'encoders'
+
+_cache_lock = threading.RLock()
+_cache_data = None
+_cache_file = None
+_inflight = {}  # (serial, kind) -> threading.Event
+
+
+def _fetch_encoders(connection_id):
+    video_encoders, audio_encoders = scrcpy_handler.list_encoders(connection_id)
+    return {'video': video_encoders, 'audio': audio_encoders}
+
+_FETCHERS = {
+    KIND_ENCODERS: _fetch_encoders,
+}
+
+
+def _load(app_config):
+    """Loads the capability file once per process; both the GUI and the web server share it."""
+    global _cache_data, _cache_file
+    with _cache_lock:
+        cache_file = os.path.join(app_config.CONFIG_DIR, CAPABILITIES_FILE_NAME)
+        if _cache_data is None or _cache_file != cache_file:
+            _cache_file = cache_file
+            _cache_data = {}
+            if os.path.exists(cache_file):
+                try:
+                    with open(cache_file, "r", encoding='utf-8') as f:
+                        _cache_data = json.load(f)
+                except (json.JSONDecodeError, IOError):
+                    _cache_data = {}
+        return _cache_data
+
+def _save():
+    with _cache_lock:
+        if _cache_file is None:
+            return
+        try:
+            with open(_cache_file, "w", encoding='utf-8') as f:
+                json.dump(_cache_data, f, indent=4)
+        except IOError as e:
+            print(f"Error saving capability cache to {_cache_file}: {e}")
+
+def _store(app_config, serial, fingerprint, kind, value):
+    with _cache_lock:
+        data = _load(app_config)
+        entry = data.get(serial)
+        if entry is None or (fingerprint and entry.get('fingerprint') != fingerprint):
+            # A new OS build invalidates everything we knew about the device
+            entry = {'fingerprint': fingerprint, 'updated_at': {}}
+            data[serial] = entry
+        entry[kind] = value
+        entry.setdefault('updated_at', {})[kind] = time.time()
+        _save()
+
+
+def peek(app_config, serial, kind):
+    """Returns the cached value without validating the fingerprint (no adb round-trip), or None."""
+    if not serial:
+        return None
+    with _cache_lock:
+        return _load(app_config).get(serial, {}).get(kind)
+
+def invalidate(app_config, serial):
+    with _cache_lock:
+        if _load(app_config).pop(serial, None) is not None:
+            _save()
+
+def _is_fresh(app_config, serial, kind, fingerprint):
+    with _cache_lock:
+        entry = _load(app_config).get(serial)
+        if not entry or kind not in entry:
+            return False
+        # If the fingerprint can't be read (device busy/offline) trust what we have
+        return not fingerprint or entry.get('fingerprint') == fingerprint
+
+def _fetch_single_flight(app_config, serial, kind, connection_id, fingerprint):
+    """Runs the scrcpy query once per (serial, kind); concurrent callers wait for that result."""
+    key = (serial, kind)
+    with _cache_lock:
+        event = _inflight.get(key)
+        is_owner = event is None
+        if is_owner:
+            event = threading.Event()
+            _inflight[key] = event
+
+    if not is_owner:
+        event.wait()
+        value = peek(app_config, serial, kind)
+        if value is None:
+            raise RuntimeError(f"Could not fetch {kind} for device {serial}")
+        return value
+
+    try:
+        value = _FETCHERS[kind](connection_id)
+        _store(app_config, serial, fingerprint, kind, value)
+        return value
+    finally:
+        with _cache_lock:
+            _inflight.pop(key, None)
+        event.set()
+
+def get_capability(app_config, serial, kind, connection_id=None, force=False):
+    """
+    Returns the capability for the device, querying scrcpy only when the cache is missing,
+    the OS build fingerprint changed, or force is set. Blocking; call from a worker thread.
+    """
+    connection_id = connection_id or serial
+    fingerprint = adb_handler.get_build_fingerprint(connection_id)
+    if not force and _is_fresh(app_config, serial, kind, fingerprint):
+        return peek(app_config, serial, kind)
+    return _fetch_single_flight(app_config, serial, kind, connection_id, fingerprint)
+
+def get_encoders(app_config, serial, connection_id=None, force=False):
+    encoders = get_capability(app_config, serial, KIND_ENCODERS, connection_id, force)
+    return encoders.get('video', {}), encoders.get('audio', {})
+
+def refresh_in_background(app_config, serial, kind, connection_id=None, callback=None):
+    """
+    Revalidates the capability on a daemon thread. Returns False if a refresh for the
+    same (serial, kind) is already running. callback(value, error) runs on that thread.
+    """
+    with _cache_lock:
+        if (serial, kind) in _inflight:
+            return False
+
+    def task():
+        try:
+            value = get_capability(app_config, serial, kind, connection_id)
+            if callback: callback(value, None)
+        except Exception as e:
+            print(f"Background refresh of {kind} for {serial} failed: {e}")
+            if callback: callback(None, e)
+
+    threading.Thread(target=task, daemon=True).start()
+    return True
@@ -42,6 +42,8 @@ CONF_AUDIO_BITRATE_SLIDER = 'audio_bitrate_slider'
 CONF_VIDEO_BUFFER = 'video_buffer'
 CONF_TRY_UNLOCK = 'try_unlock'
 CONF_FORCE_ADB_FORWARD = 'force_adb_forward'
+CONF_WARM_STANDBY = 'warm_standby'
+CONF_AUTO_RESTART = 'auto_restart'
 ALTERNATE_LAUNCH_METHOD = 'alternate_launch_method'
 CONF_WINDOWING_MODE = 'windowing_mode'
 CONF_SHOW_SYSTEM_APPS = 'show_system_apps'
@@ -159,6 +161,8 @@ TRANSLATIONS = {
                 'no_video': 'No Video',
                 'unlock_device': 'Unlock device',
                 'force_adb_forward': 'Force ADB forward',
+                'warm_standby': 'Warm standby',
+                'auto_restart': 'Auto-restart on crash',
                 'alternate_launch': 'Alternate Launch Method',
             }
         },
@@ -184,9 +188,10 @@ TRANSLATIONS = {
             'virtual_display_warn_msg': "Saving a specific configuration for the Launcher while a global virtual display is active is not recommended.\n\nWould you like to save a specific configuration for the Launcher with 'Max Size' set to 0 (native resolution) instead?",
             'action_cancelled_title': 'Action Cancelled',
             'action_cancelled_msg': "No specific configuration was saved for the Launcher.\n\nTo use the Launcher without a virtual display, please go to the 'Scrcpy' tab, set 'Virtual Display' to 'Disabled', and select a desired 'Max Size'.",
-            'downloading_icons': 'Downloading missing app icons...',
             'confirm_redownload_msg': 'Are you sure you want to clear the icon cache and redownload all icons?\n\nThis may take some time.',
             'folders_btn': 'Folders',
+            'launch_folder_btn': 'Launch Folder',
+            'no_folders': 'No folders',
             'create_session_btn': 'Create New Folder',
             'folders_manager_title': 'Folders Manager',
             'create_session_title': 'Create New Folder',
@@ -207,6 +212,7 @@ TRANSLATIONS = {
             'virtual_display_error': 'Virtual display not found for alternate launch.',
             'app_launch_error_title': 'App Launch Error',
             'scrcpy_error_title': 'Scrcpy Error',
+            'hook_failed_title': 'PRE/POST Command Failed',
             'winlator_launch_error_title': 'Winlator Launch Error',
         },
         'winlator_tab': {
@@ -215,9 +221,6 @@ TRANSLATIONS = {
             'refresh_icons_btn': 'Refresh Icons',
             'searching_games': 'Searching for games...',
             'no_shortcuts': 'No Winlator shortcut found on device.\nPlease export to frontend in Winlator app.',
-            'extracting_icons': 'Extracting Icons',
-            'processing_icons': 'Processing {current} of {total}...',
-            'extraction_finished': 'Icons extraction finished!',
             'no_icons_to_extract': 'No icons to extract.',
             'search_icons_title': 'Search missing icons?',
             'search_icons_msg': '{count} games without icons.\n\nThis process may take several minutes.\n\nWish to continue?',
@@ -250,6 +253,12 @@ TRANSLATIONS = {
             'kill_success': 'Scrcpy session for {name} terminated.',
             'kill_error': 'Could not terminate Scrcpy session for {name} (PID: {pid}).',
             'command_title': 'Command for {name}',
+            'hook_log_header': 'PRE/POST output:',
+            'tile_btn': 'Tile',
+            'focus_action': 'Focus window',
+            'tile_on': 'Tile on',
+            'move_to': 'Move to',
+            'monitor': 'Monitor {n}',
         },
         'web_server_config': {
             'title': 'Web Server Configuration',
@@ -388,6 +397,8 @@ TRANSLATIONS = {
                 'no_video': 'Sem Vídeo',
                 'unlock_device': 'Desbloquear dispositivo',
                 'force_adb_forward': 'Forçar ADB forward',
+                'warm_standby': 'Pré-aquecimento',
+                'auto_restart': 'Reiniciar se cair',
                 'alternate_launch': 'Método de Lançamento Alternativo',
             }
         },
@@ -413,9 +424,10 @@ TRANSLATIONS = {
             'virtual_display_warn_msg': "Salvar uma configuração específica para o Launcher enquanto um display virtual global está ativo não é recomendado.\n\nDeseja salvar uma configuração específica para o Launcher com 'Tamanho Máximo' definido como 0 (resolução nativa) em vez disso?",
             'action_cancelled_title': 'Ação Cancelada',
             'action_cancelled_msg': "Nenhuma configuração específica foi salva para o Launcher.\n\nPara usar o Launcher sem um display virtual, vá para a aba 'Scrcpy', defina 'Display Virtual' como 'Desativado' e selecione o 'Tamanho Máximo' desejado.",
-            'downloading_icons': 'Baixando ícones de apps ausentes...',
             'confirm_redownload_msg': 'Tem certeza de que deseja limpar o cache de ícones e baixar todos os ícones novamente?\n\nIsso pode levar algum tempo.',
             'folders_btn': 'Pastas',
+            'launch_folder_btn': 'Iniciar Pasta',
+            'no_folders': 'Nenhuma pasta',
             'create_session_btn': 'Criar Nova Pasta',
             'folders_manager_title': 'Gerenciar Pastas',
             'create_session_title': 'Criar Nova Pasta',
@@ -436,6 +448,7 @@ TRANSLATIONS = {
             'virtual_display_error': 'Display virtual não encontrado para lançamento alternativo.',
             'app_launch_error_title': 'Erro de Lançamento de App',
             'scrcpy_error_title': 'Erro do Scrcpy',
+            'hook_failed_title': 'Falha em Comando PRE/POST',
             'winlator_launch_error_title': 'Erro de Lançamento do Winlator',
         },
         'winlator_tab': {
@@ -444,9 +457,6 @@ TRANSLATIONS = {
             'refresh_icons_btn': 'Atualizar Ícones',
             'searching_games': 'Buscando jogos...',
             'no_shortcuts': 'Nenhum atalho do Winlator encontrado no dispositivo.\nPor favor, exporte para o frontend no app Winlator.',
-            'extracting_icons': 'Extraindo Ícones',
-            'processing_icons': 'Processando {current} de {total}...',
-            'extraction_finished': 'Extração de ícones finalizada!',
             'no_icons_to_extract': 'Nenhum ícone para extrair.',
             'search_icons_title': 'Buscar ícones ausentes?',
             'search_icons_msg': '{count} jogos sem ícones.\n\nEste processo pode levar alguns minutos.\n\nDeseja continuar?',
@@ -479,6 +489,12 @@ TRANSLATIONS = {
             'kill_success': 'Sessão do Scrcpy para {name} encerrada.',
             'kill_error': 'Não foi possível encerrar a sessão do Scrcpy para {name} (PID: {pid}).',
             'command_title': 'Comando para {name}',
+            'hook_log_header': 'Saída dos comandos PRE/POST:',
+            'tile_btn': 'Organizar',
+            'focus_action': 'Focar janela',
+            'tile_on': 'Organizar em',
+            'move_to': 'Mover para',
+            'monitor': 'Monitor {n}',
         },
         'web_server_config': {
             'title': 'Configuração do Servidor Web',
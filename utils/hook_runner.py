@@ -0,0 +1,124 @@
+# FILE: utils/hook_runner.py
+# PURPOSE: Executa os comandos PRE::/POST:: dos extraargs em paralelo (por estágio),
+#          com timeout por comando, saída registrada no log da sessão e falhas reportadas.
+
+import shlex
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+DEFAULT_HOOK_TIMEOUT = 30
+SESSION_LOG_MAX_LINES = 500
+
+
+@dataclass(frozen=True)
+class Hook:
+    """
+    A PRE/POST command from extraargs. Syntax: PRE[stage][&][@timeout]::command
+      stage   - hooks with the same stage run in parallel; stages run in ascending order
+      &       - detached: the launch does not wait for it (PRE only)
+      timeout - seconds before the hook is killed (default DEFAULT_HOOK_TIMEOUT)
+    """
+    phase: str
+    command: str
+    stage: int = 0
+    detached: bool = False
+    timeout: Optional[float] = None
+
+
+@dataclass
+class HookResult:
+    hook: Hook
+    returncode: Optional[int]
+    output: str
+    duration: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self):
+        return self.error is None and self.returncode == 0
+
+    def describe_failure(self):
+        if self.error:
+            return self.error
+        return f"exit code {self.returncode}"
+
+
+class SessionLog:
+    """Thread-safe, bounded log of everything the hooks of one launch printed."""
+    def __init__(self, max_lines=SESSION_LOG_MAX_LINES):
+        self._lines = deque(maxlen=max_lines)
+        self._lock = threading.Lock()
+
+    def append(self, line):
+        with self._lock:
+            self._lines.append(line)
+
+    def lines(self):
+        with self._lock:
+            return list(self._lines)
+
+    def text(self):
+        return "\n".join(self.lines())
+
+
+def _run_hook(hook, env, startupinfo, log):
+    timeout = hook.timeout or DEFAULT_HOOK_TIMEOUT
+    start = time.monotonic()
+    log.append(f"[{hook.phase}] $ {hook.command}")
+    try:
+        completed = subprocess.run(shlex.split(hook.command), stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                   text=True, startupinfo=startupinfo, env=env, timeout=timeout)
+        result = HookResult(hook, completed.returncode, completed.stdout or '', time.monotonic() - start)
+    except subprocess.TimeoutExpired as e:
+        output = e.output.decode(errors='replace') if isinstance(e.output, bytes) else (e.output or '')
+        result = HookResult(hook, None, output, time.monotonic() - start, error=f"timed out after {timeout}s")
+    except FileNotFoundError as e:
+        result = HookResult(hook, None, '', time.monotonic() - start, error=f"command not found: {e.filename}")
+    except (subprocess.SubprocessError, ValueError, OSError) as e:
+        result = HookResult(hook, None, '', time.monotonic() - start, error=str(e))
+
+    for line in result.output.splitlines():
+        log.append(f"[{hook.phase}]   {line}")
+    status = "ok" if result.ok else f"FAILED ({result.describe_failure()})"
+    log.append(f"[{hook.phase}] {status} in {result.duration * 1000:.0f} ms: {hook.command}")
+    return result
+
+def _report(results, on_failure):
+    for result in results:
+        if not result.ok:
+            print(f"{result.hook.phase} hook '{result.hook.command}' failed: {result.describe_failure()}")
+            if on_failure:
+                try:
+                    on_failure(result)
+                except Exception as e:
+                    print(f"Error reporting hook failure: {e}")
+
+def run_hooks(hooks, env=None, startupinfo=None, log=None, on_failure=None):
+    """
+    Runs the given hooks stage by stage, each stage in parallel, and blocks until they finish.
+    Detached hooks are started on a background thread and are not waited for.
+    Returns the HookResult list of the waited hooks.
+    """
+    log = log if log is not None else SessionLog()
+    detached = [h for h in hooks if h.detached]
+    waited = [h for h in hooks if not h.detached]
+
+    if detached:
+        threading.Thread(target=run_hooks, args=([Hook(h.phase, h.command, h.stage, False, h.timeout) for h in detached], env, startupinfo, log, on_failure), daemon=True).start()
+
+    results = []
+    for stage in sorted({h.stage for h in waited}):
+        stage_hooks = [h for h in waited if h.stage == stage]
+        if len(stage_hooks) == 1:
+            stage_results = [_run_hook(stage_hooks[0], env, startupinfo, log)]
+        else:
+            with ThreadPoolExecutor(max_workers=len(stage_hooks)) as executor:
+                stage_results = list(executor.map(lambda h: _run_hook(h, env, startupinfo, log), stage_hooks))
+        _report(stage_results, on_failure)
+        results.extend(stage_results)
+    return results
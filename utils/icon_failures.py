@@ -0,0 +1,73 @@
+# FILE: utils/icon_failures.py
+# PURPOSE: Cache negativo das buscas de ícone: cada falha guarda classe, horário e contagem nos
+#          metadados do dispositivo, e só volta a ser tentada após uma janela exponencial por classe.
+
+import time
+
+KIND_APP = 'icon_fetch_failure'          # Play Store download of an Android app icon
+KIND_EXE = 'exe_icon_fetch_failure'      # icon extraction from a Winlator game executable
+
+# Legacy permanent booleans, still written so older builds keep skipping the item
+_LEGACY_FLAGS = {KIND_APP: 'icon_fetch_failed', KIND_EXE: 'exe_icon_fetch_failed'}
+
+FAILURE_NOT_FOUND = 'not_found'  # 404 / no icon in the page or executable
+FAILURE_TIMEOUT = 'timeout'
+FAILURE_NETWORK = 'network'      # connection errors, 5xx, rate limiting
+FAILURE_PARSE = 'parse'          # unexpected page or image/PE format
+FAILURE_OTHER = 'other'
+
+# First retry window per class, in seconds; doubles with each consecutive failure
+RETRY_BASE_SECONDS = {
+    FAILURE_NOT_FOUND: 7 * 24 * 3600,
+    FAILURE_TIMEOUT: 15 * 60,
+    FAILURE_NETWORK: 30 * 60,
+    FAILURE_PARSE: 24 * 3600,
+    FAILURE_OTHER: 3600,
+}
+RETRY_MAX_SECONDS = 30 * 24 * 3600
+
+
+def classify_http_status(status_code):
+    if status_code in (404, 410):
+        return FAILURE_NOT_FOUND
+    return FAILURE_NETWORK
+
+def get_failure(metadata, kind):
+    """Returns the failure record {'class', 'at', 'count'} or None. Legacy booleans count as one old failure."""
+    record = metadata.get(kind)
+    if isinstance(record, dict):
+        return record
+    if metadata.get(_LEGACY_FLAGS[kind]):
+        return {'class': FAILURE_OTHER, 'at': 0, 'count': 1}
+    return None
+
+def retry_window(record):
+    base = RETRY_BASE_SECONDS.get(record.get('class'), RETRY_BASE_SECONDS[FAILURE_OTHER])
+    return min(base * 2 ** max(record.get('count', 1) - 1, 0), RETRY_MAX_SECONDS)
+
+def next_retry_at(metadata, kind):
+    """Timestamp after which the item may be fetched again; 0 if it never failed."""
+    record = get_failure(metadata, kind)
+    if record is None:
+        return 0
+    return record.get('at', 0) + retry_window(record)
+
+def has_failed(metadata, kind):
+    return get_failure(metadata, kind) is not None
+
+def is_retry_due(metadata, kind, now=None):
+    """True if the item never failed or its retry window has elapsed."""
+    return (now or time.time()) >= next_retry_at(metadata, kind)
+
+def record_failure(app_config, key, kind, failure_class):
+    previous = get_failure(app_config.get_app_metadata(key), kind)
+    count = (previous.get('count', 0) if previous else 0) + 1
+    app_config.save_app_metadata(key, {
+        kind: {'class': failure_class, 'at': time.time(), 'count': count},
+        _LEGACY_FLAGS[kind]: True,
+    })
+
+def clear_failure(app_config, key, kind):
+    metadata = app_config.get_app_metadata(key)
+    if kind in metadata or metadata.get(_LEGACY_FLAGS[kind]):
+        app_config.save_app_metadata(key, {kind: None, _LEGACY_FLAGS[kind]: False})
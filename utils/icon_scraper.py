@@ -5,22 +5,25 @@ import os
 import requests
 import re
 from PIL import Image
+from . import icon_store, icon_failures
 
 def get_icon(app_name, package_name, cache_dir, app_config, download_if_missing=True):
     """
     Obtém o ícone de um app. Se `download_if_missing` for True, tenta baixar.
     Retorna o caminho para o ícone em cache ou None.
     """
-    icon_path = os.path.join(cache_dir, f"{package_name}.png")
-
-    if os.path.exists(icon_path):
-        return icon_path
-
-    # Se não for para baixar, ou se já falhou antes, não continua.
+    # Ícone já baixado por qualquer dispositivo (store compartilhado) ou sobreposição deste dispositivo
     metadata = app_config.get_app_metadata(package_name)
-    if not download_if_missing or metadata.get('icon_fetch_failed'):
+    stored_path = icon_store.resolve_app_icon(app_config, package_name, metadata)
+    if stored_path:
+        return stored_path
+
+    # Se não for para baixar, ou se falhou e a janela de nova tentativa ainda não passou, não continua.
+    if not download_if_missing or not icon_failures.is_retry_due(metadata, icon_failures.KIND_APP):
         return None
 
+    icon_path = os.path.join(cache_dir, f".{package_name}.download")
+
     try:
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
@@ -32,7 +35,7 @@ def get_icon(app_name, package_name, cache_dir, app_config, download_if_missing=
         # Regex mais robusta que busca pela meta tag og:image.
         match = re.search(r'<meta\s+property="og:image"\s+content="([^"]+)"', response.text)
         if not match:
-            app_config.save_app_metadata(package_name, {"icon_fetch_failed": True})
+            icon_failures.record_failure(app_config, package_name, icon_failures.KIND_APP, icon_failures.FAILURE_PARSE)
             return None
 
         icon_url = match.group(1).replace('=s180-rw', '=s128-rw')
@@ -45,15 +48,31 @@ def get_icon(app_name, package_name, cache_dir, app_config, download_if_missing=
                 f.write(chunk)
 
         with Image.open(icon_path) as img:
-            img.save(icon_path, "PNG")
+            img.load()
+            png_path = f"{icon_path}.png"
+            img.save(png_path, "PNG")
+        icon_hash = icon_store.put_file(app_config, png_path, package_name=package_name)
 
         # Marca que o download foi bem-sucedido (ou pelo menos não falhou)
-        app_config.save_app_metadata(package_name, {"icon_fetch_failed": False})
-        return icon_path
+        icon_failures.clear_failure(app_config, package_name, icon_failures.KIND_APP)
+        return icon_store.blob_path(app_config, icon_hash)
 
+    except requests.exceptions.Timeout:
+        icon_failures.record_failure(app_config, package_name, icon_failures.KIND_APP, icon_failures.FAILURE_TIMEOUT)
+        return None
+    except requests.exceptions.HTTPError as e:
+        status_code = e.response.status_code if e.response is not None else None
+        icon_failures.record_failure(app_config, package_name, icon_failures.KIND_APP, icon_failures.classify_http_status(status_code))
+        return None
     except requests.exceptions.RequestException:
-        app_config.save_app_metadata(package_name, {"icon_fetch_failed": True})
+        icon_failures.record_failure(app_config, package_name, icon_failures.KIND_APP, icon_failures.FAILURE_NETWORK)
+        return None
+    except Image.UnidentifiedImageError:
+        icon_failures.record_failure(app_config, package_name, icon_failures.KIND_APP, icon_failures.FAILURE_PARSE)
         return None
     except Exception:
-        app_config.save_app_metadata(package_name, {"icon_fetch_failed": True})
+        icon_failures.record_failure(app_config, package_name, icon_failures.KIND_APP, icon_failures.FAILURE_OTHER)
         return None
+    finally:
+        if os.path.exists(icon_path):
+            os.remove(icon_path)
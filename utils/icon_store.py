@@ -0,0 +1,216 @@
+# FILE: utils/icon_store.py
+# PURPOSE: Armazenamento de ícones endereçado por conteúdo (sha1 do PNG) dentro do icon_cache,
+#          compartilhado entre dispositivos. O índice global mapeia pacote -> hash e
+#          identidade-do-executável -> hash; cada dispositivo guarda apenas sobreposições
+#          (ícone personalizado em 'custom_icon_hash', falhas de download) nos seus metadados.
+
+import os
+import json
+import shutil
+import struct
+import hashlib
+import threading
+
+STORE_SUBDIR = 'store'
+ICON_INDEX_FILE_NAME = 'icon_index.json'
+PE_HEADER_BYTES = 4096
+
+_index_lock = threading.RLock()
+_index_data = None
+_index_file = None
+_blob_names = None  # filenames present in the store dir, listed once
+
+_PE_RESOURCE_DIRECTORY = 2
+
+
+def _load(app_config):
+    global _index_data, _index_file
+    with _index_lock:
+        index_file = os.path.join(app_config.CONFIG_DIR, ICON_INDEX_FILE_NAME)
+        if _index_data is None or _index_file != index_file:
+            _index_file = index_file
+            _index_data = {}
+            if os.path.exists(index_file):
+                try:
+                    with open(index_file, "r", encoding='utf-8') as f:
+                        _index_data = json.load(f)
+                except (json.JSONDecodeError, IOError):
+                    _index_data = {}
+            _index_data.setdefault('exe', {})
+            _index_data.setdefault('pkg', {})
+            if not _index_data.get('legacy_copies_removed'):
+                _remove_legacy_copies(app_config)
+        return _index_data
+
+def _remove_legacy_copies(app_config):
+    """One-time cleanup: earlier imports copied icon_cache/<pkg>.png into the store and kept both."""
+    icon_dir = app_config.get_icon_cache_dir()
+    try:
+        legacy_files = set(os.listdir(icon_dir))
+    except OSError:
+        legacy_files = set()
+    for package_name, icon_hash in _index_data['pkg'].items():
+        name = f"{package_name}.png"
+        if name in legacy_files and os.path.exists(blob_path(app_config, icon_hash)):
+            try:
+                os.remove(os.path.join(icon_dir, name))
+            except OSError:
+                pass
+    _index_data['legacy_copies_removed'] = True
+    _save()
+
+def _save():
+    with _index_lock:
+        if _index_file is None:
+            return
+        try:
+            with open(_index_file, "w", encoding='utf-8') as f:
+                json.dump(_index_data, f, indent=4)
+        except IOError as e:
+            print(f"Error saving icon index to {_index_file}: {e}")
+
+
+def exe_identity(size, header):
+    """
+    Cheap identity of a PE executable from its size and first bytes: file size, COFF TimeDateStamp,
+    optional-header CheckSum and the resource directory (RVA, size). Returns None if it isn't a PE.
+    """
+    try:
+        if header[:2] != b'MZ':
+            return None
+        pe_offset = struct.unpack_from('<I', header, 0x3C)[0]
+        if header[pe_offset:pe_offset + 4] != b'PE\0\0':
+            return None
+        timestamp = struct.unpack_from('<I', header, pe_offset + 8)[0]
+        optional_header = pe_offset + 24
+        magic, = struct.unpack_from('<H', header, optional_header)
+        checksum, = struct.unpack_from('<I', header, optional_header + 64)
+        data_directories = optional_header + (112 if magic == 0x20B else 96)
+        rsrc_rva, rsrc_size = struct.unpack_from('<II', header, data_directories + 8 * _PE_RESOURCE_DIRECTORY)
+    except struct.error:
+        return None
+    return f"{size}-{timestamp:08x}-{checksum:08x}-{rsrc_rva:x}-{rsrc_size:x}"
+
+def blob_path(app_config, icon_hash):
+    return os.path.join(app_config.get_icon_cache_dir(), STORE_SUBDIR, f"{icon_hash}.png")
+
+def _has_blob(app_config, icon_hash):
+    """Membership test against a single listdir of the store, instead of one stat per icon."""
+    global _blob_names
+    with _index_lock:
+        if _blob_names is None:
+            try:
+                _blob_names = set(os.listdir(os.path.join(app_config.get_icon_cache_dir(), STORE_SUBDIR)))
+            except OSError:
+                _blob_names = set()
+        return f"{icon_hash}.png" in _blob_names
+
+def relative_icon_path(app_config, icon_path):
+    """Path of an icon relative to the icon cache dir (what the web server serves under /icons/)."""
+    return os.path.relpath(icon_path, app_config.get_icon_cache_dir()).replace(os.sep, '/')
+
+def lookup_exe(app_config, identity):
+    """Returns the stored icon hash for an executable identity, or None if it was never extracted."""
+    if not identity:
+        return None
+    with _index_lock:
+        icon_hash = _load(app_config)['exe'].get(identity)
+    if icon_hash and _has_blob(app_config, icon_hash):
+        return icon_hash
+    return None
+
+def lookup_app(app_config, package_name):
+    """Returns the shared icon hash of an Android package (fetched by any device), or None."""
+    with _index_lock:
+        icon_hash = _load(app_config)['pkg'].get(package_name)
+    if icon_hash and _has_blob(app_config, icon_hash):
+        return icon_hash
+    return None
+
+def put_file(app_config, source_path, identity=None, package_name=None, copy=False):
+    """
+    Moves (or copies) a PNG into the store under the sha1 of its bytes and records
+    identity -> hash and/or package -> hash. An icon already in the store is not written again.
+    Returns the icon hash.
+    """
+    with open(source_path, 'rb') as f:
+        icon_hash = hashlib.sha1(f.read()).hexdigest()
+    destination = blob_path(app_config, icon_hash)
+    if os.path.exists(destination):
+        if not copy:
+            os.remove(source_path)
+    else:
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        (shutil.copyfile if copy else shutil.move)(source_path, destination)
+
+    with _index_lock:
+        if _blob_names is not None:
+            _blob_names.add(f"{icon_hash}.png")
+        if identity or package_name:
+            index = _load(app_config)
+            if identity:
+                index['exe'][identity] = icon_hash
+            if package_name:
+                index['pkg'][package_name] = icon_hash
+            _save()
+    return icon_hash
+
+def put_custom_icon(app_config, key, source_path):
+    """Stores a user-chosen icon as an override for this device only. Returns its path in the store."""
+    icon_hash = put_file(app_config, source_path)
+    app_config.save_app_metadata(key, {'has_custom_icon': True, 'custom_icon_hash': icon_hash})
+    return blob_path(app_config, icon_hash)
+
+def forget_app_icon(app_config, package_name):
+    """Drops the shared package -> icon link so the next lookup downloads it again."""
+    with _index_lock:
+        if _load(app_config)['pkg'].pop(package_name, None) is not None:
+            _save()
+
+def _custom_icon(app_config, metadata):
+    icon_hash = metadata.get('custom_icon_hash')
+    if icon_hash and _has_blob(app_config, icon_hash):
+        return blob_path(app_config, icon_hash)
+    return None
+
+def _legacy_icon(app_config, name):
+    legacy_path = os.path.join(app_config.get_icon_cache_dir(), f"{name}.png")
+    return legacy_path if os.path.exists(legacy_path) else None
+
+def resolve_app_icon(app_config, package_name, metadata=None):
+    """
+    Icon file for an Android package: the device's custom override, else the shared store icon,
+    else a pre-store per-package file (imported into the shared index on first sight). None if missing.
+    """
+    if metadata is None:
+        metadata = app_config.get_app_metadata(package_name)
+    custom_path = _custom_icon(app_config, metadata)
+    if custom_path:
+        return custom_path
+    icon_hash = lookup_app(app_config, package_name)
+    if icon_hash:
+        return blob_path(app_config, icon_hash)
+
+    legacy_path = _legacy_icon(app_config, package_name)
+    if legacy_path and not metadata.get('has_custom_icon'):
+        try:
+            # Moved, not copied: once indexed, the store blob is the only copy of the icon
+            return blob_path(app_config, put_file(app_config, legacy_path, package_name=package_name))
+        except OSError:
+            pass
+    return legacy_path
+
+def resolve_winlator_icon(app_config, shortcut_path, metadata=None):
+    """
+    Icon file for a Winlator shortcut: the device's custom override, else the extracted icon linked
+    in the device metadata ('icon_hash'), else the legacy per-basename file. None if there is none.
+    """
+    if metadata is None:
+        metadata = app_config.get_app_metadata(shortcut_path)
+    custom_path = _custom_icon(app_config, metadata)
+    if custom_path:
+        return custom_path
+    icon_hash = metadata.get('icon_hash')
+    if icon_hash and not metadata.get('has_custom_icon') and _has_blob(app_config, icon_hash):
+        return blob_path(app_config, icon_hash)
+    return _legacy_icon(app_config, os.path.basename(shortcut_path))
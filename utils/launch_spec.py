@@ -0,0 +1,296 @@
+# FILE: utils/launch_spec.py
+# PURPOSE: Compila o dicionário de configuração num LaunchSpec tipado e validado,
+#          reutilizado em todos os lançamentos (GUI e web) enquanto o perfil não muda.
+
+import re
+import shlex
+import subprocess
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from .env_helper import get_clean_env
+from .hook_runner import Hook
+
+from utils.constants import *
+
+_SPEC_CACHE_SIZE = 32
+_spec_cache = OrderedDict()
+_spec_lock = threading.Lock()
+_supported_flags = None
+
+# Every key that influences the compiled spec; anything else in config_values is ignored
+_SPEC_KEYS = (
+    'start_app_name', 'turn_screen_off', 'fullscreen', 'mipmaps', 'stay_awake', 'no_audio', 'no_video',
+    CONF_FORCE_ADB_FORWARD, 'allow_frame_drop', 'low_latency', 'priority_mode', 'bitrate_mode',
+    'color_range', 'iframe_interval', 'mouse_mode', 'gamepad_mode', 'keyboard_mode', 'mouse_bind',
+    'render_driver', 'max_fps', 'video_bitrate_slider', 'audio_bitrate_slider', 'audio_buffer',
+    'video_buffer', 'start_app', 'video_codec', 'video_encoder', 'audio_codec', 'audio_encoder',
+    'new_display', 'max_size', 'extraargs',
+)
+
+_BOOL_FLAGS = (
+    ('turn_screen_off', '--turn-screen-off'),
+    ('fullscreen', '--fullscreen'),
+    ('mipmaps', '--no-mipmaps'),
+    ('stay_awake', '--stay-awake'),
+    ('no_audio', '--no-audio'),
+    ('no_video', '--no-video'),
+    (CONF_FORCE_ADB_FORWARD, '--force-adb-forward'),
+)
+
+# config value -> video codec option; values missing from a table are rejected
+_CODEC_OPTION_TABLES = (
+    ('allow_frame_drop', {'Enabled': 'allow-frame-drop=1', 'Disabled': 'allow-frame-drop=0'}),
+    ('low_latency', {'Enabled': 'low-latency:int=1', 'Disabled': 'low-latency:int=0'}),
+    ('priority_mode', {'Realtime': 'priority:int=0', 'Normal': 'priority:int=1'}),
+    ('bitrate_mode', {'constant': 'bitrate-mode:int=1', 'cbr': 'bitrate-mode:int=1',
+                      'variable': 'bitrate-mode:int=2', 'vbr': 'bitrate-mode:int=2'}),
+    ('color_range', {'Auto': None, 'Full': 'color-range:int=1', 'Limited': 'color-range:int=2'}),
+)
+
+_MAPPED_ARGS = (
+    ('mouse_mode', '--mouse', None),
+    ('gamepad_mode', '--gamepad', None),
+    ('keyboard_mode', '--keyboard', None),
+    ('mouse_bind', '--mouse-bind', None),
+    ('render_driver', '--render-driver', None),
+    ('max_fps', '--max-fps', int),
+    ('video_bitrate_slider', '--video-bit-rate', int),
+    ('audio_bitrate_slider', '--audio-bit-rate', int),
+    ('audio_buffer', '--audio-buffer', int),
+    ('video_buffer', '--video-buffer', int),
+)
+_UNSET_VALUES = ('Auto', 'None', '0', 'disabled', '')
+
+_NEGATIVE_NUMBER_PATTERN = re.compile(r'^-\d')
+_NEW_DISPLAY_PATTERN = re.compile(r'^(\d+x\d+)?(/\d+)?$')
+_HOOK_PATTERN = re.compile(r'^(PRE|POST)(\d*)(&?)(?:@(\d+(?:\.\d+)?))?::(.*)$', re.IGNORECASE | re.DOTALL)
+_ENV_EXPORT_PATTERN = re.compile(r'^export\s+([a-zA-Z_][a-zA-Z0-9_]*)=(.*)$')
+
+
+class LaunchSpecError(ValueError):
+    """Raised when a launch configuration can't produce a valid scrcpy command line."""
+    def __init__(self, problems):
+        self.problems = list(problems)
+        super().__init__("Invalid launch configuration: " + "; ".join(self.problems))
+
+
+@dataclass(frozen=True)
+class LaunchSpec:
+    """Device-independent part of a scrcpy launch, compiled once per distinct configuration."""
+    default_title: Optional[str]
+    options: Tuple[str, ...]
+    start_app: Optional[str]
+    codec_and_display_args: Tuple[str, ...]
+    extra_args: Tuple[str, ...]
+    prepend_cmds: Tuple[Hook, ...]
+    append_cmds: Tuple[Hook, ...]
+    env_vars: Tuple[Tuple[str, str], ...]
+
+    def build_argv(self, device_id=None, window_title=None, force_no_start_app=False, window_rect=None):
+        """
+        Returns the scrcpy argv for a specific device/window; no parsing or validation happens here.
+        window_rect (x, y, width, height) places the window, e.g. a tile of a folder launch.
+        """
+        cmd = ['scrcpy']
+        if device_id:
+            cmd.extend(['-s', device_id])
+
+        # Sanitize device_id for window title if it's an IP address
+        title_device_part = device_id.replace(':', ' ') if device_id else 'Android Device'
+        title = window_title or self.default_title or title_device_part
+        if title and title != 'None':
+            cmd.append(f"--window-title={title}")
+
+        cmd.extend(self.options)
+        if self.start_app and not force_no_start_app:
+            cmd.append(f"--start-app={self.start_app}")
+        cmd.extend(self.codec_and_display_args)
+        if window_rect:
+            x, y, width, height = window_rect
+            cmd.extend([f"--window-x={x}", f"--window-y={y}", f"--window-width={width}", f"--window-height={height}"])
+        cmd.extend(self.extra_args)
+        return cmd
+
+
+def parse_extra_args(extra_args_str):
+    """
+    Analisa a string de argumentos extras para separar comandos PRE, POST, variáveis de ambiente e argumentos do scrcpy.
+    PRE/POST aceitam estágio, '&' e timeout: PRE1&@20::cmd (ver hook_runner.Hook).
+    """
+    prepend_cmds = []
+    append_cmds = []
+    scrcpy_args = []
+    env_vars = {}
+
+    for command in (extra_args_str or '').strip().split(';'):
+        command = command.strip()
+        if not command:
+            continue
+        hook_match = _HOOK_PATTERN.match(command)
+        if hook_match:
+            phase, stage, detached, timeout, cmd_content = hook_match.groups()
+            phase = phase.upper()
+            cmd_content = cmd_content.strip()
+            # Check for environment variable export
+            env_match = _ENV_EXPORT_PATTERN.match(cmd_content) if phase == 'PRE' else None
+            if env_match:
+                env_vars[env_match.group(1)] = env_match.group(2)
+                continue
+            shlex.split(cmd_content)  # Surface quoting errors at compile time
+            hook = Hook(phase, cmd_content, int(stage or 0), bool(detached), float(timeout) if timeout else None)
+            (prepend_cmds if phase == 'PRE' else append_cmds).append(hook)
+        else:
+            scrcpy_args.extend(shlex.split(command))
+
+    return {'prepend': prepend_cmds, 'append': append_cmds, 'scrcpy': scrcpy_args, 'env_vars': env_vars}
+
+
+def get_supported_flags():
+    """
+    Returns the flags accepted by the installed scrcpy (parsed once from --help).
+    An empty set means the help could not be read, and flag validation is skipped.
+    """
+    global _supported_flags
+    if _supported_flags is None:
+        help_text = ""
+        try:
+            result = subprocess.run(['scrcpy', '--help'], capture_output=True, text=True, env=get_clean_env(), timeout=5)
+            help_text = result.stdout + result.stderr
+        except (subprocess.SubprocessError, FileNotFoundError, OSError):
+            pass
+        _supported_flags = parse_help_flags(help_text)
+    return _supported_flags
+
+def parse_help_flags(help_text):
+    """Flags listed in `scrcpy --help`: long ones anywhere, short ones as '-b, --...' or alone ('-K')."""
+    flags = set(re.findall(r'(?<![\w-])(--[a-z0-9][a-z0-9-]*)', help_text))
+    flags.update(re.findall(r'^\s+(-[a-zA-Z0-9])(?:,|\s*$)', help_text, re.MULTILINE))
+    return frozenset(flags)
+
+def _is_flag(arg):
+    # '-10' (e.g. in '--angle -10') is a negative value, not a short flag
+    return arg.startswith('-') and not _NEGATIVE_NUMBER_PATTERN.match(arg)
+
+def _flag_name(arg):
+    if arg.startswith('--'):
+        return arg.split('=', 1)[0]
+    return arg[:2]
+
+def _compile(config_values):
+    problems = []
+
+    options = [flag for key, flag in _BOOL_FLAGS if config_values.get(key)]
+
+    video_codec_options = []
+    for key, table in _CODEC_OPTION_TABLES:
+        raw = config_values.get(key)
+        if raw is None or raw == '':
+            continue
+        value = str(raw).strip()
+        if key == 'bitrate_mode':
+            value = value.lower()
+        if value not in table:
+            problems.append(f"{key}: unsupported value '{raw}'")
+        elif table[value]:
+            video_codec_options.append(table[value])
+
+    iframe_interval = config_values.get('iframe_interval')
+    if iframe_interval not in (None, ''):
+        try:
+            iframe_interval = int(iframe_interval)
+            if iframe_interval < 0:
+                raise ValueError
+            if iframe_interval > 0:
+                video_codec_options.append(f'iframe-interval={iframe_interval}')
+        except (TypeError, ValueError):
+            problems.append(f"iframe_interval: expected a non-negative integer, got '{iframe_interval}'")
+
+    if video_codec_options:
+        options.append(f"--video-codec-options={','.join(video_codec_options)}")
+
+    for key, arg_name, kind in _MAPPED_ARGS:
+        val = config_values.get(key)
+        if not val or str(val) in _UNSET_VALUES:
+            continue
+        if kind is int:
+            try:
+                int(val)
+            except (TypeError, ValueError):
+                problems.append(f"{key}: expected an integer, got '{val}'")
+                continue
+        suffix = 'K' if key == 'video_bitrate_slider' else ''
+        options.append(f"{arg_name}={val}{suffix}")
+
+    start_app = config_values.get('start_app')
+    if not start_app or start_app in ('launcher_shortcut', 'None'):
+        start_app = None
+
+    codec_and_display_args = []
+    for kind in ('video', 'audio'):
+        codec_val = config_values.get(f'{kind}_codec')
+        encoder_val = config_values.get(f'{kind}_encoder')
+        if codec_val != 'Auto' and codec_val and encoder_val and encoder_val != 'Auto':
+            codec_and_display_args.append(f"--{kind}-codec={codec_val.split(' - ')[-1]}")
+            codec_and_display_args.append(f"--{kind}-encoder={encoder_val.split()[0]}")
+
+    new_display_val = config_values.get('new_display')
+    if new_display_val and new_display_val != 'Disabled':
+        if not _NEW_DISPLAY_PATTERN.match(str(new_display_val)):
+            problems.append(f"new_display: expected [WIDTHxHEIGHT][/DPI], got '{new_display_val}'")
+        codec_and_display_args.append(f"--new-display={new_display_val}")
+    else:
+        max_size_val = str(config_values.get('max_size', '0'))
+        if not max_size_val.isdigit():
+            problems.append(f"max_size: expected an integer, got '{max_size_val}'")
+        elif max_size_val != '0':
+            codec_and_display_args.append(f"--max-size={max_size_val}")
+
+    try:
+        parsed_args = parse_extra_args(config_values.get('extraargs', ''))
+    except ValueError as e:
+        problems.append(f"extraargs: {e}")
+        parsed_args = {'prepend': [], 'append': [], 'scrcpy': [], 'env_vars': {}}
+
+    supported = get_supported_flags()
+    if supported:
+        for arg in options + codec_and_display_args:
+            if _flag_name(arg) not in supported:
+                problems.append(f"{_flag_name(arg)} is not supported by the installed scrcpy")
+        for arg in parsed_args['scrcpy']:
+            if _is_flag(arg) and _flag_name(arg) not in supported:
+                problems.append(f"extraargs: unknown scrcpy flag '{_flag_name(arg)}'")
+
+    if problems:
+        raise LaunchSpecError(problems)
+
+    return LaunchSpec(
+        default_title=config_values.get('start_app_name'),
+        options=tuple(options),
+        start_app=start_app,
+        codec_and_display_args=tuple(codec_and_display_args),
+        extra_args=tuple(parsed_args['scrcpy']),
+        prepend_cmds=tuple(parsed_args['prepend']),
+        append_cmds=tuple(parsed_args['append']),
+        env_vars=tuple(parsed_args['env_vars'].items()),
+    )
+
+def compile_launch_spec(config_values):
+    """
+    Returns the LaunchSpec for config_values, reusing the compiled spec while the relevant
+    values are unchanged. Raises LaunchSpecError with every problem found.
+    """
+    cache_key = tuple(repr(config_values.get(key)) for key in _SPEC_KEYS)
+    with _spec_lock:
+        spec = _spec_cache.get(cache_key)
+        if spec is not None:
+            _spec_cache.move_to_end(cache_key)
+            return spec
+
+    spec = _compile(config_values)
+    with _spec_lock:
+        _spec_cache[cache_key] = spec
+        while len(_spec_cache) > _SPEC_CACHE_SIZE:
+            _spec_cache.popitem(last=False)
+    return spec
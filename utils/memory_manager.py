@@ -0,0 +1,137 @@
+# FILE: utils/memory_manager.py
+# PURPOSE: Limpeza de memória sob demanda: os pedidos (gc / malloc_trim) são acumulados e
+#          executados em lote quando a interface está ociosa, apenas se o crescimento do heap Python
+#          ou do RSS passou dos limites. Cada limpeza registra o que foi de fato recuperado.
+
+import gc
+import sys
+import time
+import ctypes
+import threading
+import psutil
+
+# Python heap growth (allocated blocks) since the last collection that justifies a full gc.collect()
+GC_BLOCK_GROWTH_THRESHOLD = 200_000
+# RSS growth since the last trim that justifies malloc_trim
+TRIM_RSS_GROWTH_BYTES = 64 * 1024 * 1024
+# A pending request is flushed even if the app never goes idle for this long
+MAX_DEFER_SECONDS = 30.0
+
+_lock = threading.RLock()
+_pending_reasons = set()
+_pending_since = None
+_pending_trim = False
+_baseline_blocks = None
+_baseline_rss = None
+_process = None
+_libc = None
+_totals = {'requests': 0, 'flushes': 0, 'collections': 0, 'trims': 0,
+           'objects_freed': 0, 'blocks_freed': 0, 'rss_freed': 0}
+
+
+def _rss():
+    global _process
+    try:
+        if _process is None:
+            _process = psutil.Process()
+        return _process.memory_info().rss
+    except psutil.Error:
+        return 0
+
+def _malloc_trim():
+    """Returns free heap pages to the OS (glibc only). False where it isn't available."""
+    global _libc
+    try:
+        if _libc is None:
+            _libc = ctypes.CDLL("libc.so.6")
+        _libc.malloc_trim(0)
+        return True
+    except (OSError, AttributeError):
+        return False
+
+def _ensure_baseline():
+    global _baseline_blocks, _baseline_rss
+    if _baseline_blocks is None:
+        _baseline_blocks = sys.getallocatedblocks()
+        _baseline_rss = _rss()
+
+
+def request_cleanup(reason, trim=False):
+    """
+    Asks for a cleanup without doing it now; safe to call from any thread. trim=True marks that
+    a large native release happened (e.g. a QML scene was destroyed) so malloc_trim is worth it.
+    """
+    global _pending_since, _pending_trim
+    with _lock:
+        _ensure_baseline()
+        _totals['requests'] += 1
+        _pending_reasons.add(reason)
+        _pending_trim = _pending_trim or trim
+        if _pending_since is None:
+            _pending_since = time.monotonic()
+
+def has_pending():
+    with _lock:
+        return bool(_pending_reasons)
+
+def flush_if_due(busy=False):
+    """Runs the pending cleanup when the caller is idle, or when it has waited MAX_DEFER_SECONDS."""
+    with _lock:
+        if not _pending_reasons:
+            return None
+        if busy and time.monotonic() - _pending_since < MAX_DEFER_SECONDS:
+            return None
+    return flush()
+
+def flush(force=False):
+    """
+    Runs the batched cleanup: gc.collect() only past GC_BLOCK_GROWTH_THRESHOLD, malloc_trim only past
+    TRIM_RSS_GROWTH_BYTES (or after a trim request). Returns a report of what was reclaimed.
+    """
+    global _pending_since, _pending_trim, _baseline_blocks, _baseline_rss
+    with _lock:
+        _ensure_baseline()
+        reasons = sorted(_pending_reasons)
+        wants_trim = _pending_trim
+        _pending_reasons.clear()
+        _pending_since = None
+        _pending_trim = False
+
+        started = time.perf_counter()
+        blocks_before = sys.getallocatedblocks()
+        rss_before = _rss()
+        report = {'reasons': reasons, 'collected': None, 'trimmed': False}
+
+        if force or blocks_before - _baseline_blocks >= GC_BLOCK_GROWTH_THRESHOLD:
+            report['collected'] = gc.collect()
+            _totals['collections'] += 1
+            _totals['objects_freed'] += report['collected']
+        if force or wants_trim or rss_before - _baseline_rss >= TRIM_RSS_GROWTH_BYTES:
+            report['trimmed'] = _malloc_trim()
+            _totals['trims'] += report['trimmed']
+
+        blocks_after = sys.getallocatedblocks()
+        rss_after = _rss()
+        report['blocks_freed'] = blocks_before - blocks_after
+        report['rss_freed'] = rss_before - rss_after
+        report['rss'] = rss_after
+        report['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        _totals['flushes'] += 1
+        if report['collected'] is not None:
+            _totals['blocks_freed'] += report['blocks_freed']
+            _baseline_blocks = blocks_after
+        if report['trimmed'] or report['collected'] is not None:
+            _totals['rss_freed'] += report['rss_freed']
+        if report['trimmed']:
+            _baseline_rss = rss_after
+
+    if report['collected'] is not None or report['trimmed']:
+        print(f"[Memory] {', '.join(reasons) or 'manual'}: gc freed {report['collected'] or 0} objects, "
+              f"{report['blocks_freed']} blocks and {report['rss_freed'] / 1048576:.1f} MB RSS "
+              f"(now {rss_after / 1048576:.1f} MB) in {report['elapsed_ms']} ms")
+    return report
+
+def get_totals():
+    """Cumulative counters since startup (requests vs. actual collections/trims and what they freed)."""
+    with _lock:
+        return dict(_totals)
@@ -0,0 +1,176 @@
+# FILE: utils/model_diff.py
+# PURPOSE: Diff por chave entre duas listas de itens, em O(n log n): gera o lote mínimo de
+#          operações remove/move/insert/change (os itens da maior subsequência crescente ficam
+#          parados) para um modelo Qt aplicar em sequência, sem resetar o modelo.
+
+from bisect import bisect_left
+
+OP_REMOVE = 'remove'  # (OP_REMOVE, start, count)
+OP_MOVE = 'move'      # (OP_MOVE, start, count, dest) -> dest is the first row of the block after the move
+OP_INSERT = 'insert'  # (OP_INSERT, start, items)
+OP_CHANGE = 'change'  # (OP_CHANGE, row, item, changed_fields)
+
+
+def _runs(indices):
+    """Groups sorted indices into (start, count) runs of consecutive values."""
+    runs = []
+    for index in indices:
+        if runs and runs[-1][0] + runs[-1][1] == index:
+            runs[-1][1] += 1
+        else:
+            runs.append([index, 1])
+    return runs
+
+def _stable_keys(current, new_pos):
+    """Keys of the longest subsequence of current that is already in the new order (patience sort)."""
+    tails = []       # tails[n] = position in current of the smallest tail of an increasing run of length n+1
+    tail_values = []
+    parents = [-1] * len(current)
+    for i, key in enumerate(current):
+        value = new_pos[key]
+        n = bisect_left(tail_values, value)
+        if n:
+            parents[i] = tails[n - 1]
+        if n == len(tails):
+            tails.append(i)
+            tail_values.append(value)
+        else:
+            tails[n] = i
+            tail_values[n] = value
+    stable = set()
+    i = tails[-1] if tails else -1
+    while i != -1:
+        stable.add(current[i])
+        i = parents[i]
+    return stable
+
+
+class _RankIndex:
+    """
+    Current row of each key while the diff reorders them, in O(log n): every key holds a sortable
+    label that matches its place in the list, and a Fenwick tree counts the labels that are present.
+    """
+    def __init__(self, labels):
+        self._slot = {label: i + 1 for i, label in enumerate(sorted(set(labels)))}
+        self._tree = [0] * (len(self._slot) + 1)
+        self._label = {}
+
+    def add(self, key, label):
+        self._label[key] = label
+        i = self._slot[label]
+        while i < len(self._tree):
+            self._tree[i] += 1
+            i += i & -i
+
+    def discard(self, key):
+        i = self._slot[self._label.pop(key)]
+        while i < len(self._tree):
+            self._tree[i] -= 1
+            i += i & -i
+
+    def row(self, key):
+        i = self._slot[self._label[key]]
+        count = 0
+        while i:
+            count += self._tree[i]
+            i -= i & -i
+        return count - 1
+
+def _changed_fields(old, new):
+    return [field for field in set(old) | set(new) if old.get(field) != new.get(field)]
+
+def _placement_ops(current, new_keys, new_items, new_pos, stable, old_by_key):
+    """Block moves/inserts that bring every non-stable key right after its predecessor in new_keys."""
+    ops = []
+    # Labels: a key in its final place is (2 * new index, 0). A key still waiting to move sits after
+    # the placed run that follows its preceding stable key, so it is labelled just below the next
+    # stable key, keeping its current order: (2 * next stable index - 1, current row).
+    initial = {}
+    next_stable = len(new_keys)
+    for row in range(len(current) - 1, -1, -1):
+        k = current[row]
+        if k in stable:
+            next_stable = new_pos[k]
+            initial[k] = (2 * next_stable, 0)
+        else:
+            initial[k] = (2 * next_stable - 1, row)
+    ranks = _RankIndex(list(initial.values()) + [(2 * i, 0) for i in range(len(new_keys))])
+    for k, label in initial.items():
+        ranks.add(k, label)
+
+    j = 0
+    while j < len(new_keys):
+        k = new_keys[j]
+        if k in stable:
+            j += 1
+            continue
+        dest = ranks.row(new_keys[j - 1]) + 1 if j else 0
+        if k not in old_by_key:
+            end = j + 1
+            while end < len(new_keys) and new_keys[end] not in old_by_key:
+                end += 1
+            for i in range(j, end):
+                ranks.add(new_keys[i], (2 * i, 0))
+            ops.append((OP_INSERT, dest, new_items[j:end]))
+        else:
+            src = ranks.row(k)
+            end = j + 1
+            while (end < len(new_keys) and new_keys[end] in old_by_key and new_keys[end] not in stable
+                   and ranks.row(new_keys[end]) == src + end - j):
+                end += 1
+            count = end - j
+            for i in range(j, end):
+                ranks.discard(new_keys[i])
+                ranks.add(new_keys[i], (2 * i, 0))
+            if src != dest:
+                if dest > src:
+                    dest -= count
+                ops.append((OP_MOVE, src, count, dest))
+        j = end
+    return ops
+
+
+def diff_items(old_items, new_items, key):
+    """
+    Returns the operations that turn old_items into new_items, to be applied in order:
+    removals (from the end), then block moves/inserts placing each out-of-order run right after its
+    predecessor in the new list, then per-row changes with the fields that differ.
+    Keys must be unique within each list. Runs in O(n log n).
+    """
+    old_keys = [key(item) for item in old_items]
+    new_keys = [key(item) for item in new_items]
+    new_pos = {k: i for i, k in enumerate(new_keys)}
+    old_by_key = dict(zip(old_keys, old_items))
+    ops = []
+
+    removed = [i for i, k in enumerate(old_keys) if k not in new_pos]
+    for start, count in reversed(_runs(removed)):
+        ops.append((OP_REMOVE, start, count))
+    current = [k for k in old_keys if k in new_pos] if removed else old_keys
+
+    stable = _stable_keys(current, new_pos)
+    if len(stable) < len(new_keys):
+        ops.extend(_placement_ops(current, new_keys, new_items, new_pos, stable, old_by_key))
+
+    for row, item in enumerate(new_items):
+        old = old_by_key.get(new_keys[row])
+        if old is not None and old is not item and old != item:
+            ops.append((OP_CHANGE, row, item, _changed_fields(old, item)))
+    return ops
+
+def apply_ops(items, ops):
+    """Applies diff_items() operations to a plain list (reference implementation of what the model does)."""
+    items = list(items)
+    for op in ops:
+        if op[0] == OP_REMOVE:
+            del items[op[1]:op[1] + op[2]]
+        elif op[0] == OP_MOVE:
+            _, start, count, dest = op
+            block = items[start:start + count]
+            del items[start:start + count]
+            items[dest:dest] = block
+        elif op[0] == OP_INSERT:
+            items[op[1]:op[1]] = op[2]
+        elif op[0] == OP_CHANGE:
+            items[op[1]] = op[2]
+    return items
@@ -2,7 +2,6 @@
 # PURPOSE: Centraliza todos os comandos que interagem com o scrcpy.
 
 import subprocess
-import shlex
 import psutil
 import os
 import re
@@ -10,6 +9,8 @@ import threading
 import time # Added for delays in output parsing
 import utils.adb_handler # Explicit import for clarity
 from .env_helper import get_clean_env
+from .launch_spec import compile_launch_spec, get_supported_flags, LaunchSpecError
+from .hook_runner import run_hooks, SessionLog
 
 from utils.constants import *
 
@@ -21,144 +22,6 @@ def _get_startupinfo():
         return startupinfo
     return None
 
-def _parse_extra_args(extra_args_str):
-    """Analisa a string de argumentos extras para separar comandos PRE, POST, variáveis de ambiente e argumentos do scrcpy."""
-    prepend_cmds = []
-    append_cmds = []
-    scrcpy_args = []
-    env_vars = {}
-
-    for command in extra_args_str.strip().split(';'):
-        command = command.strip()
-        if not command:
-            continue
-        if command.upper().startswith('PRE::'):
-            cmd_content = command[5:].strip()
-            # Check for environment variable export
-            env_match = re.match(r'^export\s+([a-zA-Z_][a-zA-Z0-9_]*)=(.*)$', cmd_content)
-            if env_match:
-                var_name = env_match.group(1)
-                var_value = env_match.group(2)
-                env_vars[var_name] = var_value
-            else:
-                prepend_cmds.append(cmd_content)
-        elif command.upper().startswith('POST::'):
-            append_cmds.append(command[6:].strip())
-        else:
-            scrcpy_args.extend(shlex.split(command))
-
-    return {'prepend': prepend_cmds, 'append': append_cmds, 'scrcpy': scrcpy_args, 'env_vars': env_vars}
-
-
-def _build_command(config_values, extra_scrcpy_args=None, window_title=None, device_id=None, force_no_start_app=False):
-    """Constrói a lista de argumentos para o comando scrcpy."""
-    cmd = ['scrcpy']
-    if device_id:
-        cmd.extend(['-s', device_id])
-
-    # Sanitize device_id for window title if it's an IP address
-    title_device_part = device_id.replace(':', ' ') if device_id else 'Android Device'
-    title = window_title or config_values.get('start_app_name') or title_device_part
-    if title and title != 'None':
-        cmd.append(f"--window-title={title}")
-
-    if config_values.get('turn_screen_off'): cmd.append('--turn-screen-off')
-    if config_values.get('fullscreen'): cmd.append('--fullscreen')
-    if config_values.get('mipmaps'): cmd.append('--no-mipmaps')
-    if config_values.get('stay_awake'): cmd.append('--stay-awake')
-    if config_values.get('no_audio'): cmd.append('--no-audio')
-    if config_values.get('no_video'): cmd.append('--no-video')
-    if config_values.get(CONF_FORCE_ADB_FORWARD): cmd.append('--force-adb-forward')
-
-    video_codec_options = []
-    if config_values.get('allow_frame_drop') == 'Enabled':
-        video_codec_options.append('allow-frame-drop=1')
-    elif config_values.get('allow_frame_drop') == 'Disabled':
-        video_codec_options.append('allow-frame-drop=0')
-
-    if config_values.get('low_latency') == 'Enabled':
-        video_codec_options.append('low-latency:int=1')
-    elif config_values.get('low_latency') == 'Disabled':
-        video_codec_options.append('low-latency:int=0')
-
-    if config_values.get('priority_mode') == 'Realtime':
-        video_codec_options.append('priority:int=0')
-    elif config_values.get('priority_mode') == 'Normal':
-        video_codec_options.append('priority:int=1')
-
-    bitrate_mode_val = config_values.get('bitrate_mode', '').lower().strip()
-    if bitrate_mode_val in ['constant', 'cbr']:
-        video_codec_options.append('bitrate-mode:int=1')
-    elif bitrate_mode_val in ['variable', 'vbr']:
-        video_codec_options.append('bitrate-mode:int=2')
-
-    if config_values.get('color_range') == 'Full':
-        video_codec_options.append('color-range:int=1')
-    elif config_values.get('color_range') == 'Limited':
-        video_codec_options.append('color-range:int=2')
-
-    iframe_interval = config_values.get('iframe_interval')
-    if iframe_interval is not None and int(iframe_interval) > 0:
-        video_codec_options.append(f'iframe-interval={int(iframe_interval)}')
-
-    if video_codec_options:
-        cmd.append(f"--video-codec-options={','.join(video_codec_options)}")
-
-    map_args = {
-        'mouse_mode': '--mouse',
-        'gamepad_mode': '--gamepad',
-        'keyboard_mode': '--keyboard',
-        'mouse_bind': '--mouse-bind',
-        'render_driver': '--render-driver',
-        'max_fps': '--max-fps',
-        'video_bitrate_slider': '--video-bit-rate',
-        'audio_bitrate_slider': '--audio-bit-rate',
-        'audio_buffer': '--audio-buffer',
-        'video_buffer': '--video-buffer',
-    }
-    for key, arg_name in map_args.items():
-        val = config_values.get(key)
-        if val and str(val) not in ('Auto', 'None', '0', 'disabled', ''):
-            suffix = 'K' if key == 'video_bitrate_slider' else ''
-            cmd.append(f"{arg_name}={val}{suffix}")
-
-    # Handle start_app separately to avoid adding it to map_args
-    # If force_no_start_app is True, then we explicitly do NOT add --start-app
-    start_app_val = config_values.get('start_app')
-    if not force_no_start_app and start_app_val and start_app_val not in ('launcher_shortcut', 'None'):
-        cmd.append(f"--start-app={start_app_val}")
-
-    if config_values.get('video_codec') != 'Auto':
-        codec_val = config_values.get('video_codec')
-        encoder_val = config_values.get('video_encoder')
-        if codec_val and encoder_val and encoder_val != 'Auto':
-            codec = codec_val.split(' - ')[-1]
-            encoder = encoder_val.split()[0]
-            cmd.append(f"--video-codec={codec}")
-            cmd.append(f"--video-encoder={encoder}")
-
-    if config_values.get('audio_codec') != 'Auto':
-        codec_val = config_values.get('audio_codec')
-        encoder_val = config_values.get('audio_encoder')
-        if codec_val and encoder_val and encoder_val != 'Auto':
-            codec = codec_val.split(' - ')[-1]
-            encoder = encoder_val.split()[0]
-            cmd.append(f"--audio-codec={codec}")
-            cmd.append(f"--audio-encoder={encoder}")
-
-    new_display_val = config_values.get('new_display')
-    if new_display_val and new_display_val != 'Disabled':
-        cmd.append(f"--new-display={new_display_val}")
-    else:
-        max_size_val = str(config_values.get('max_size', '0'))
-        if max_size_val != '0':
-            cmd.append(f"--max-size={max_size_val}")
-
-    if extra_scrcpy_args:
-        cmd.extend(extra_scrcpy_args)
-
-    return cmd
-
 def _parse_scrcpy_output_for_display_id(scrcpy_process, timeout=20):
     """
     Reads scrcpy output to find the virtual display ID.
@@ -186,7 +49,7 @@ def _parse_scrcpy_output_for_display_id(scrcpy_process, timeout=20):
 
     return None
 
-def _alternate_launch_background_task(scrcpy_process, device_id, config_values, windowing_mode, session_type, startupinfo, original_post_cmds):
+def _alternate_launch_background_task(scrcpy_process, device_id, config_values, windowing_mode, session_type, lifecycle):
     """
     Background task to monitor scrcpy output for display ID and then launch the app via ADB.
     This also handles the remaining scrcpy process lifecycle.
@@ -197,6 +60,7 @@ def _alternate_launch_background_task(scrcpy_process, device_id, config_values,
         if display_id is None:
             print("Error: Could not find virtual display ID from scrcpy output for alternate launch. App will not be launched.")
             scrcpy_process.terminate()
+            remove_active_scrcpy_session(scrcpy_process.pid)
             return
 
         if session_type in ['app', 'app_alt_launch']:
@@ -225,27 +89,30 @@ def _alternate_launch_background_task(scrcpy_process, device_id, config_values,
                 for line in scrcpy_process.stdout:
                     # Log this output for debugging, it's not normal Scrcpy output
                     print(f"Scrcpy stdout (remainder): {line.strip()}")
+                    if _DISCONNECT_PATTERN.search(line):
+                        lifecycle['disconnected'] = True
+                        lifecycle['session_log'].append(f"[scrcpy] {line.strip()}")
             except (IOError, ValueError): # Occurs if stream is closed unexpectedly
                 pass
         
     # Wait for scrcpy process to finish (and run POST commands if any)
-    _wait_for_scrcpy_and_post_cmds(scrcpy_process, original_post_cmds, startupinfo)
+    _wait_for_scrcpy_and_post_cmds(scrcpy_process, lifecycle)
 
 
-def _wait_for_scrcpy_and_post_cmds(scrcpy_process, post_cmds, startupinfo):
-    """Waits for the scrcpy process to finish and then runs POST commands."""
-    scrcpy_process.wait()
+def _wait_for_scrcpy_and_post_cmds(scrcpy_process, lifecycle):
+    """Waits for the scrcpy process to finish and then runs POST commands (or hands over to the supervisor)."""
+    returncode = scrcpy_process.wait()
 
     # Clean up the session from the active list once it has ended
     remove_active_scrcpy_session(scrcpy_process.pid)
 
-    env = get_clean_env()
-    for post_cmd_str in post_cmds:
-        try:
-            post_cmd = shlex.split(post_cmd_str)
-            subprocess.run(post_cmd, check=True, startupinfo=startupinfo, env=env)
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pass # Errors are not critical here
+    # A supervised session that died abnormally is relaunched; POST runs only when it really ends
+    relaunch = lifecycle.get('relaunch')
+    if relaunch and relaunch(scrcpy_process.pid, returncode, lifecycle.get('disconnected', False)):
+        return
+
+    if lifecycle['post_hooks']:
+        run_hooks(lifecycle['post_hooks'], lifecycle['hook_env'], lifecycle['startupinfo'], lifecycle['session_log'], lifecycle['on_hook_failure'])
 
 
 def _run_adb_home_command(device_id, startupinfo):
@@ -260,14 +127,76 @@ def _run_adb_home_command(device_id, startupinfo):
     except (subprocess.SubprocessError, FileNotFoundError):
         pass # Not critical if it fails
 
-def launch_scrcpy(config_values, capture_output=False, window_title=None, device_id=None, icon_path=None, session_type='app', perform_alternate_app_launch=False):
+# --- Session supervisor (opt-in por perfil via CONF_AUTO_RESTART) ---
+SUPERVISOR_BACKOFF_BASE = 1.0
+SUPERVISOR_BACKOFF_MAX = 30.0
+SUPERVISOR_STABLE_UPTIME = 60.0     # A session that ran this long resets the backoff
+SUPERVISOR_CRASH_LOOP_WINDOW = 120.0
+SUPERVISOR_CRASH_LOOP_MAX = 5       # Restarts inside the window before giving up
+
+_DISCONNECT_PATTERN = re.compile(r'Device disconnected|ERROR: .*(disconnect|connection|Server)', re.IGNORECASE)
+_user_terminated_pids = set()
+
+def _supervise_exit(supervisor, pid, returncode, disconnected, uptime, session_log, relaunch_kwargs):
+    """
+    Decides whether a supervised session must be relaunched and does it (with backoff).
+    Returns True if a new session took over, False if the session really ended.
+    """
+    if pid in _user_terminated_pids:
+        _user_terminated_pids.discard(pid)
+        return False
+    if returncode == 0 and not disconnected:
+        return False
+
+    now = time.monotonic()
+    if uptime >= SUPERVISOR_STABLE_UPTIME:
+        supervisor['failures'] = 0
+    supervisor['restarts'] = [t for t in supervisor['restarts'] if now - t < SUPERVISOR_CRASH_LOOP_WINDOW]
+    if len(supervisor['restarts']) >= SUPERVISOR_CRASH_LOOP_MAX:
+        message = (f"[SUPERVISOR] crash loop: {len(supervisor['restarts'])} restarts in "
+                   f"{SUPERVISOR_CRASH_LOOP_WINDOW:.0f}s, giving up (exit code {returncode})")
+        session_log.append(message)
+        print(message)
+        return False
+
+    delay = min(SUPERVISOR_BACKOFF_BASE * (2 ** supervisor['failures']), SUPERVISOR_BACKOFF_MAX)
+    supervisor['failures'] += 1
+    supervisor['restarts'].append(now)
+    message = f"[SUPERVISOR] session exited abnormally (exit code {returncode}), restarting in {delay:.0f}s"
+    session_log.append(message)
+    print(message)
+    time.sleep(delay)
+
+    device_id = relaunch_kwargs['device_id']
+    if device_id and ':' in device_id:
+        # Wi-Fi blip: bring the adb transport back before scrcpy tries
+        utils.adb_handler.connect_wifi(device_id)
+
+    try:
+        new_process = launch_scrcpy(**relaunch_kwargs)
+    except Exception as e:
+        session_log.append(f"[SUPERVISOR] relaunch failed: {e}")
+        print(f"Supervisor relaunch failed: {e}")
+        return False
+
+    add_active_scrcpy_session(new_process.pid, relaunch_kwargs['window_title'], new_process.args,
+                              relaunch_kwargs['icon_path'], relaunch_kwargs['session_type'])
+    session_log.append(f"[SUPERVISOR] relaunched as PID {new_process.pid}")
+    return True
+
+def launch_scrcpy(config_values, capture_output=False, window_title=None, device_id=None, icon_path=None, session_type='app', perform_alternate_app_launch=False, on_hook_failure=None, window_rect=None, _supervisor=None):
     """
     Inicia o scrcpy com base na configuração fornecida, lidando com comandos PRE e POST.
     Se `perform_alternate_app_launch` for True, Scrcpy será iniciado sem --start-app,
     e o aplicativo será lançado posteriormente via ADB após a detecção do display virtual.
+    `on_hook_failure(HookResult)` é chamado (em outra thread) para cada PRE/POST que falhar.
+    Com CONF_AUTO_RESTART no perfil, a sessão é supervisionada e relançada se cair.
+    `window_rect` (x, y, largura, altura) posiciona a janela (ex.: um bloco do lançamento de pasta).
     """
-    extra_args_str = config_values.get('extraargs', '')
-    parsed_args = _parse_extra_args(extra_args_str)
+    # Compiled (and validated) once per distinct configuration; raises LaunchSpecError before anything runs
+    start = time.perf_counter()
+    spec = compile_launch_spec(config_values)
+    _record_first_launch(device_id, (time.perf_counter() - start) * 1000)
 
     startupinfo = _get_startupinfo()
 
@@ -276,28 +205,27 @@ def launch_scrcpy(config_values, capture_output=False, window_title=None, device
         # Run this in a separate thread to not block scrcpy launch
         threading.Thread(target=_run_adb_home_command, args=(device_id, startupinfo)).start()
 
-    # Executar comandos PRE
-    for pre_cmd_str in parsed_args['prepend']:
-        try:
-            pre_cmd = shlex.split(pre_cmd_str)
-            subprocess.run(pre_cmd, check=True, startupinfo=startupinfo, env=env)
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pass # Not critical
+    # Hooks see the same exported variables as scrcpy
+    hook_env = get_clean_env()
+    for var_name, var_value in spec.env_vars:
+        hook_env[var_name] = var_value
+
+    # Executar comandos PRE (paralelos por estágio; os marcados com '&' não bloqueiam o scrcpy)
+    # A relaunched session keeps appending to the log of the session it replaces
+    session_log = _supervisor['session_log'] if _supervisor is not None else SessionLog()
+    if spec.prepend_cmds:
+        run_hooks(spec.prepend_cmds, hook_env, startupinfo, session_log, on_hook_failure)
 
     # Determine if --start-app should be suppressed for alternate launch
     force_no_start_app = perform_alternate_app_launch
     
     # Construir e executar o comando scrcpy
-    cmd = _build_command(config_values, parsed_args['scrcpy'], window_title, device_id, force_no_start_app=force_no_start_app)
+    cmd = spec.build_argv(device_id, window_title, force_no_start_app=force_no_start_app, window_rect=window_rect)
     
-    env = get_clean_env()
+    env = hook_env.copy()
     if icon_path and os.path.exists(icon_path):
         env['SCRCPY_ICON_PATH'] = icon_path
 
-    # Apply environment variables from extraargs
-    for var_name, var_value in parsed_args['env_vars'].items():
-        env[var_name] = var_value
-
     # Always capture output if alternate app launch is requested or explicitly asked for
     actual_capture_output = capture_output or perform_alternate_app_launch
 
@@ -305,6 +233,27 @@ def launch_scrcpy(config_values, capture_output=False, window_title=None, device
         scrcpy_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, startupinfo=startupinfo, env=env)
     else:
         scrcpy_process = subprocess.Popen(cmd, startupinfo=startupinfo, env=env)
+    _register_session_log(scrcpy_process.pid, session_log)
+
+    lifecycle = {
+        'post_hooks': spec.append_cmds, 'startupinfo': startupinfo, 'hook_env': hook_env,
+        'session_log': session_log, 'on_hook_failure': on_hook_failure, 'disconnected': False, 'relaunch': None,
+    }
+    if _supervisor is None and config_values.get(CONF_AUTO_RESTART):
+        _supervisor = {'restarts': [], 'failures': 0, 'session_log': session_log}
+    if _supervisor is not None:
+        started_at = time.monotonic()
+        relaunch_config = dict(config_values)
+        relaunch_config.setdefault('package_name_for_alt_launch', config_values.get('package_name'))
+        relaunch_kwargs = dict(
+            config_values=relaunch_config, capture_output=capture_output, window_title=window_title,
+            device_id=device_id, icon_path=icon_path, session_type=session_type,
+            # The GUI starts winlator/alt sessions on the new display itself; a relaunch has to do it here
+            perform_alternate_app_launch=perform_alternate_app_launch or session_type in ('winlator', 'app_alt_launch'),
+            on_hook_failure=on_hook_failure, window_rect=window_rect, _supervisor=_supervisor,
+        )
+        lifecycle['relaunch'] = lambda pid, returncode, disconnected: _supervise_exit(
+            _supervisor, pid, returncode, disconnected, time.monotonic() - started_at, session_log, relaunch_kwargs)
 
     # If alternate app launch is requested, start a background task to handle it
     if perform_alternate_app_launch:
@@ -313,7 +262,7 @@ def launch_scrcpy(config_values, capture_output=False, window_title=None, device
 
         alt_launch_thread = threading.Thread(
             target=_alternate_launch_background_task,
-            args=(scrcpy_process, device_id, config_values, windowing_mode_int, session_type, startupinfo, parsed_args['append'])
+            args=(scrcpy_process, device_id, config_values, windowing_mode_int, session_type, lifecycle)
         )
         alt_launch_thread.daemon = True
         alt_launch_thread.start()
@@ -321,7 +270,7 @@ def launch_scrcpy(config_values, capture_output=False, window_title=None, device
         # Normal POST command waiting
         wait_thread = threading.Thread(
             target=_wait_for_scrcpy_and_post_cmds,
-            args=(scrcpy_process, parsed_args['append'], startupinfo)
+            args=(scrcpy_process, lifecycle)
         )
         wait_thread.daemon = True # Allows main program to exit even if this thread is running
         wait_thread.start()
@@ -420,6 +369,48 @@ def list_encoders(device_id=None, timeout=15):
 
 # Global list to store active scrcpy session information
 _active_scrcpy_sessions_data = []
+_sessions_lock = threading.RLock()
+
+# Registry events: listeners get (event, session) on the thread that changed the registry, in order
+# (they run under the registry lock, so they must only hand the event over, e.g. emit a Qt signal)
+SESSION_ADDED = 'added'
+SESSION_EXITED = 'exited'
+_session_listeners = []
+
+# Hook output per scrcpy PID; kept after the session ends so POST output can still be read
+_MAX_SESSION_LOGS = 50
+_session_logs = {}
+
+def _register_session_log(pid, session_log):
+    _session_logs[pid] = session_log
+    while len(_session_logs) > _MAX_SESSION_LOGS:
+        _session_logs.pop(next(iter(_session_logs)))
+
+def get_session_log(pid):
+    """Returns the PRE/POST hook output recorded for the session, as a list of lines."""
+    session_log = _session_logs.get(pid)
+    return session_log.lines() if session_log else []
+
+def add_session_listener(callback):
+    """
+    Calls callback(event, session) for every SESSION_ADDED / SESSION_EXITED from now on.
+    Returns the sessions registered at that moment, so the caller starts from a consistent snapshot.
+    """
+    with _sessions_lock:
+        _session_listeners.append(callback)
+        return list(_active_scrcpy_sessions_data)
+
+def remove_session_listener(callback):
+    with _sessions_lock:
+        if callback in _session_listeners:
+            _session_listeners.remove(callback)
+
+def _notify_session_listeners(event, session):
+    for callback in list(_session_listeners):
+        try:
+            callback(event, session)
+        except Exception as e:
+            print(f"Error in session listener: {e}")
 
 def add_active_scrcpy_session(pid, app_name, command_args, icon_path, session_type):
     """Adds a new active scrcpy session to the global list."""
@@ -430,12 +421,29 @@ def add_active_scrcpy_session(pid, app_name, command_args, icon_path, session_ty
         'icon_path': icon_path,
         'session_type': session_type
     }
-    _active_scrcpy_sessions_data.append(session_info)
+    with _sessions_lock:
+        # The wait thread may already have reaped a session that died right away; it must not linger
+        if not psutil.pid_exists(pid):
+            return
+        _active_scrcpy_sessions_data.append(session_info)
+        _notify_session_listeners(SESSION_ADDED, session_info)
 
 def remove_active_scrcpy_session(pid):
     """Removes an active scrcpy session from the global list by PID."""
     global _active_scrcpy_sessions_data
-    _active_scrcpy_sessions_data = [s for s in _active_scrcpy_sessions_data if s['pid'] != pid]
+    with _sessions_lock:
+        removed = [s for s in _active_scrcpy_sessions_data if s['pid'] == pid]
+        if not removed:
+            return
+        _active_scrcpy_sessions_data = [s for s in _active_scrcpy_sessions_data if s['pid'] != pid]
+        for session_info in removed:
+            _notify_session_listeners(SESSION_EXITED, session_info)
+
+def has_active_scrcpy_sessions():
+    """Cheap check (pid existence only) used to pause background work while streaming."""
+    with _sessions_lock:
+        pids = [s['pid'] for s in _active_scrcpy_sessions_data]
+    return any(psutil.pid_exists(pid) for pid in pids)
 
 def get_active_scrcpy_sessions():
     """
@@ -445,7 +453,10 @@ def get_active_scrcpy_sessions():
     sessions = []
     pids_to_remove = []
 
-    for session_info in _active_scrcpy_sessions_data:
+    with _sessions_lock:
+        registered = list(_active_scrcpy_sessions_data)
+
+    for session_info in registered:
         pid = session_info['pid']
         try:
             proc = psutil.Process(pid)
@@ -470,6 +481,7 @@ def kill_scrcpy_session(pid):
     Terminates a scrcpy process given its PID.
     Returns True if successful, False otherwise.
     """
+    _user_terminated_pids.add(pid) # Not a crash: the supervisor must not bring it back
     try:
         process = psutil.Process(pid)
         process.terminate()  # or process.kill()
@@ -514,4 +526,54 @@ def list_displays(device_id=None, timeout=10):
                 displays.append({'id': int(display_id), 'size': size})
         return displays
     except (subprocess.SubprocessError, FileNotFoundError):
-        return []
\ No newline at end of file
+        return []
+
+
+# --- Warm standby (pre-stage executado após conectar o dispositivo) ---
+_warm_standby_stats = {}
+
+def warm_standby(device_id):
+    """
+    Pre-stage de lançamento, para rodar ocioso depois que a configuração do dispositivo carregou:
+    aquece o transporte adb e lê uma vez as flags do `scrcpy --help` usadas na validação do LaunchSpec,
+    tirando essa leitura do primeiro lançamento. O scrcpy envia (e apaga) o próprio servidor a cada
+    início, então não há nada a pré-enviar. Retorna (e guarda) os tempos medidos.
+    """
+    stats = {'state': 'offline', 'cold_rtt_ms': 0.0, 'warm_rtt_ms': 0.0, 'help_parse_ms': 0.0,
+             'first_launch_spec_ms': None, 'saved_ms': None}
+
+    start = time.perf_counter()
+    if not utils.adb_handler.ping_device(device_id):
+        _warm_standby_stats[device_id] = stats
+        return stats
+    stats['state'] = 'online'
+    stats['cold_rtt_ms'] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    utils.adb_handler.ping_device(device_id)
+    stats['warm_rtt_ms'] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    get_supported_flags()
+    stats['help_parse_ms'] = (time.perf_counter() - start) * 1000
+
+    _warm_standby_stats[device_id] = stats
+    print(f"Warm standby for {device_id}: adb round trip cold/warm {stats['cold_rtt_ms']:.0f}/"
+          f"{stats['warm_rtt_ms']:.0f} ms, scrcpy --help {stats['help_parse_ms']:.0f} ms")
+    return stats
+
+def _record_first_launch(device_id, spec_ms):
+    """
+    Mede o que o warm standby poupou: o primeiro lançamento depois dele compila o LaunchSpec sem ler
+    o `scrcpy --help`, então a economia é a leitura feita no pre-stage menos o que o lançamento ainda
+    gastou. Sem warm standby só o tempo do primeiro lançamento é registrado (a base de comparação).
+    """
+    stats = _warm_standby_stats.setdefault(device_id, {'state': 'disabled', 'first_launch_spec_ms': None})
+    if stats.get('first_launch_spec_ms') is not None:
+        return
+    stats['first_launch_spec_ms'] = spec_ms
+    if stats['state'] == 'online':
+        stats['saved_ms'] = max(0.0, stats['help_parse_ms'] - spec_ms)
+        print(f"Warm standby for {device_id}: first launch spec {spec_ms:.0f} ms, saved {stats['saved_ms']:.0f} ms")
+    else:
+        print(f"First launch for {device_id} without warm standby: spec {spec_ms:.0f} ms")
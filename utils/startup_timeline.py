@@ -0,0 +1,33 @@
+# FILE: utils/startup_timeline.py
+# PURPOSE: Linha do tempo da inicialização: marcos com o tempo decorrido desde o início do
+#          processo, impressos em um relatório quando a janela fica interativa.
+
+import time
+import threading
+
+_origin = time.perf_counter()
+_lock = threading.Lock()
+_marks = []  # (seconds since origin, label)
+_reported = False
+
+
+def mark(label):
+    """Records a startup milestone. Marks after the report was printed are ignored."""
+    with _lock:
+        if not _reported:
+            _marks.append((time.perf_counter() - _origin, label))
+
+def report():
+    """Prints the timeline once (total and delta per step) and returns it as [(label, ms)]."""
+    global _reported
+    with _lock:
+        if _reported:
+            return []
+        _reported = True
+        marks = list(_marks)
+    print("[Startup] timeline:")
+    previous = 0.0
+    for elapsed, label in marks:
+        print(f"[Startup] {elapsed * 1000:8.1f} ms  (+{(elapsed - previous) * 1000:7.1f})  {label}")
+        previous = elapsed
+    return [(label, round(elapsed * 1000, 1)) for elapsed, label in marks]
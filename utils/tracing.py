@@ -0,0 +1,75 @@
+# FILE: utils/tracing.py
+# PURPOSE: Rastreamento leve de desempenho: spans (context manager) com timestamps monotônicos em
+#          um buffer circular, exportáveis como JSON do Chrome trace (chrome://tracing / Perfetto).
+#          Usado para medir cada etapa da busca até o quadro seguinte da grade. Desligado por padrão:
+#          só grava com `--trace` (ou no benchmark), para não guardar nada numa sessão normal.
+
+import os
+import json
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+RING_SIZE = 8192
+
+_origin_ns = time.perf_counter_ns()
+_lock = threading.Lock()
+_events = deque(maxlen=RING_SIZE)  # Chrome trace events, oldest dropped first
+_enabled = False
+
+
+def now():
+    """Monotonic timestamp (ns) to pass to record() for spans that end in another callback."""
+    return time.perf_counter_ns()
+
+def set_enabled(enabled):
+    global _enabled
+    _enabled = enabled
+
+def is_enabled():
+    return _enabled
+
+def record(name, start_ns, end_ns=None, **args):
+    """Adds a complete span measured by the caller (e.g. from a keystroke to the next frame)."""
+    if not _enabled:
+        return
+    end_ns = now() if end_ns is None else end_ns
+    event = {'name': name, 'ph': 'X', 'ts': (start_ns - _origin_ns) / 1000,
+             'dur': (end_ns - start_ns) / 1000, 'pid': os.getpid(), 'tid': threading.get_ident()}
+    if args:
+        event['args'] = args
+    with _lock:
+        _events.append(event)
+
+@contextmanager
+def span(name, **args):
+    """Times the enclosed block: `with tracing.span('apps.filter', apps=n): ...`."""
+    if not _enabled:
+        yield
+        return
+    start_ns = now()
+    try:
+        yield
+    finally:
+        record(name, start_ns, **args)
+
+
+def events(name=None):
+    with _lock:
+        return [event for event in _events if name is None or event['name'] == name]
+
+def durations_ms(name):
+    """Durations of the recorded spans with this name, oldest first."""
+    return [event['dur'] / 1000 for event in events(name) if event['ph'] == 'X']
+
+def clear():
+    with _lock:
+        _events.clear()
+
+def dump_chrome_trace(path):
+    """Writes the ring buffer as a Chrome trace file. Returns how many events were written."""
+    trace_events = events()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, f)
+    return len(trace_events)
@@ -0,0 +1,59 @@
+# FILE: utils/translations.py
+# PURPOSE: Catálogo de traduções compilado: um dicionário plano por idioma, com o fallback em inglês
+#          já mesclado, para que cada tradução seja uma única consulta. Usado pela GUI e pelo servidor web.
+
+import threading
+from .constants import TRANSLATIONS
+
+FALLBACK_LANGUAGE = 'en'
+
+_lock = threading.Lock()
+_catalogs = {}  # lang -> {(section, item, sub_key or None): (text, is_template)}
+
+
+def _flatten(language_data):
+    flat = {}
+    for section, items in language_data.items():
+        for item, value in items.items():
+            entries = value.items() if isinstance(value, dict) else ((None, value),)
+            for sub_key, text in entries:
+                # Only texts with braces go through str.format (which also unescapes '{{')
+                flat[(section, item, sub_key)] = (text, '{' in text or '}' in text)
+    return flat
+
+def catalog(lang):
+    """The compiled catalog for a language (English entries fill its gaps; unknown languages get English)."""
+    compiled = _catalogs.get(lang)
+    if compiled is None:
+        with _lock:
+            compiled = _catalogs.get(lang)
+            if compiled is None:
+                compiled = dict(_catalogs.get(FALLBACK_LANGUAGE) or _flatten(TRANSLATIONS[FALLBACK_LANGUAGE]))
+                if lang != FALLBACK_LANGUAGE and lang in TRANSLATIONS:
+                    compiled.update(_flatten(TRANSLATIONS[lang]))
+                _catalogs[lang] = compiled
+    return compiled
+
+def translate(lang, section, item, key=None, **kwargs):
+    """Translated text for section/item (and nested key), formatted with kwargs when it has fields."""
+    compiled = _catalogs.get(lang) or catalog(lang)
+    entry = compiled.get((section, item, key))
+    if entry is None and key is not None:
+        # Plain templates may also use a {key} field (e.g. api.key_event_sent)
+        entry = compiled.get((section, item, None))
+        if entry is None:
+            return f"[{section}.{item}.{key}]"
+        kwargs['key'] = key
+    if entry is None:
+        return f"[{section}.{item}]"
+    text, is_template = entry
+    if kwargs and is_template:
+        return text.format(**kwargs)
+    return text
+
+def clear_cache():
+    with _lock:
+        _catalogs.clear()
+
+
+catalog(FALLBACK_LANGUAGE)
@@ -0,0 +1,209 @@
+# FILE: utils/window_manager.py
+# PURPOSE: Gerencia as janelas do scrcpy no X11 (python-xlib), sem chamar o wmctrl: acha a janela
+#          de cada PID pelo _NET_WM_PID (com cache), foca, traz para frente, organiza em grade e move
+#          para outro monitor. Usa EWMH quando há um gerenciador de janelas e X puro quando não há
+#          (ex.: Xvfb), então funciona nos dois casos.
+
+import os
+import math
+import threading
+
+try:
+    from Xlib import X, Xatom, error as xerror, display as xdisplay
+    from Xlib.protocol import event as xevent
+except ImportError:  # python-xlib is optional; without it (or without X11) callers fall back to wmctrl
+    xdisplay = None
+
+_lock = threading.RLock()
+_display = None
+_connect_failed = False
+_window_by_pid = {}  # pid -> X window id
+
+# _NET_MOVERESIZE_WINDOW flags: NorthWest gravity, x/y/width/height present, source = pager
+_MOVERESIZE_FLAGS = 1 | (0xF << 8) | (2 << 12)
+_SOURCE_PAGER = 2
+_STATE_REMOVE = 0
+
+
+def _get_display():
+    """The module's X connection, opened once. None when X11 or python-xlib is not available."""
+    global _display, _connect_failed
+    if _display is None and not _connect_failed:
+        if xdisplay is None or not os.environ.get('DISPLAY'):
+            _connect_failed = True
+            return None
+        try:
+            _display = xdisplay.Display()
+        except Exception as e:
+            print(f"Window manager: could not connect to X ({e}), falling back to wmctrl")
+            _connect_failed = True
+    return _display
+
+def _atom(name):
+    return _display.intern_atom(name)
+
+def _property(window, name, prop_type):
+    try:
+        prop = window.get_full_property(_atom(name), prop_type)
+    except (xerror.BadWindow, xerror.BadMatch):
+        return None
+    return list(prop.value) if prop is not None else None
+
+def _window_pid(window):
+    value = _property(window, '_NET_WM_PID', Xatom.CARDINAL)
+    return value[0] if value else None
+
+def _top_level_windows():
+    root = _display.screen().root
+    client_list = _property(root, '_NET_CLIENT_LIST', Xatom.WINDOW)
+    if client_list is not None:
+        return [_display.create_resource_object('window', wid) for wid in client_list]
+    # No EWMH window manager (e.g. Xvfb): the clients are the root's children
+    return root.query_tree().children
+
+def _wm_supports(name):
+    supported = _property(_display.screen().root, '_NET_SUPPORTED', Xatom.ATOM)
+    return bool(supported) and _atom(name) in supported
+
+def _send_wm_message(window, name, data):
+    root = _display.screen().root
+    message = xevent.ClientMessage(window=window, client_type=_atom(name), data=(32, (list(data) + [0] * 5)[:5]))
+    root.send_event(message, event_mask=X.SubstructureRedirectMask | X.SubstructureNotifyMask)
+
+
+def is_available():
+    with _lock:
+        return _get_display() is not None
+
+def window_for_pid(pid):
+    """X window of the session's process, from the cache when it still belongs to that PID."""
+    with _lock:
+        if _get_display() is None:
+            return None
+        wid = _window_by_pid.get(pid)
+        if wid is not None and _window_pid(_display.create_resource_object('window', wid)) == pid:
+            return wid
+        # One pass over the top-level windows refreshes every PID it finds
+        _window_by_pid.pop(pid, None)
+        for window in _top_level_windows():
+            window_pid = _window_pid(window)
+            if window_pid is not None:
+                _window_by_pid.setdefault(window_pid, window.id)
+        return _window_by_pid.get(pid)
+
+def forget(pid):
+    """Drops the cached window of a session that ended."""
+    with _lock:
+        _window_by_pid.pop(pid, None)
+
+def _window(pid):
+    wid = window_for_pid(pid)
+    return _display.create_resource_object('window', wid) if wid is not None else None
+
+def raise_window(pid):
+    with _lock:
+        window = _window(pid)
+        if window is None:
+            return False
+        window.map()
+        window.configure(stack_mode=X.Above)
+        _display.flush()
+        return True
+
+def focus(pid):
+    """Raises the session's window and gives it the input focus. Returns False if it was not found."""
+    with _lock:
+        window = _window(pid)
+        if window is None:
+            return False
+        if _wm_supports('_NET_ACTIVE_WINDOW'):
+            _send_wm_message(window, '_NET_ACTIVE_WINDOW', [_SOURCE_PAGER, X.CurrentTime])
+        else:
+            window.map()
+            window.configure(stack_mode=X.Above)
+            window.set_input_focus(X.RevertToParent, X.CurrentTime)
+        _display.flush()
+        return True
+
+def monitors():
+    """Usable area (x, y, width, height) of each monitor, without the panels when the WM reports them."""
+    with _lock:
+        if _get_display() is None:
+            return []
+        screen = _display.screen()
+        areas = []
+        if _display.has_extension('RANDR'):
+            try:
+                for monitor in screen.root.xrandr_get_monitors().monitors:
+                    areas.append((monitor.x, monitor.y, monitor.width_in_pixels, monitor.height_in_pixels))
+            except Exception:
+                areas = []  # RandR < 1.5
+        if not areas:
+            areas = [(0, 0, screen.width_in_pixels, screen.height_in_pixels)]
+
+        workarea = _property(screen.root, '_NET_WORKAREA', Xatom.CARDINAL)
+        if workarea and len(workarea) >= 4:
+            wx, wy, ww, wh = workarea[:4]
+            clipped = []
+            for x, y, w, h in areas:
+                left, top = max(x, wx), max(y, wy)
+                right, bottom = min(x + w, wx + ww), min(y + h, wy + wh)
+                clipped.append((left, top, right - left, bottom - top) if right > left and bottom > top else (x, y, w, h))
+            areas = clipped
+        return areas
+
+def tile_rects(count, area):
+    """Splits area into a near-square grid of count cells (row by row), e.g. 2x2 for 4, 3x3 for 7-9."""
+    if count <= 0:
+        return []
+    x, y, width, height = area
+    columns = math.ceil(math.sqrt(count))
+    rows = math.ceil(count / columns)
+    cell_width, cell_height = width // columns, height // rows
+    return [(x + (i % columns) * cell_width, y + (i // columns) * cell_height, cell_width, cell_height)
+            for i in range(count)]
+
+def _frame_extents(window):
+    """Decoration sizes (left, right, top, bottom) the WM adds around the window."""
+    extents = _property(window, '_NET_FRAME_EXTENTS', Xatom.CARDINAL)
+    return tuple(extents[:4]) if extents and len(extents) >= 4 else (0, 0, 0, 0)
+
+def _place(window, rect):
+    """Moves/resizes window so that its frame fills rect (leaves maximized/fullscreen first)."""
+    x, y, width, height = rect
+    left, right, top, bottom = _frame_extents(window)
+    width, height = max(1, width - left - right), max(1, height - top - bottom)
+    if _wm_supports('_NET_MOVERESIZE_WINDOW'):
+        _send_wm_message(window, '_NET_WM_STATE', [_STATE_REMOVE, _atom('_NET_WM_STATE_MAXIMIZED_VERT'),
+                                                   _atom('_NET_WM_STATE_MAXIMIZED_HORZ'), _SOURCE_PAGER])
+        _send_wm_message(window, '_NET_WM_STATE', [_STATE_REMOVE, _atom('_NET_WM_STATE_FULLSCREEN'), 0, _SOURCE_PAGER])
+        _send_wm_message(window, '_NET_MOVERESIZE_WINDOW', [_MOVERESIZE_FLAGS, x, y, width, height])
+    else:
+        window.configure(x=x + left, y=y + top, width=width, height=height)
+
+def tile(pids, monitor=0):
+    """Lays the sessions' windows out in a grid on a monitor. Returns how many windows were placed."""
+    with _lock:
+        areas = monitors()
+        if not areas:
+            return 0
+        windows = [window for window in (_window(pid) for pid in pids) if window is not None]
+        for window, rect in zip(windows, tile_rects(len(windows), areas[min(monitor, len(areas) - 1)])):
+            _place(window, rect)
+        _display.flush()
+        return len(windows)
+
+def move_to_monitor(pid, monitor):
+    """Centers the session's window on another monitor, keeping its size when it fits."""
+    with _lock:
+        areas = monitors()
+        window = _window(pid) if areas else None
+        if window is None:
+            return False
+        geometry = window.get_geometry()
+        left, right, top, bottom = _frame_extents(window)
+        mx, my, mw, mh = areas[min(monitor, len(areas) - 1)]
+        width, height = min(geometry.width + left + right, mw), min(geometry.height + top + bottom, mh)
+        _place(window, (mx + (mw - width) // 2, my + (mh - height) // 2, width, height))
+        _display.flush()
+        return True
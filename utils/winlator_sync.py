@@ -0,0 +1,56 @@
+# FILE: utils/winlator_sync.py
+# PURPOSE: Sincronização incremental da biblioteca Winlator: compara (mtime, tamanho, hash) de cada
+#          atalho com o cache e só lê do dispositivo o que é novo ou mudou, devolvendo os deltas.
+
+from dataclasses import dataclass, field
+from . import adb_handler
+
+
+@dataclass
+class WinlatorSyncResult:
+    """Full, name-sorted record list plus what changed relative to the cached records."""
+    records: list
+    added: list = field(default_factory=list)
+    updated: list = field(default_factory=list)
+    removed: list = field(default_factory=list)  # shortcut paths
+    fingerprints_changed: bool = False  # mtime/size moved without a content change (cache must be saved)
+
+    @property
+    def changed(self):
+        return bool(self.added or self.updated or self.removed)
+
+
+def _needs_read(cached, stat):
+    return cached is None or 'hash' not in cached or (cached.get('mtime'), cached.get('size')) != stat
+
+def sync_winlator_library(device_id, cached_records=None, timeout=30):
+    """
+    Synchronizes the cached shortcut records with the device. An unchanged library costs a single
+    stat listing; only new shortcuts or ones whose (mtime, size) moved are read, and a rewritten
+    file with the same content hash is not reported as updated. Raises RuntimeError if adb fails.
+    """
+    cached = {r['path']: r for r in (cached_records or []) if r.get('path')}
+    stats = adb_handler.stat_winlator_shortcuts(device_id, timeout=timeout)
+
+    to_read = [path for path, stat in stats.items() if _needs_read(cached.get(path), stat)]
+    fresh = {r['path']: r for r in adb_handler.read_winlator_shortcuts(to_read, device_id, timeout=timeout)}
+
+    result = WinlatorSyncResult(records=[])
+    for path in stats:
+        old = cached.get(path)
+        new = fresh.get(path)
+        if new is None:
+            if old is not None:
+                result.records.append(old)
+            continue
+        if old is None:
+            result.added.append(new)
+        elif old.get('hash') != new['hash']:
+            result.updated.append(new)
+        else:
+            result.fingerprints_changed = True
+        result.records.append(new)
+
+    result.removed = [path for path in cached if path not in stats]
+    result.records.sort(key=lambda r: r['name'].lower())
+    return result
@@ -5,10 +5,11 @@ from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import Dict, Any
-from utils import adb_handler, scrcpy_handler
+from utils import adb_handler, scrcpy_handler, capability_cache, winlator_sync, icon_store
 from utils.constants import *
 from app_config import AppConfig
 import os
+import asyncio
 import json
 import shlex
 import sys
@@ -365,7 +366,9 @@ async def list_apps(device_id: str, include_system_apps: bool = False):
         for name, pkg in app_list:
             metadata = app_config.get_app_metadata(pkg)
             is_pinned = metadata.get('pinned', False)
-            all_apps.append({"name": name, "pkg_name": pkg, "icon": f"{pkg}.png", "pinned": is_pinned})
+            icon_path = icon_store.resolve_app_icon(app_config, pkg, metadata)
+            icon_filename = icon_store.relative_icon_path(app_config, icon_path) if icon_path else None
+            all_apps.append({"name": name, "pkg_name": pkg, "icon": icon_filename, "pinned": is_pinned})
 
         all_apps.sort(key=lambda x: x['name'].lower())
         return all_apps
@@ -379,15 +382,21 @@ async def list_apps(device_id: str, include_system_apps: bool = False):
 async def list_winlator_apps(device_id: str):
     """Lists Winlator shortcuts found on the device."""
     try:
-        shortcuts = adb_handler.list_winlator_shortcuts_with_names(device_id)
-        if not shortcuts:
+        app_config = get_config_for_device(device_id)
+        cache = app_config.get_app_list_cache()
+        sync_result = await asyncio.to_thread(winlator_sync.sync_winlator_library, device_id, cache.get('winlator_games', []))
+        if sync_result.changed or sync_result.fingerprints_changed:
+            cache['winlator_games'] = sync_result.records
+            app_config.save_app_list_cache(cache)
+        records = sync_result.records
+        if not records:
             return []
 
         games = []
-        for name, path in shortcuts:
-            pkg = adb_handler.get_package_name_from_shortcut(path, device_id)
-            icon_filename = f"{os.path.basename(path)}.png"
-            games.append({"name": name, "path": path, "pkg": pkg, "icon": icon_filename})
+        for record in records:
+            icon_path = icon_store.resolve_winlator_icon(app_config, record['path'])
+            icon_filename = icon_store.relative_icon_path(app_config, icon_path) if icon_path else None
+            games.append({"name": record['name'], "path": record['path'], "pkg": record['pkg'], "icon": icon_filename})
 
         return sorted(games, key=lambda x: x['name'].lower())
     except Exception as e:
@@ -413,8 +422,7 @@ async def launch_app(request: LaunchRequest):
         if request.never_turn_screen_off:
             config_to_use['turn_screen_off'] = False
 
-        icon_cache_dir = app_config.get_icon_cache_dir()
-        icon_path = os.path.join(icon_cache_dir, f"{request.pkg_name}.png")
+        icon_path = icon_store.resolve_app_icon(app_config, request.pkg_name)
 
         process = scrcpy_handler.launch_scrcpy(
             config_values=config_to_use,
@@ -433,6 +441,8 @@ async def launch_app(request: LaunchRequest):
             session_type='app'
         )
         return {"status": "success", "message": app_config.tr('api', 'launch_sent', name=request.app_name), "pid": process.pid}
+    except scrcpy_handler.LaunchSpecError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.exception("Error in launch_app")
         app_config = get_config_for_device(request.device_id)
@@ -457,8 +467,7 @@ async def launch_winlator_app(request: WinlatorLaunchRequest):
         if request.never_turn_screen_off:
             config_to_use['turn_screen_off'] = False
         
-        icon_cache_dir = app_config.get_icon_cache_dir()
-        icon_path = os.path.join(icon_cache_dir, f"{os.path.basename(request.shortcut_path)}.png")
+        icon_path = icon_store.resolve_winlator_icon(app_config, request.shortcut_path)
 
         process = scrcpy_handler.launch_scrcpy(
             config_values=config_to_use,
@@ -477,6 +486,8 @@ async def launch_winlator_app(request: WinlatorLaunchRequest):
             session_type='winlator'
         )
         return {"status": "success", "message": app_config.tr('api', 'launch_sent', name=request.app_name), "pid": process.pid}
+    except scrcpy_handler.LaunchSpecError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.exception("Error in launch_winlator_app")
         app_config = get_config_for_device(request.device_id)
@@ -489,18 +500,19 @@ async def list_encoders(device_id: str = None):
             return {"video_encoders": {}, "audio_encoders": {}}
 
         app_config = get_config_for_device(device_id)
+        serial = app_config.get(CONF_DEVICE_ID) or device_id
 
-        # Use cache if available, similar to the desktop app
-        cached_data = app_config.get_encoder_cache()
-        if cached_data and cached_data.get('video'):
+        # Same capability cache as the desktop app; revalidate off the request path
+        cached_data = capability_cache.peek(app_config, serial, capability_cache.KIND_ENCODERS)
+        if cached_data:
+            capability_cache.refresh_in_background(app_config, serial, capability_cache.KIND_ENCODERS, device_id)
             return {
                 "video_encoders": cached_data.get('video', {}),
                 "audio_encoders": cached_data.get('audio', {})
             }
-        
-        # Fallback to live fetch and save to cache
-        video_encoders, audio_encoders = scrcpy_handler.list_encoders()
-        app_config.save_encoder_cache(video_encoders, audio_encoders)
+
+        # Nothing cached yet: fetch once (concurrent requests share the same scrcpy run)
+        video_encoders, audio_encoders = await asyncio.to_thread(capability_cache.get_encoders, app_config, serial, device_id)
         return {"video_encoders": video_encoders, "audio_encoders": audio_encoders}
 
     except Exception as e:
@@ -514,7 +526,7 @@ async def get_active_sessions():
         sessions = scrcpy_handler.get_active_scrcpy_sessions()
         for s in sessions:
             if s.get('icon_path'):
-                s['icon_url'] = f"/icons/{os.path.basename(s['icon_path'])}"
+                s['icon_url'] = f"/icons/{icon_store.relative_icon_path(app_config_for_path, s['icon_path'])}"
             else:
                 s['icon_url'] = None
         return sessions